@@ -17,10 +17,12 @@ except ImportError:
         return re.sub(HTML_REGEX, "", string)
 
 try:
-    from jinja2 import Environment as JinjaEnvironment, FileSystemLoader as JinjaLoader, Template as JinjaTemplate
+    from jinja2 import Environment as JinjaEnvironment, FileSystemBytecodeCache as JinjaBytecodeCache, \
+        FileSystemLoader as JinjaLoader, Template as JinjaTemplate
     JINJA_ENABLED = True
 except ImportError:
     JINJA_ENABLED = False
+    JinjaBytecodeCache = None
     JinjaEnvironment = None
     JinjaLoader = None
     JinjaTemplate = None
@@ -210,10 +210,120 @@ The file must be eligible for loading using ``import_module()`` and be free of s
 Unlike ``INIConfig`` and ``FlatConfig``, Python files used for configuration may *not* be pre-processed as Jinja
 templates. However, default values *are* supported by passing ``defaults`` dictionary as with ``FlatConfig``.
 
+Layered Configuration
+.....................
+
+``LayeredConfig`` merges defaults, any number of configuration files or directories of files (such as ``conf.d``), and
+environment variables into a single set of values:
+
+.. code-block:: python
+
+    from commonkit.config import LayeredConfig
+
+    config = LayeredConfig(
+        "etc/project.ini",
+        "etc/conf.d",
+        defaults={'project.active': True},
+        environment_prefix="PROJECT_"
+    )
+    if config.load():
+        print(config.get("project.title"))
+        print(config.get_source("project.title"))  # for example, etc/conf.d/10-local.ini
+
+Later sources take precedence over earlier ones, and ``PROJECT_PROJECT__TITLE`` would override them all. The files of a
+directory are loaded in parallel and applied in order of file name. Values are merged once, when the configuration is
+loaded, so each lookup is a single dictionary access.
+
+Caching
+.......
+
+Parsed configuration files are kept in a process-wide cache, keyed by the path, modification time, and size of the file
+(and the template context, if any). Loading a file that has not changed therefore requires only a ``stat()``. The cache
+holds up to 128 files.
+
+A changed file is parsed again automatically. To invalidate the cache explicitly:
+
+.. code-block:: python
+
+    from commonkit.config import clear_config_cache
+
+    clear_config_cache("etc/project.ini")
+    clear_config_cache()  # all files
+
+Pass ``cache=False`` to a configuration class to always read the file.
+
+Lazy Casting
+............
+
+By default, every value is cast to a Python type when the file is loaded. A service that reads only a few values from a
+large file may instead cast each value when it is first used:
+
+.. code-block:: python
+
+    config = INIConfig("etc/project.ini", lazy=True)
+    config.load()
+
+    print(config.project.release)  # cast now, and remembered
+
+Lazy casting is supported by ``INIConfig`` and ``FlatConfig``. Values are cast with ``smart_cast()``.
+
+Snapshots
+.........
+
+The cache lasts only as long as the process. For command line tools, where rendering and parsing a large configuration
+can dominate startup, the parsed values may also be saved to a snapshot file:
+
+.. code-block:: python
+
+    from commonkit.config import INIConfig
+
+    config = INIConfig("etc/project.ini", context={'env': "live"}, snapshot="/tmp/project.ini.snapshot")
+    config.load()
+
+The first load parses the file as usual and writes the snapshot. Later loads read the values from the snapshot, skipping
+Jinja and ``ConfigParser`` entirely, as long as the modification time and size of the file and the context are
+unchanged. Otherwise, the file is parsed and the snapshot is replaced. Snapshots are supported by ``INIConfig`` and
+``FlatConfig``.
+
+.. note::
+    Snapshots are pickled, so they should only be written to a location that is not writable by others. Templates that
+    are included by the configuration file are not checked for changes; remove the snapshot after changing them.
+
+Reloading a Configuration
+.........................
+
+A long-running process may pick up changes to a configuration file without a restart. ``ReloadingConfig`` wraps any of
+the configuration classes and watches the file on a background thread:
+
+.. code-block:: python
+
+    from commonkit.config import config_changed, INIConfig, ReloadingConfig
+
+    def on_change(changed=None, config=None, **kwargs):
+        print("Changed: %s" % ", ".join(changed))
+        return True, None
+
+    config_changed.connect(on_change, sender=ReloadingConfig)
+
+    config = ReloadingConfig(INIConfig, "etc/project.ini", interval=2.0)
+    print(config.project.title)
+
+When the file changes, a new configuration is loaded and, if given, passed to a ``validator`` callable. Only when both
+succeed is the new configuration swapped in, so a broken edit leaves the previous configuration in place; the reason is
+available as ``config.error``. The ``config_changed`` signal receives the names of the changed values, using
+``section.name`` for INI files.
+
+Attributes are read from the current configuration without checking the file. Use ``interval=None`` to disable the
+background thread and call ``reload()`` instead, and ``stop()`` (or a ``with`` block) to stop watching.
+
 """
 
+from .cache import *
 from .flat import *
 from .ini import *
+from .layered import *
 from .py import *
+from .reloading import *
+from .snapshots import *
 
 __version__ = "0.15.0-d"
@@ -1,6 +1,8 @@
 # Imports
 
+from collections.abc import MutableMapping
 import os
+import threading
 from ..types import smart_cast
 
 # Classes
@@ -31,20 +33,25 @@ class Base(object):
         "load",
         "relative_path_exists",
         "smart_cast",
+        "to_dict",
     ]
     """A list of names that are not allowed as variables within the configuration file. This is intended to eliminate 
     nasty surprises where attributes or methods of the configuration instance might conflict with a variable named in 
     the configuration file.
     """
 
-    def __init__(self, path):
+    def __init__(self, path, cache=True):
         """Initialize a configuration.
 
         :param path: The path to the configuration file.
         :type path: str
 
+        :param cache: Use the process-wide cache of parsed files. See :py:class:`commonkit.config.cache.ConfigCache`.
+        :type cache: bool
+
         """
         self.is_loaded = False
+        self._cache = cache
         self._error = None
         self._name = os.path.basename(os.path.splitext(path)[0])
         self._path = path
@@ -120,7 +127,8 @@ class Base(object):
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
     def smart_cast(self, key, value, section=None):
-        """Cast the value to the appropriate Python type during ``load()``.
+        """Cast the value to the appropriate Python type during ``load()``, or on first access when a configuration is
+        loaded with ``lazy=True``.
 
         :param key: The name of the variable. Not used by default.
         :type key: str
@@ -133,6 +141,15 @@ class Base(object):
         """
         return smart_cast(value)
 
+    def to_dict(self):
+        """Export the configuration values.
+
+        :rtype: dict
+        :returns: The values by name. Values that belong to a section are named ``section.name``.
+
+        """
+        raise NotImplementedError()
+
     def _disallowed_variable_names(self):
         """Get a list of variable names that may not be used.
 
@@ -141,6 +158,18 @@ class Base(object):
         """
         return self.DISALLOWED_VARIABLE_NAMES
 
+    def _get_stat(self):
+        """Get the status of the configuration file.
+
+        :rtype: os.stat_result | None
+        :returns: The result of ``os.stat()`` or ``None`` if the file does not exist.
+
+        """
+        try:
+            return os.stat(self._path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def _process_key_value_pair(self, key, value, section=None):
         """An internal callback that processes a given key/value pair.
 
@@ -157,3 +186,93 @@ class Base(object):
 
         """
         return key, self.smart_cast(key, value, section=section)
+
+
+class LazyValues(MutableMapping):
+    """A mapping of configuration values that are cast on first access.
+
+    Raw values are stored as given, and cast (once) when they are retrieved. Values that are added after initialization
+    are stored as they are.
+
+    This is not a ``dict`` subclass, so every access (including ``dict(values)``, ``{**values}``, comparison, ``pop()``,
+    and ``setdefault()``) goes through ``__getitem__()`` and returns cast values.
+
+    """
+
+    def __init__(self, cast, raw=None, values=None):
+        """Initialize the values.
+
+        :param cast: A callable that accepts the name and raw value, and returns the cast value.
+        :type cast: callable
+
+        :param raw: The raw values to be cast on access.
+        :type raw: dict
+
+        :param values: Values that have already been cast, such as defaults.
+        :type values: dict
+
+        """
+        self._cast = cast
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._values = dict(values or dict())
+
+        if raw:
+            self.update_raw(raw)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._values[key]
+            self._pending.discard(key)
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            with self._lock:
+                if key in self._pending:
+                    self._values[key] = self._cast(key, self._values[key])
+                    self._pending.discard(key)
+
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return "<%s %s values, %s pending>" % (self.__class__.__name__, len(self._values), len(self._pending))
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._values[key] = value
+            self._pending.discard(key)
+
+    def copy(self):
+        """Get a plain dictionary of the cast values.
+
+        :rtype: dict
+
+        """
+        return dict(self.items())
+
+    @property
+    def pending(self):
+        """The number of values that have not yet been cast.
+
+        :rtype: int
+
+        """
+        return len(self._pending)
+
+    def update_raw(self, raw):
+        """Add raw values to be cast on access.
+
+        :param raw: The raw values.
+        :type raw: dict
+
+        """
+        with self._lock:
+            for key, value in raw.items():
+                self._values[key] = value
+                self._pending.add(key)
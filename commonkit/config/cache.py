@@ -0,0 +1,155 @@
+# Imports
+
+from collections import OrderedDict
+import os
+import threading
+
+# Exports
+
+__all__ = (
+    "clear_config_cache",
+    "ConfigCache",
+    "CONFIG_CACHE",
+)
+
+# Classes
+
+
+class ConfigCache(object):
+    """A bounded cache of parsed configuration data.
+
+    Entries are keyed by the configuration class, the path to the file, and any options that affect parsing (such as the
+    template context). Each entry also records the modification time and size of the file, and is only returned while
+    these remain the same.
+
+    """
+
+    def __init__(self, max_size=128):
+        """Initialize the cache.
+
+        :param max_size: The maximum number of entries. The least recently used entry is removed when the cache is full.
+        :type max_size: int
+
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return "<%s %s/%s>" % (self.__class__.__name__, len(self._entries), self.max_size)
+
+    def clear(self, path=None):
+        """Remove entries from the cache.
+
+        :param path: Remove only the entries for this file.
+        :type path: str
+
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+
+            path = os.path.abspath(path)
+            for key in [key for key in self._entries if key[1] == path]:
+                del self._entries[key]
+
+    def get(self, key, stat):
+        """Get the parsed data of a file.
+
+        :param key: The key returned by ``get_key()``.
+        :type key: tuple
+
+        :param stat: The current result of ``os.stat()`` for the file.
+        :type stat: os.stat_result
+
+        :returns: The data, or ``None`` if the data is not cached or the file has changed.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            mtime, size, data = entry
+            if mtime != stat.st_mtime_ns or size != stat.st_size:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return data
+
+    @staticmethod
+    def get_key(cls, path, *options):
+        """Get the cache key for a file.
+
+        :param cls: The configuration class.
+        :type cls: type
+
+        :param path: The path to the file.
+        :type path: str
+
+        :rtype: tuple
+
+        Additional arguments are options that change the parsed result. Dictionaries (such as template context) are
+        represented by their sorted items.
+
+        """
+        _options = list()
+        for option in options:
+            if isinstance(option, dict):
+                option = repr(sorted(option.items()))
+
+            _options.append(option)
+
+        return (cls, os.path.abspath(path)) + tuple(_options)
+
+    def set(self, key, stat, data):
+        """Add the parsed data of a file.
+
+        :param key: The key returned by ``get_key()``.
+        :type key: tuple
+
+        :param stat: The result of ``os.stat()`` for the file before it was read.
+        :type stat: os.stat_result
+
+        :param data: The data to be cached.
+
+        """
+        with self._lock:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, data)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+# Constants
+
+CONFIG_CACHE = ConfigCache()
+"""The process-wide cache used by configuration classes."""
+
+# Functions
+
+
+def clear_config_cache(path=None):
+    """Invalidate the cached data of configuration files.
+
+    :param path: Remove only the data for this file. By default, the whole cache is cleared.
+    :type path: str
+
+    .. code-block:: python
+
+        from commonkit.config import clear_config_cache
+
+        clear_config_cache("etc/project.ini")
+
+    """
+    CONFIG_CACHE.clear(path)
@@ -2,8 +2,10 @@
 
 from ..files import parse_jinja_template, read_file
 from ..strings import is_variable_name
-from .base import Base
+from .base import Base, LazyValues
+from .cache import CONFIG_CACHE
 from .exceptions import VariableNameNotAllowed
+from .snapshots import get_snapshot_header, read_snapshot, write_snapshot
 
 # Exports
 
@@ -26,7 +28,7 @@ class FlatConfig(Base):
 
     """
 
-    def __init__(self, path, context=None, defaults=None):
+    def __init__(self, path, context=None, defaults=None, cache=True, lazy=False, snapshot=None):
         """Initialize a "flat" configuration.
 
         :param path: The path to the file.
@@ -38,11 +40,29 @@ class FlatConfig(Base):
         :param defaults: Defaults values.
         :type defaults: dict
 
+        :param cache: Use the process-wide cache of parsed files, so that loading an unchanged file again requires only
+                      a ``stat()``.
+        :type cache: bool
+
+        :param lazy: Store the raw values of the file and cast each value with ``smart_cast()`` when it is first
+                     accessed, rather than during ``load()``. ``_process_key_value_pair()`` is not called in this mode.
+        :type lazy: bool
+
+        :param snapshot: The path to a snapshot file. Parsed variables are saved to this file, and loaded from it
+                         (without rendering or parsing) while the configuration file and context remain the same.
+        :type snapshot: str
+
         """
-        super().__init__(path)
+        super().__init__(path, cache=cache)
 
         self._context = context
-        self._variables = defaults or dict()
+        self._lazy = lazy
+        self._snapshot = snapshot
+
+        if lazy:
+            self._variables = LazyValues(self.smart_cast, values=defaults)
+        else:
+            self._variables = defaults or dict()
 
     def __getattr__(self, item):
         return self._variables.get(item)
@@ -81,14 +101,37 @@ class FlatConfig(Base):
         :rtype: bool
 
         """
-        if not self.exists:
+        stat = self._get_stat()
+        if stat is None:
             return False
 
+        cache_key = None
+        if self._cache:
+            cache_key = CONFIG_CACHE.get_key(self.__class__, self._path, self._context, self._lazy)
+            variables = CONFIG_CACHE.get(cache_key, stat)
+            if variables is not None:
+                self._update_variables(variables)
+                self.is_loaded = True
+                return True
+
+        header = None
+        if self._snapshot is not None:
+            header = get_snapshot_header(self.__class__, self._path, stat, self._context, self._lazy)
+            variables = read_snapshot(self._snapshot, header)
+            if variables is not None:
+                if cache_key is not None:
+                    CONFIG_CACHE.set(cache_key, stat, variables)
+
+                self._update_variables(variables)
+                self.is_loaded = True
+                return True
+
         if self._context is not None:
             lines = parse_jinja_template(self._path, self._context).split("\n")
         else:
             lines = read_file(self._path).split("\n")
 
+        variables = dict()
         line_number = 0
         for line in lines:
             line_number += 1
@@ -106,9 +149,40 @@ class FlatConfig(Base):
             if key in self._disallowed_variable_names() or not is_variable_name(key):
                 raise VariableNameNotAllowed(key, self._path, line=line_number)
 
+            if self._lazy:
+                variables[key] = value
+                continue
+
             _key, _value = self._process_key_value_pair(key, value)
-            self._variables[_key] = _value
+            variables[_key] = _value
+
+        if cache_key is not None:
+            CONFIG_CACHE.set(cache_key, stat, variables)
+
+        if header is not None:
+            write_snapshot(self._snapshot, header, variables)
 
+        self._update_variables(variables)
         self.is_loaded = True
 
         return True
+
+    def to_dict(self):
+        """Export the variables, including defaults.
+
+        :rtype: dict
+
+        """
+        return dict(self._variables.items())
+
+    def _update_variables(self, variables):
+        """Add the variables of the file.
+
+        :param variables: The parsed variables, or the raw values when ``lazy`` is enabled.
+        :type variables: dict
+
+        """
+        if self._lazy:
+            self._variables.update_raw(variables)
+        else:
+            self._variables.update(variables)
@@ -4,8 +4,10 @@ from configparser import ConfigParser, DuplicateOptionError, DuplicateSectionErr
     MissingSectionHeaderError, ParsingError
 from ..files import parse_jinja_template, read_file
 from ..strings import is_variable_name
-from .base import Base
+from .base import Base, LazyValues
+from .cache import CONFIG_CACHE
 from .exceptions import VariableNameNotAllowed
+from .snapshots import get_snapshot_header, read_snapshot, write_snapshot
 
 # Exports
 
@@ -19,7 +21,8 @@ __all__ = (
 
 class INIConfig(Base):
 
-    def __init__(self, path, auto_section=False, context=None, dummy=None, flatten=None):
+    def __init__(self, path, auto_section=False, context=None, dummy=None, flatten=None, cache=True, lazy=False,
+                 snapshot=None):
         """Initialize an INI configuration.
 
         :param path: The path to the configuration file.
@@ -40,14 +43,28 @@ class INIConfig(Base):
                         name.
         :type flatten: str
 
+        :param cache: Use the process-wide cache of parsed files, so that loading an unchanged file again requires only
+                      a ``stat()``.
+        :type cache: bool
+
+        :param lazy: Store the raw values of the file and cast each value with ``smart_cast()`` when it is first
+                     accessed, rather than during ``load()``. ``_process_key_value_pair()`` is not called in this mode.
+        :type lazy: bool
+
+        :param snapshot: The path to a snapshot file. Parsed sections are saved to this file, and loaded from it (without
+                         rendering or parsing) while the configuration file and context remain the same.
+        :type snapshot: str
+
         """
-        super().__init__(path)
+        super().__init__(path, cache=cache)
 
         self._auto_section = auto_section
         self._context = context
         self._dummy = dummy
         self._flatten = flatten
+        self._lazy = lazy
         self._sections = dict()
+        self._snapshot = snapshot
 
     def __getattr__(self, item):
         """Get the named section instance."""
@@ -114,9 +131,31 @@ class INIConfig(Base):
         :rtype: bool
 
         """
-        if not self.exists:
+        stat = self._get_stat()
+        if stat is None:
             return False
 
+        cache_key = None
+        if self._cache:
+            cache_key = CONFIG_CACHE.get_key(self.__class__, self._path, self._context, self._dummy,
+                                           self._lazy)
+            sections = CONFIG_CACHE.get(cache_key, stat)
+            if sections is not None:
+                self._load_sections(sections)
+                return True
+
+        header = None
+        if self._snapshot is not None:
+            header = get_snapshot_header(self.__class__, self._path, stat, self._context, self._dummy,
+                                         self._lazy)
+            sections = read_snapshot(self._snapshot, header)
+            if sections is not None:
+                if cache_key is not None:
+                    CONFIG_CACHE.set(cache_key, stat, sections)
+
+                self._load_sections(sections)
+                return True
+
         ini = ConfigParser()
 
         if self._context is not None:
@@ -136,22 +175,76 @@ class INIConfig(Base):
             self._error = e
             return False
 
+        sections = dict()
         for section in ini.sections():
             kwargs = dict()
             for key, value in ini.items(section):
                 if not is_variable_name(key):
-                    raise VariableNameNotAllowed(key, self.path)
+                    raise VariableNameNotAllowed(key, self._path)
+
+                if self._lazy:
+                    kwargs[key] = value
+                    continue
 
                 _key, _value = self._process_key_value_pair(key, value, section=section)
                 kwargs[_key] = _value
 
-            _section = Section(section, **kwargs)
-            self._sections[section] = _section
+            sections[section] = kwargs
 
-        self.is_loaded = True
+        if cache_key is not None:
+            CONFIG_CACHE.set(cache_key, stat, sections)
+
+        if header is not None:
+            write_snapshot(self._snapshot, header, sections)
+
+        self._load_sections(sections)
 
         return True
 
+    def to_dict(self):
+        """Export the values of all sections.
+
+        :rtype: dict
+        :returns: The values by ``section.name``.
+
+        """
+        values = dict()
+        for section_name, section in self._sections.items():
+            for key, value in section.get_attributes().items():
+                values["%s.%s" % (section_name, key)] = value
+
+        return values
+
+    def _load_sections(self, sections):
+        """Create the section instances.
+
+        :param sections: The attributes of each section by section name.
+        :type sections: dict
+
+        """
+        for section, attributes in sections.items():
+            if self._lazy:
+                values = LazyValues(self._get_cast(section), raw=attributes)
+                self._sections[section] = Section.from_values(section, values)
+            else:
+                self._sections[section] = Section(section, **attributes)
+
+        self.is_loaded = True
+
+    def _get_cast(self, section):
+        """Get the callable used to cast the lazy values of a section.
+
+        :param section: The section name.
+        :type section: str
+
+        :rtype: callable
+
+        """
+        def cast(key, value):
+            return self.smart_cast(key, value, section=section)
+
+        return cast
+
 
 class Section(object):
     """An object-oriented representation of a configuration section from an INI file. See :py:class:`INIConfig`."""
@@ -174,6 +267,25 @@ class Section(object):
     def __repr__(self):
         return "<%s %s>" % (self.__class__.__name__, self._name)
 
+    @classmethod
+    def from_values(cls, section_name, values):
+        """Create a section that uses the given dictionary of values, such as
+        :py:class:`commonkit.config.base.LazyValues`, without copying it.
+
+        :param section_name: The section name.
+        :type section_name: str
+
+        :param values: The values of the section.
+        :type values: dict | commonkit.config.base.LazyValues
+
+        :rtype: Section
+
+        """
+        section = cls(section_name)
+        section._attributes = values
+
+        return section
+
     def get(self, name, default=None):
         """Get the named value.
 
@@ -188,7 +300,7 @@ class Section(object):
     def get_attributes(self):
         """Get the section attributes.
 
-        :rtype: dict
+        :rtype: dict | commonkit.config.base.LazyValues
 
         """
         return self._attributes
@@ -0,0 +1,307 @@
+# Imports
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+from ..types import smart_cast
+from .base import Base
+from .flat import FlatConfig
+from .ini import INIConfig
+from .py import PythonConfig
+
+# Exports
+
+__all__ = (
+    "LayeredConfig",
+)
+
+# Classes
+
+
+class LayeredConfig(object):
+    """Merge several configuration sources into a single set of values.
+
+    .. code-block:: python
+
+        from commonkit.config import LayeredConfig
+
+        config = LayeredConfig(
+            "etc/defaults.ini",
+            "etc/conf.d",
+            defaults={'project.release': 1},
+            environment_prefix="PROJECT_"
+        )
+        if config.load():
+            print(config.get("project.title"))
+            print(config.get_source("project.title"))
+
+    Sources are applied in the order given, so later sources take precedence over earlier ones. Defaults have the lowest
+    precedence and environment variables the highest. Values from INI files are named ``section.name``.
+
+    All values are merged into one dictionary when the configuration is loaded, so a lookup does not depend on the
+    number of sources.
+
+    """
+
+    CONFIG_CLASSES = {
+        '.cfg': FlatConfig,
+        '.ini': INIConfig,
+        '.py': PythonConfig,
+    }
+    """The configuration class used for each file extension. Files with other extensions are ignored when loading a
+    directory."""
+
+    def __init__(self, *sources, context=None, defaults=None, environment_prefix=None, workers=None):
+        """Initialize the configuration.
+
+        :param sources: Paths to configuration files, directories of configuration files (loaded in order of file name),
+                        or configuration instances.
+        :type sources: str | commonkit.config.base.Base
+
+        :param context: Context used to parse INI and flat files as Jinja templates.
+        :type context: dict
+
+        :param defaults: Default values by name.
+        :type defaults: dict
+
+        :param environment_prefix: Environment variables that start with this prefix override the values of the
+                                   sources. The prefix is removed, the name is converted to lower case, and a double
+                                   underscore separates the section from the name. For example, with a prefix of
+                                   ``PROJECT_``, ``PROJECT_CLIENT__CODE`` overrides ``client.code``.
+        :type environment_prefix: str
+
+        :param workers: The number of threads used to load the files of a directory. Defaults to that of
+                        ``ThreadPoolExecutor``.
+        :type workers: int
+
+        """
+        self.context = context
+        self.defaults = defaults or dict()
+        self.environment_prefix = environment_prefix
+        self.is_loaded = False
+        self.layers = list()
+        self.sources = sources
+        self.workers = workers
+        self._error = None
+        self._sources = dict()
+        self._values = dict()
+
+    def __contains__(self, item):
+        return item in self._values
+
+    def __getitem__(self, item):
+        return self._values[item]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return "<%s %s layers>" % (self.__class__.__name__, len(self.layers))
+
+    def get(self, name, default=None):
+        """Get the named value.
+
+        :param name: The name of the value to return.
+        :type name: str
+
+        :param default: The default if the name does not exist or has no value.
+
+        """
+        value = self._values.get(name)
+        if value is None:
+            return default
+
+        return value
+
+    def get_error(self):
+        """Get an error encountered when loading the configuration.
+
+        :rtype: str | None
+
+        """
+        return self._error
+
+    def get_source(self, name):
+        """Get the layer that provided a value.
+
+        :param name: The name of the value.
+        :type name: str
+
+        :rtype: str | None
+        :returns: The path of the configuration file, ``defaults``, ``environment``, or ``None`` if the value does not
+                  exist.
+
+        """
+        return self._sources.get(name)
+
+    def has(self, name):
+        """Determine whether a value is defined and is not ``None``.
+
+        :param name: The name of the value.
+        :type name: str
+
+        :rtype: bool
+
+        """
+        return self._values.get(name) is not None
+
+    @property
+    def has_error(self):
+        """Indicates whether an error has been encountered when loading the configuration.
+
+        :rtype: bool
+
+        """
+        return self._error is not None
+
+    def load(self):
+        """Load and merge the sources.
+
+        :rtype: bool
+        :returns: ``False`` if a source could not be loaded. See ``get_error()``.
+
+        """
+        layers = [("defaults", dict(self.defaults))]
+
+        for source in self.sources:
+            if isinstance(source, Base):
+                configs = [source]
+            elif os.path.isdir(source):
+                configs = self._get_directory_configs(source)
+            else:
+                configs = [self._get_config(source)]
+
+            for config, exception in self._load_configs(configs):
+                if exception is not None:
+                    # noinspection PyProtectedMember
+                    self._error = "Could not load configuration %s: %s" % (config._path, exception)
+                    return False
+
+                if not config.is_loaded:
+                    # noinspection PyProtectedMember
+                    self._error = config.get_error() or "Could not load configuration: %s" % config._path
+                    return False
+
+                # noinspection PyProtectedMember
+                layers.append((config._path, config.to_dict()))
+
+        if self.environment_prefix is not None:
+            layers.append(("environment", self._get_environment_values()))
+
+        values = dict()
+        sources = dict()
+        for name, layer_values in layers:
+            values.update(layer_values)
+            sources.update(dict.fromkeys(layer_values, name))
+
+        self._error = None
+        self._sources = sources
+        self._values = values
+        self.is_loaded = True
+        self.layers = [name for name, layer_values in layers]
+
+        return True
+
+    def to_dict(self):
+        """Export the merged values.
+
+        :rtype: dict
+
+        """
+        return dict(self._values)
+
+    def _get_config(self, path):
+        """Get the configuration instance for a file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :rtype: commonkit.config.base.Base
+
+        :raise: ValueError
+
+        """
+        extension = os.path.splitext(path)[1]
+        if extension not in self.CONFIG_CLASSES:
+            raise ValueError("Unsupported configuration file: %s" % path)
+
+        config_class = self.CONFIG_CLASSES[extension]
+
+        # The path of a file in a directory such as conf.d is not a valid module name, so the file is not imported.
+        if config_class is PythonConfig:
+            return config_class(path, isolated=True)
+
+        return config_class(path, context=self.context)
+
+    def _get_directory_configs(self, path):
+        """Get the configuration instances for the files of a directory.
+
+        :param path: The path to the directory.
+        :type path: str
+
+        :rtype: list[commonkit.config.base.Base]
+
+        """
+        configs = list()
+        for file_name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, file_name)
+            if os.path.splitext(file_name)[1] in self.CONFIG_CLASSES and os.path.isfile(file_path):
+                configs.append(self._get_config(file_path))
+
+        return configs
+
+    def _get_environment_values(self):
+        """Get the values of environment variables that start with the ``environment_prefix``.
+
+        :rtype: dict
+
+        """
+        values = dict()
+        length = len(self.environment_prefix)
+        for key, value in os.environ.items():
+            if not key.startswith(self.environment_prefix) or len(key) == length:
+                continue
+
+            name = key[length:].lower().replace("__", ".")
+            values[name] = smart_cast(value)
+
+        return values
+
+    def _load_configs(self, configs):
+        """Load configuration instances, in parallel when there is more than one.
+
+        :param configs: The configurations to be loaded.
+        :type configs: list[commonkit.config.base.Base]
+
+        :rtype: list[tuple(commonkit.config.base.Base, Exception | None)]
+        :returns: The configurations, in the given order, with the exception (if any) raised while loading each.
+
+        """
+        pending = [config for config in configs if not config.is_loaded]
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                exceptions = list(executor.map(self._load_config, pending))
+        else:
+            exceptions = [self._load_config(config) for config in pending]
+
+        errors = dict(zip([id(config) for config in pending], exceptions))
+
+        return [(config, errors.get(id(config))) for config in configs]
+
+    @staticmethod
+    def _load_config(config):
+        """Load a configuration instance.
+
+        :rtype: Exception | None
+        :returns: The exception raised by ``load()``, if any.
+
+        """
+        # noinspection PyBroadException
+        try:
+            config.load()
+        except Exception as e:
+            return e
+
+        return None
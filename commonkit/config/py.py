@@ -1,8 +1,13 @@
 # Imports
 
-from importlib import import_module
+from importlib import import_module, reload
+from importlib.util import module_from_spec, spec_from_file_location
 import os
+import sys
+import threading
+from types import ModuleType
 from .base import Base
+from .cache import CONFIG_CACHE
 
 # Exports
 
@@ -10,13 +15,20 @@ __all__ = (
     "PythonConfig",
 )
 
+# Constants
+
+_MODULE_STATS = dict()
+"""The modification time and size of each configuration file when its module was (re)loaded, by module name."""
+
+_MODULE_STATS_LOCK = threading.Lock()
+
 # Classes
 
 
 class PythonConfig(Base):
     """Load configuration from a Python file."""
 
-    def __init__(self, path, defaults=None):
+    def __init__(self, path, defaults=None, cache=True, isolated=False):
         """Initialize a Python file as configuration data.
 
         :param path: The path to the file.
@@ -25,11 +37,21 @@ class PythonConfig(Base):
         :param defaults: Defaults values.
         :type defaults: dict
 
+        :param cache: Use the process-wide cache of loaded files. A file that has changed since it was loaded is
+                      reloaded.
+        :type cache: bool
+
+        :param isolated: Execute the file as a new module each time it is loaded, rather than importing it. The module
+                         is not added to ``sys.modules`` or to the cache, so other instances (and the module itself, if
+                         it has been imported) are not changed when the file is loaded again.
+        :type isolated: bool
+
         """
         self._defaults = defaults or dict()
+        self._isolated = isolated
         self._module = None
 
-        super().__init__(path)
+        super().__init__(path, cache=cache)
 
     def __getattr__(self, item):
         """Get the named section instance."""
@@ -72,11 +94,25 @@ class PythonConfig(Base):
         :rtype: bool
 
         """
-        if not self.exists:
+        stat = self._get_stat()
+        if stat is None:
             return False
 
         name = "%s.%s" % (self._root.replace(os.sep, "."), self._name)
-        self._module = import_module(name)
+
+        if self._isolated:
+            spec = spec_from_file_location(name, self._path)
+            self._module = module_from_spec(spec)
+            spec.loader.exec_module(self._module)
+        elif self._cache:
+            cache_key = CONFIG_CACHE.get_key(self.__class__, self._path)
+
+            self._module = CONFIG_CACHE.get(cache_key, stat)
+            if self._module is None:
+                self._module = self._import_module(name, stat)
+                CONFIG_CACHE.set(cache_key, stat, self._module)
+        else:
+            self._module = self._import_module(name, stat)
 
         # An import error shouldn't occur because we've already tested for the existence of the file. Of course,
         # something could be wrong within the file.
@@ -89,3 +125,49 @@ class PythonConfig(Base):
         self.is_loaded = True
 
         return True
+
+    def to_dict(self):
+        """Export the public variables of the module. As with ``get()``, defaults take precedence.
+
+        :rtype: dict
+
+        """
+        values = dict()
+        if self._module is not None:
+            for name, value in vars(self._module).items():
+                if not name.startswith("_") and not isinstance(value, ModuleType):
+                    values[name] = value
+
+        values.update(self._defaults)
+
+        return values
+
+    @staticmethod
+    def _import_module(name, stat):
+        """Import the module of the configuration file, reloading it if the file has changed since it was imported.
+
+        :param name: The module name.
+        :type name: str
+
+        :param stat: The current result of ``os.stat()`` for the file.
+        :type stat: os.stat_result
+
+        :rtype: module
+
+        The modification time and size are recorded when the module is first seen. The module is reloaded only when a
+        recorded modification time or size differs from the file, so a cleared or evicted cache entry never leaves a
+        stale module in place, and a module that has already been imported is not executed again.
+
+        """
+        current = (stat.st_mtime_ns, stat.st_size)
+
+        with _MODULE_STATS_LOCK:
+            module = sys.modules.get(name)
+            if module is None:
+                module = import_module(name)
+            elif _MODULE_STATS.get(name, current) != current:
+                module = reload(module)
+
+            _MODULE_STATS[name] = current
+
+        return module
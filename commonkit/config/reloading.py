@@ -0,0 +1,200 @@
+# Imports
+
+import logging
+import threading
+from ..dispatcher import Signal
+from ..watchers import Watcher
+from .py import PythonConfig
+
+logger = logging.getLogger(__name__)
+
+# Exports
+
+__all__ = (
+    "config_changed",
+    "ReloadingConfig",
+)
+
+# Constants
+
+config_changed = Signal(arguments=["changed", "config", "reloader"])
+"""Sent by :py:class:`ReloadingConfig` after a changed configuration has been swapped in."""
+
+# Classes
+
+
+class ReloadingConfig(object):
+    """Reload a configuration when its file changes.
+
+    .. code-block:: python
+
+        from commonkit.config import config_changed, INIConfig, ReloadingConfig
+
+        def on_change(changed=None, **kwargs):
+            logger.info("Configuration changed: %s" % ", ".join(changed))
+            return True, None
+
+        config_changed.connect(on_change, sender=ReloadingConfig)
+
+        config = ReloadingConfig(INIConfig, "etc/project.ini", context={'env': "live"}, interval=2.0)
+        print(config.project.title)
+
+    The file is watched with a :py:class:`commonkit.watchers.Watcher` on a background thread. When it changes, a new
+    configuration instance is loaded (and validated) before it replaces the current one, so readers never see a
+    partially loaded configuration. Reading a value does not check the file.
+
+    """
+
+    def __init__(self, config_class, path, *args, interval=1.0, validator=None, **kwargs):
+        """Initialize and load the configuration.
+
+        :param config_class: The configuration class; for example, :py:class:`commonkit.config.ini.INIConfig`.
+        :type config_class: type
+
+        :param path: The path to the configuration file.
+        :type path: str
+
+        :param interval: The number of seconds between checks of the file. Use ``None`` to check only when ``reload()``
+                         is called.
+        :type interval: float
+
+        :param validator: A callable that accepts a newly loaded configuration and returns ``True`` if it may be used.
+        :type validator: callable
+
+        Additional arguments and keyword arguments are passed to the configuration class. A
+        :py:class:`commonkit.config.py.PythonConfig` is always ``isolated``, so that loading a new version of the file
+        does not change the current configuration before it has been validated.
+
+        """
+        self.config = None
+        self.error = None
+        self.interval = interval
+        self.path = path
+        self.validator = validator
+        self._args = args
+        self._config_class = config_class
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._watcher = Watcher(path)
+
+        if issubclass(config_class, PythonConfig):
+            self._kwargs['isolated'] = True
+
+        # The first check records the current modification time.
+        self._changes = self._watcher.watch()
+        next(self._changes)
+
+        self.config = self._load()
+
+        if interval:
+            self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __getattr__(self, item):
+        if item.startswith("_") or self.__dict__.get("config") is None:
+            raise AttributeError(item)
+
+        return getattr(self.config, item)
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.path)
+
+    @property
+    def is_running(self):
+        """Indicates the file is being watched.
+
+        :rtype: bool
+
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def reload(self, force=False):
+        """Reload the configuration if the file has changed.
+
+        :param force: Reload even if the file has not changed.
+        :type force: bool
+
+        :rtype: bool
+        :returns: ``True`` if a new configuration was swapped in.
+
+        """
+        with self._lock:
+            changed = next(self._changes)
+            if not changed and not force:
+                return False
+
+            old_values = self.config.to_dict() if self.config is not None else dict()
+
+            config = self._load()
+            if config is None:
+                return False
+
+            new_values = config.to_dict()
+
+            # Swapping the reference is atomic, so readers see either the old or the new configuration.
+            self.config = config
+
+        changed_keys = sorted([key for key in set(old_values) | set(new_values)
+                               if key not in old_values or key not in new_values or
+                               old_values[key] != new_values[key]])
+
+        if changed_keys:
+            config_changed.send(self.__class__, changed=changed_keys, config=config, reloader=self)
+
+        return True
+
+    def start(self):
+        """Start watching the file on a background thread."""
+        if self.is_running:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching the file."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _load(self):
+        """Load and validate a new configuration instance.
+
+        :returns: The configuration, or ``None`` if it could not be loaded or is invalid. The reason is stored in
+                  ``error``.
+
+        """
+        # noinspection PyBroadException
+        try:
+            config = self._config_class(self.path, *self._args, **self._kwargs)
+            if not config.load():
+                self.error = config.get_error() or "Could not load %s" % self.path
+                logger.warning("Configuration not reloaded: %s" % self.error)
+                return None
+
+            if self.validator is not None and not self.validator(config):
+                self.error = "Validation failed for %s" % self.path
+                logger.warning("Configuration not reloaded: %s" % self.error)
+                return None
+        except Exception as e:
+            self.error = e
+            logger.warning("Configuration not reloaded: %s" % e)
+            return None
+
+        self.error = None
+
+        return config
+
+    def _run(self):
+        """Check the file at the given interval until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.reload()
@@ -0,0 +1,116 @@
+# Imports
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+# Exports
+
+__all__ = (
+    "get_snapshot_header",
+    "read_snapshot",
+    "write_snapshot",
+    "SNAPSHOT_VERSION",
+)
+
+# Constants
+
+SNAPSHOT_VERSION = 1
+"""The format of snapshot files. Snapshots written with another version are ignored."""
+
+# Functions
+
+
+def get_snapshot_header(config_class, path, stat, context=None, *options):
+    """Get the header that identifies the source of a configuration snapshot.
+
+    :param config_class: The configuration class.
+    :type config_class: type
+
+    :param path: The path to the configuration file.
+    :type path: str
+
+    :param stat: The result of ``os.stat()`` for the configuration file.
+    :type stat: os.stat_result
+
+    :param context: The template context, if any.
+    :type context: dict
+
+    :rtype: tuple
+
+    Additional arguments are options that change the parsed result.
+
+    """
+    context_hash = None
+    if context is not None:
+        context_hash = hashlib.sha256(repr(sorted(context.items())).encode("utf-8")).hexdigest()
+
+    return (
+        SNAPSHOT_VERSION,
+        "%s.%s" % (config_class.__module__, config_class.__name__),
+        os.path.abspath(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        context_hash,
+        repr(options),
+    )
+
+
+def read_snapshot(path, header):
+    """Read the data of a configuration snapshot.
+
+    :param path: The path to the snapshot file.
+    :type path: str
+
+    :param header: The expected header. See ``get_snapshot_header()``.
+    :type header: tuple
+
+    :returns: The data, or ``None`` if the snapshot does not exist, is out of date, or cannot be read.
+
+    Only the header is read when the snapshot is out of date.
+
+    """
+    try:
+        with open(path, "rb") as f:
+            if pickle.load(f) != header:
+                return None
+
+            return pickle.load(f)
+    except (AttributeError, EOFError, ImportError, IndexError, OSError, pickle.UnpicklingError, TypeError,
+            ValueError):
+        return None
+
+
+def write_snapshot(path, header, data):
+    """Write a configuration snapshot. The file is replaced atomically, so readers never see a partial snapshot.
+
+    :param path: The path to the snapshot file.
+    :type path: str
+
+    :param header: The header that identifies the source. See ``get_snapshot_header()``.
+    :type header: tuple
+
+    :param data: The parsed data to be saved.
+
+    :rtype: bool
+    :returns: ``True`` if the snapshot was written. A snapshot that cannot be written is not an error.
+
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+
+    temp_path = None
+    try:
+        handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+        with open(handle, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_path, path)
+    except (AttributeError, OSError, pickle.PicklingError, TypeError):
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        return False
+
+    return True
@@ -101,6 +101,180 @@ dictionaries.
         print("Salary: %s" % row.salary)
         print("")
 
+Compact Rows
+............
+
+Each row is normally a dictionary, so the field names are repeated for every row. For large files, use ``compact=True``
+to load rows as :py:class:`commonkit.csv.library.CompactRow` instances instead. A row class is generated for the
+fields of the mapping, so the field names are stored only once. Values remain available by attribute, name, or index.
+
+.. code-block:: python
+
+    from commonkit.csv import AutoMapping, CSVFile
+
+    csv = CSVFile("path.csv", compact=True, mapping=AutoMapping(), smart_cast_fields=["salary"])
+    csv.read()
+
+    for row in csv:
+        print("Name: %s %s" % (row.first_name, row['last_name']))
+
+To further reduce memory, ``columnar=True`` stores the rows in a :py:class:`commonkit.csv.library.ColumnStore`. Columns
+whose values are all integers or all floats are packed into an ``array.array`` once the file has been read. Rows are
+created as needed when the store is accessed.
+
+.. code-block:: python
+
+    csv = CSVFile("path.csv", columnar=True, mapping=AutoMapping(), smart_cast_fields=["salary"])
+    csv.read()
+
+    salaries = csv.rows.get_column("salary")
+    print(sum(salaries))
+
+.. note::
+    A ``row_class`` may not be used with compact or columnar rows, and a mapping is required for columnar rows.
+
+Following a File
+................
+
+When a file is continuously appended, use ``read_new()`` rather than ``read()``. The first call reads the whole file.
+Later calls parse only the complete rows that have been appended since the previous call, and return them (they are
+also added to ``rows``). An incomplete row at the end of the file is left for the next call.
+
+.. code-block:: python
+
+    from commonkit.csv import AutoMapping, CSVFile
+
+    csv = CSVFile("path.csv", mapping=AutoMapping())
+
+    rows = csv.read_new()
+    # ... some time later ...
+    rows = csv.read_new()
+
+The ``follow()`` method yields new rows as they arrive, checking the file every ``interval`` seconds. An optional
+``timeout`` stops following after the given number of seconds without new rows.
+
+.. code-block:: python
+
+    for row in csv.follow(interval=0.5):
+        print(row)
+
+If the file is truncated or replaced, as with log rotation, reading starts again from the top of the file.
+
+Compressed Files
+................
+
+Files compressed with gzip, bzip2, or xz are read and written without first decompressing them to disk. The format is
+identified from the file extension or, when reading, the first bytes of the file. See
+:py:func:`commonkit.files.library.open_file`.
+
+.. code-block:: python
+
+    from commonkit.csv import AutoMapping, CSVFile
+
+    csv = CSVFile("path.csv.gz", mapping=AutoMapping(), buffer_size=1024 * 1024)
+    csv.read()
+    csv.write(path="path.csv.xz")
+
+Streaming Operators
+...................
+
+Use ``iter_rows()`` to iterate over the rows of a file without loading them into memory. The rows may then be processed
+in a single pass using the functions of :py:mod:`commonkit.csv.operators`: ``aggregate()``, ``distinct()``,
+``filter_rows()``, and ``group_by()``.
+
+.. code-block:: python
+
+    from commonkit.csv import aggregate, filter_rows, AutoMapping, CSVFile
+    from commonkit.math import median
+
+    csv = CSVFile("path.csv", mapping=AutoMapping(), smart_cast_fields=["salary"])
+
+    rows = filter_rows(csv.iter_rows(), lambda row: row['salary'] > 50000)
+    results = aggregate(
+        rows,
+        by="job_title",
+        people="count",
+        average=("mean", "salary"),
+        highest=("max", "salary"),
+        typical=(median, "salary")
+    )
+
+The supported aggregates are ``count``, ``max``, ``mean``, ``min``, and ``sum``. Any callable that accepts a list of
+values, such as those of :py:mod:`commonkit.math`, may also be used.
+
+Memory use grows with the number of groups (or unique values for ``distinct()``). When there are many, use
+``partitions`` to spill the rows to temporary files by hash of the key and process one file at a time.
+
+Results may be turned into a CSV file with ``to_csv_file()``:
+
+.. code-block:: python
+
+    from commonkit.csv import to_csv_file
+
+    to_csv_file(results, "path/to/summary.csv").write()
+
+Sorting Large Files
+...................
+
+The :py:func:`commonkit.csv.sorting.sort_csv` function sorts a file by one or more columns without loading the whole
+file into memory. Rows are read in chunks of about ``memory_limit`` bytes; each chunk is sorted and written to a
+temporary file, and the sorted files are then merged into the output.
+
+.. code-block:: python
+
+    from commonkit.csv import sort_csv
+
+    count = sort_csv(
+        "path/to/people.csv.gz",
+        "path/to/sorted.csv",
+        key=["last_name", "salary"],
+        memory_limit=256 * 1024 * 1024
+    )
+
+By default, key values are compared using :py:func:`commonkit.types.smart_cast` so that numeric columns are sorted as
+numbers. Use ``deduplicate=True`` to write only the first row for each key.
+
+Loading Into SQLite
+...................
+
+For ad hoc queries, :py:func:`commonkit.csv.sqlite.to_sqlite` loads the rows of a file into an SQLite table and returns
+a :py:class:`commonkit.database.library.Database` instance. Column types are inferred from a sample of rows.
+
+.. code-block:: python
+
+    from commonkit.csv import to_sqlite, AutoMapping, CSVFile
+
+    csv = CSVFile("path/to/people.csv", mapping=AutoMapping())
+    db = to_sqlite(csv, "people", indexes=["job_title"])
+
+    result = db.select("people", job_title="CEO")
+
+Rows are inserted in batches within a single transaction. The database is held in memory unless a ``path`` is given.
+
+Validating a File
+.................
+
+A :py:class:`commonkit.csv.validation.Schema` checks the values of a file without loading it. Each
+:py:class:`commonkit.csv.validation.Field` may be required, typed, matched against a pattern, limited to a range or
+choices, or required to be unique.
+
+.. code-block:: python
+
+    from commonkit.csv import AutoMapping, CSVFile, Field, Schema
+
+    schema = Schema(
+        Field("email", required=True, type="email", unique=True),
+        Field("salary", type="integer", minimum=0, maximum=1000000),
+        max_errors=100
+    )
+
+    result = schema.validate(CSVFile("path/to/upload.csv", mapping=AutoMapping()), workers=4)
+    for error in result.errors:
+        print("Row %s, column %s: %s" % (error.row, error.column, error.message))
+
+All errors are collected (up to ``max_errors``) rather than stopping at the first. Use ``workers`` to validate chunks of
+rows in parallel processes.
+
 Handling Empty Values
 .....................
 
@@ -176,15 +350,33 @@ Note that when supplying ``smart_cast_fields`` as a dictionary, fields without a
 
 """
 from .library import *
+from .operators import *
+from .sorting import *
+from .sqlite import *
+from .validation import *
 
 __author__ = "Shawn Davis <shawn@develmaycare.com>"
 __maintainer__ = "Shawn Davis <shawn@develmaycare.com>"
 __version__ = "0.3.0-x"
 
 __all__ = (
+    "aggregate",
+    "distinct",
+    "filter_rows",
+    "group_by",
+    "make_row_class",
+    "sort_csv",
+    "to_csv_file",
+    "to_sqlite",
     "AutoMapping",
+    "ColumnStore",
+    "CompactRow",
     "CSVFile",
     "CSVRow",
+    "Field",
+    "FieldError",
     "IndexMapping",
     "KeywordMapping",
+    "Schema",
+    "ValidationResult",
 )
@@ -1,21 +1,73 @@
 # Imports
 
+from array import array
 import csv
+from functools import lru_cache
+import io
+from operator import itemgetter
 import os
-from ..files import read_csv
+import time
+from ..files import get_compression, open_file
 from ..strings import slug
 from ..types import smart_cast
 
 # Exports
 
 __all__ = (
+    "make_row_class",
     "AutoMapping",
+    "ColumnStore",
+    "CompactRow",
     "CSVFile",
     "CSVRow",
     "IndexMapping",
     "KeywordMapping",
 )
 
+# Functions
+
+
+def make_row_class(fields, name="CompactRow"):
+    """Get a compact row class for the given field names.
+
+    :param fields: The field names in column order.
+    :type fields: list[str] | tuple[str]
+
+    :param name: The name of the generated class.
+    :type name: str
+
+    :rtype: type[CompactRow]
+
+    Classes are cached, so the same fields always produce the same class and the field order is shared by every row.
+
+    """
+    return _make_row_class(tuple(fields), name)
+
+
+@lru_cache(maxsize=128)
+def _make_row_class(fields, name):
+    """Generate (and cache) the row class. See ``make_row_class()``."""
+    attributes = {
+        '__slots__': (),
+        '_fields': fields,
+        '_indexes': {field: index for index, field in enumerate(fields)},
+    }
+
+    # Fields that may be used as identifiers are exposed as properties, which are faster than __getattr__() and take
+    # precedence over tuple methods such as count() and index(). Fields that would replace a CompactRow method remain
+    # available by key.
+    for index, field in enumerate(fields):
+        if not isinstance(field, str) or not field.isidentifier() or field.startswith("_"):
+            continue
+
+        if field in CompactRow.__dict__:
+            continue
+
+        attributes[field] = property(itemgetter(index))
+
+    return type(name, (CompactRow,), attributes)
+
+
 # Classes
 
 
@@ -39,8 +91,61 @@ class CSVFile(object):
     ]
     """Imported values that evaluate to ``None``. See ``get_none_type_values()``."""
 
+    FOLLOW_TAIL_SIZE = 64
+    """The number of bytes at the end of the last row read by ``read_new()`` that are checked to detect a replaced
+    file."""
+
     def __init__(self, path, defaults=None, encoding="utf-8", mapping=None, none_type_values=None, row_class=None,
-                 smart_cast_fields=None):
+                 smart_cast_fields=None, columnar=False, compact=False, buffer_size=-1, compression=None):
+        """Initialize a CSV file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param defaults: Default values by field name.
+        :type defaults: dict
+
+        :param encoding: The encoding of the file.
+        :type encoding: str
+
+        :param mapping: The mapping used to identify fields.
+        :type mapping: AutoMapping | IndexMapping | KeywordMapping
+
+        :param none_type_values: Values to be recognized as ``None``. See ``get_none_type_values()``.
+        :type none_type_values: list[str]
+
+        :param row_class: The class used to instantiate each row. It receives the row values as keyword arguments.
+
+        :param smart_cast_fields: The fields to be cast to Python types. See ``smart_cast()``.
+        :type smart_cast_fields: list[str] | dict
+
+        :param columnar: Store the rows as columns using a :py:class:`ColumnStore`. Implies ``compact`` and requires a
+                         ``mapping``.
+        :type columnar: bool
+
+        :param compact: Load rows as :py:class:`CompactRow` instances rather than dictionaries.
+        :type compact: bool
+
+        :param buffer_size: The size of the read and write buffers in bytes. See :py:func:`commonkit.files.open_file`.
+        :type buffer_size: int
+
+        :param compression: The compression format of the file. By default, this is identified from the file extension
+                            or (when reading) the first bytes of the file. See :py:func:`commonkit.files.open_file`.
+        :type compression: str | bool
+
+        :raise: ValueError
+
+        """
+        if (columnar or compact) and row_class is not None:
+            raise ValueError("A row_class may not be used with compact or columnar rows.")
+
+        if columnar and mapping is None:
+            raise ValueError("A mapping is required for columnar rows.")
+
+        self.buffer_size = buffer_size
+        self.columnar = columnar
+        self.compact = compact or columnar
+        self.compression = compression
         self.defaults = defaults or dict()
         self.encoding = encoding
         self.is_loaded = False
@@ -48,9 +153,13 @@ class CSVFile(object):
         self.none_type_values = none_type_values
         self.path = path
         self.row_class = row_class
-        self.rows = list()
+        self.rows = ColumnStore() if columnar else list()
         self.smart_cast_fields = smart_cast_fields or list()
         self._column_names = None
+        self._follow_header = None
+        self._follow_inode = None
+        self._follow_offset = 0
+        self._follow_tail = b""
 
         if isinstance(mapping, KeywordMapping):
             self.first_row_field_names = True
@@ -108,6 +217,65 @@ class CSVFile(object):
         """
         return self.none_type_values or self.NONE_TYPE_VALUES
 
+    def follow(self, interval=1.0, timeout=None, **kwargs):
+        """Continuously read rows as they are appended to the file.
+
+        :param interval: The number of seconds to wait between checks for new rows.
+        :type interval: float
+
+        :param timeout: Stop after this many seconds pass without new rows. By default, the file is followed until the
+                        generator is closed.
+        :type timeout: float
+
+        :rtype: collections.Iterable
+        :returns: Yields each new row.
+
+        kwargs are passed to ``read_new()``.
+
+        """
+        idle = 0.0
+        while True:
+            rows = self.read_new(**kwargs)
+            if rows:
+                idle = 0.0
+                for row in rows:
+                    yield row
+
+                continue
+
+            if timeout is not None and idle >= timeout:
+                return
+
+            time.sleep(interval)
+            idle += interval
+
+    def iter_rows(self, **kwargs):
+        """Iterate over the rows of the file without loading them into ``rows``.
+
+        :rtype: collections.Iterable
+        :returns: Yields each row as it would be loaded by ``read()``. Columnar rows are yielded as compact rows.
+
+        kwargs are passed to Python's ``csv.DictReader`` (when ``first_row_field_names`` is ``True``) or ``csv.reader``.
+
+        .. code-block:: python
+
+            csv = CSVFile("path.csv", mapping=AutoMapping())
+            for row in csv.iter_rows():
+                print(row)
+
+        """
+        with open_file(self.path, buffer_size=self.buffer_size, compression=self.compression,
+                       encoding=self.encoding) as f:
+            if self.first_row_field_names:
+                _rows = csv.DictReader(f, **kwargs)
+            else:
+                _rows = csv.reader(f, **kwargs)
+
+            for row in self._process_rows(_rows):
+                yield row
+
+            f.close()
+
     def read(self, **kwargs):
         """Read the CSV file.
 
@@ -115,31 +283,102 @@ class CSVFile(object):
 
         kwargs are passed to Python's ``csv.DictReader`` (when ``first_row_field_names`` is ``True``) or ``csv.reader``.
 
+        ``read_new()`` continues from the end of an uncompressed file that has been read.
+
         """
         if not self.exists:
             return False
 
-        row_class = self.row_class
-        _rows = read_csv(self.path, encoding=self.encoding, first_row_field_names=self.first_row_field_names, **kwargs)
+        compression = self.compression
+        if compression is None:
+            compression = get_compression(self.path)
 
-        for _row in _rows:
-            if self.mapping is not None:
-                _values = self.mapping.get_values(_row)
-                values = dict()
-                for key, value in _values.items():
-                    values[key] = self.smart_cast(key, _row, value)
+        with open_file(self.path, buffer_size=self.buffer_size, compression=compression or False,
+                       encoding=self.encoding) as f:
+            if self.first_row_field_names:
+                _rows = csv.DictReader(f, **kwargs)
             else:
-                values = _row
+                _rows = csv.reader(f, **kwargs)
 
-            if row_class is not None:
-                self.rows.append(row_class(**values))
-            else:
-                self.rows.append(values)
+            self._load_rows(_rows)
+
+            if not compression:
+                self._reset_follow(os.fstat(f.fileno()).st_ino)
+                self._follow_header = _rows.fieldnames if self.first_row_field_names else None
+                self._set_follow_offset(f.buffer)
+
+            f.close()
 
         self.is_loaded = True
 
         return True
 
+    def read_new(self, **kwargs):
+        """Read only the complete rows that have been appended since the last call.
+
+        :rtype: list
+        :returns: The new rows, which are also added to ``rows``.
+
+        kwargs are passed to Python's ``csv.DictReader`` (when ``first_row_field_names`` is ``True``) or ``csv.reader``.
+
+        The first call reads the whole file. After that, reading starts from the byte offset where the last complete
+        row ended, and an incomplete row at the end of the file is left for the next call. If the file has been
+        truncated or replaced (for example, by log rotation), reading starts again from the top and the column row is
+        read again.
+
+        .. note::
+            Compressed files cannot be followed.
+
+        """
+        if self.compression or get_compression(self.path, detect=False):
+            raise ValueError("Compressed files cannot be read incrementally: %s" % self.path)
+
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return list()
+
+        if stat.st_ino != self._follow_inode or stat.st_size < self._follow_offset:
+            self._reset_follow(stat.st_ino)
+
+        if stat.st_size == self._follow_offset:
+            return list()
+
+        with open(self.path, "rb") as f:
+            # Inodes may be reused when a file is replaced, so also check that the end of the last row read is unchanged.
+            if self._follow_offset > 0:
+                f.seek(self._follow_offset - len(self._follow_tail))
+                if f.read(len(self._follow_tail)) != self._follow_tail:
+                    self._reset_follow(stat.st_ino)
+
+            f.seek(self._follow_offset)
+            data = f.read(stat.st_size - self._follow_offset)
+            f.close()
+
+        end = self._get_complete_rows_end(data, kwargs.get("quotechar", '"'))
+        if end == 0:
+            return list()
+
+        self._follow_offset += end
+        self._follow_tail = data[max(0, end - self.FOLLOW_TAIL_SIZE):end]
+        text = data[:end].decode(self.encoding)
+
+        if self.first_row_field_names:
+            lines = io.StringIO(text, newline="")
+            if self._follow_header is None:
+                self._follow_header = next(csv.reader(lines, **kwargs))
+
+            _rows = csv.DictReader(lines, fieldnames=self._follow_header, **kwargs)
+        else:
+            _rows = csv.reader(io.StringIO(text, newline=""), **kwargs)
+
+        start = len(self.rows)
+        self._load_rows(_rows)
+
+        self.is_loaded = True
+
+        return self.rows[start:]
+
     def smart_cast(self, field_name, row, value):
         """Cast a value to the appropriate Python data type.
 
@@ -210,7 +449,11 @@ class CSVFile(object):
         """
         _path = path or self.path
 
-        with open(_path, 'w', newline='') as f:
+        # The compression given upon instantiation applies to the instantiated path only.
+        compression = self.compression if path is None else None
+
+        with open_file(_path, "w", buffer_size=self.buffer_size, compression=compression, encoding=self.encoding,
+                       newline="") as f:
             writer = csv.writer(f, **kwargs)
 
             if self.first_row_field_names:
@@ -235,6 +478,287 @@ class CSVFile(object):
 
             f.close()
 
+    # noinspection PyMethodMayBeStatic
+    def _get_complete_rows_end(self, data, quotechar='"'):
+        """Get the position just after the last complete row in the given data.
+
+        :param data: Data read from the file, beginning at the start of a row.
+        :type data: bytes
+
+        :param quotechar: The quote character. A line feed inside a quoted value does not end a row.
+        :type quotechar: str
+
+        :rtype: int
+
+        """
+        quote = quotechar.encode(self.encoding)
+        end = data.rfind(b"\n") + 1
+
+        # An odd number of quotes before the line feed means it falls within a quoted value.
+        quotes = data.count(quote, 0, end)
+        while end > 0 and quotes % 2 != 0:
+            previous = data.rfind(b"\n", 0, end - 1) + 1
+            quotes -= data.count(quote, previous, end)
+            end = previous
+
+        return end
+
+    def _reset_follow(self, inode):
+        """Start following the file from the top.
+
+        :param inode: The inode of the file being followed.
+        :type inode: int
+
+        """
+        self._follow_header = None
+        self._follow_inode = inode
+        self._follow_offset = 0
+        self._follow_tail = b""
+
+    def _set_follow_offset(self, stream):
+        """Continue following the file from the end of what has been read.
+
+        :param stream: The binary stream of the file, after the rows have been read to the end.
+
+        """
+        offset = stream.tell()
+        start = max(0, offset - self.FOLLOW_TAIL_SIZE)
+        stream.seek(start)
+
+        self._follow_offset = offset
+        self._follow_tail = stream.read(offset - start)
+
+    def _load_rows(self, _rows):
+        """Process rows from a reader and add them to ``rows``.
+
+        :param _rows: Rows from Python's ``csv.DictReader`` or ``csv.reader``.
+
+        """
+        for row in self._process_rows(_rows):
+            self.rows.append(row)
+
+        if self.columnar:
+            self.rows.pack()
+
+    def _process_rows(self, _rows):
+        """Apply the mapping, casting, and row class to rows from a reader.
+
+        :param _rows: Rows from Python's ``csv.DictReader`` or ``csv.reader``.
+
+        :rtype: collections.Iterable
+        :returns: Yields each processed row.
+
+        """
+        compact_row_class = None
+        row_class = self.row_class
+
+        for _row in _rows:
+            if self.mapping is not None:
+                _values = self.mapping.get_values(_row)
+                values = dict()
+                for key, value in _values.items():
+                    values[key] = self.smart_cast(key, _row, value)
+            else:
+                values = _row
+
+            if self.compact:
+                if type(values) is not dict:
+                    yield tuple(values)
+                    continue
+
+                # The mapping produces the same fields for every row, so the class need only be found once.
+                if compact_row_class is None:
+                    compact_row_class = make_row_class(values.keys())
+
+                yield compact_row_class(values.values())
+            elif row_class is not None:
+                yield row_class(**values)
+            else:
+                yield values
+
+
+class ColumnStore(object):
+    """Store rows as columns.
+
+    Columns whose values are all integers or all floats are packed into an ``array.array`` by ``pack()``. Rows are
+    created on demand as :py:class:`CompactRow` instances.
+
+    """
+
+    def __init__(self, fields=None):
+        """Initialize the store.
+
+        :param fields: The field names in column order. If omitted, these are taken from the first appended row.
+        :type fields: list[str]
+
+        """
+        self.fields = None
+        self.row_class = None
+        self._columns = list()
+        self._length = 0
+
+        if fields is not None:
+            self._set_fields(fields)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(self._length))]
+
+        if item < 0:
+            item += self._length
+
+        if item < 0 or item >= self._length:
+            raise IndexError("ColumnStore index out of range.")
+
+        return self.row_class([column[item] for column in self._columns])
+
+    def __iter__(self):
+        row_class = self.row_class
+        for values in zip(*self._columns):
+            yield row_class(values)
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "<%s %s rows>" % (self.__class__.__name__, self._length)
+
+    def append(self, values):
+        """Append a row.
+
+        :param values: The row values.
+        :type values: dict | CompactRow
+
+        """
+        if self.fields is None:
+            self._set_fields(values.keys())
+
+        if type(values) is not self.row_class:
+            values = [values[field] for field in self.fields]
+
+        for index, value in enumerate(values):
+            column = self._columns[index]
+
+            if type(column) is array and not self._is_packable(column.typecode, value):
+                column = self._columns[index] = list(column)
+
+            column.append(value)
+
+        self._length += 1
+
+    def get_column(self, name):
+        """Get the values of the named column.
+
+        :param name: The field name.
+        :type name: str
+
+        :rtype: list | array
+
+        """
+        # noinspection PyProtectedMember
+        return self._columns[self.row_class._indexes[name]]
+
+    def pack(self):
+        """Pack numeric columns into arrays. Columns with mixed types (including ``None``) are left as lists."""
+        for index, column in enumerate(self._columns):
+            if type(column) is array or len(column) == 0:
+                continue
+
+            for typecode in ("q", "d"):
+                if all(self._is_packable(typecode, value) for value in column):
+                    self._columns[index] = array(typecode, column)
+                    break
+
+    @staticmethod
+    def _is_packable(typecode, value):
+        """Indicates whether the value may be stored in an array of the given type without changing its type."""
+        if typecode == "q":
+            return type(value) is int and -2 ** 63 <= value < 2 ** 63
+
+        return type(value) is float
+
+    def _set_fields(self, fields):
+        """Set the fields and create the (empty) columns."""
+        self.fields = tuple(fields)
+        self.row_class = make_row_class(self.fields)
+        self._columns = [list() for _ in self.fields]
+
+
+class CompactRow(tuple):
+    """A memory efficient row that stores its values in a tuple.
+
+    Subclasses are generated with ``make_row_class()``. The field names are stored once on the class rather than on
+    every row, and values may be accessed by attribute, field name, or index.
+
+    """
+
+    __slots__ = ()
+
+    _fields = ()
+    _indexes = {}
+
+    def __new__(cls, values=()):
+        return super().__new__(cls, values)
+
+    def __contains__(self, item):
+        return item in self._indexes
+
+    def __getattr__(self, item):
+        index = self._indexes.get(item)
+        if index is None:
+            return None
+
+        return tuple.__getitem__(self, index)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, slice)):
+            return tuple.__getitem__(self, item)
+
+        return tuple.__getitem__(self, self._indexes[item])
+
+    def __repr__(self):
+        values = ", ".join(["%s=%r" % (field, value) for field, value in zip(self._fields, tuple.__iter__(self))])
+        return "%s(%s)" % (self.__class__.__name__, values)
+
+    def as_dict(self):
+        """Get the row as a dictionary.
+
+        :rtype: dict
+
+        """
+        return dict(zip(self._fields, tuple.__iter__(self)))
+
+    def get(self, name, default=None):
+        """Get the named value.
+
+        :param name: The field name.
+        :type name: str
+
+        :param default: The value to return if the field does not exist.
+
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            return default
+
+        return tuple.__getitem__(self, index)
+
+    def items(self):
+        """Get the field name and value pairs of the row.
+
+        :rtype: zip
+
+        """
+        return zip(self._fields, tuple.__iter__(self))
+
+    def keys(self):
+        """Get the field names of the row.
+
+        :rtype: tuple[str]
+
+        """
+        return self._fields
+
 
 class CSVRow(object):
     """A simple placeholder that may be used for the ``row_class`` parameter of :py:class:`CSVReader`."""
@@ -0,0 +1,469 @@
+# Imports
+
+from numbers import Number
+import os
+import pickle
+import tempfile
+from ..types import smart_cast
+from .library import make_row_class, CompactRow, CSVFile, CSVRow, KeywordMapping
+
+# Exports
+
+__all__ = (
+    "aggregate",
+    "distinct",
+    "filter_rows",
+    "group_by",
+    "to_csv_file",
+)
+
+# Functions
+
+
+def aggregate(rows, by=None, partitions=None, temp_directory=None, **aggregates):
+    """Calculate aggregate values in a single pass over the rows.
+
+    :param rows: The rows to be aggregated; for example, ``CSVFile.iter_rows()``.
+
+    :param by: The field name or names by which rows are grouped. If omitted, all rows are aggregated together.
+    :type by: str | list[str]
+
+    :param partitions: Spill rows to this number of temporary files (by hash of the group) and aggregate one file at
+                       a time. This limits memory use when there are many groups. It is ignored when ``by`` is omitted,
+                       since there is then only one group.
+    :type partitions: int
+
+    :param temp_directory: The directory in which partitions are written. Defaults to the system temporary directory.
+    :type temp_directory: str
+
+    :rtype: list[dict]
+    :returns: A row for each group, including the ``by`` fields and the aggregate values.
+
+    :raise: ValueError
+
+    Keyword arguments define the aggregates in the form ``name=(function, field_name)``. The function may be one of
+    ``"count"``, ``"max"``, ``"mean"``, ``"min"``, or ``"sum"``, or a callable that accepts a list of values, such as
+    :py:func:`commonkit.math.library.median`. ``None`` values are ignored. A count may be given as just ``"count"`` to
+    count the rows of each group. Aggregate names may not be the same as the parameters of this function. Values are read
+    from a CSV file as strings unless they are included in ``smart_cast_fields``, so the ``"sum"`` and ``"mean"`` of a
+    string are calculated from its ``smart_cast()`` value; a value that is not a number raises ``ValueError``.
+
+    The built-in functions keep only a running value, but a callable receives every value of the group, so those values
+    are held in memory until the group is finished. Partitioning bounds the number of groups held at once, not the size
+    of a single group.
+
+    .. code-block:: python
+
+        from commonkit.csv import aggregate, AutoMapping, CSVFile
+        from commonkit.math import median
+
+        csv = CSVFile("path.csv", mapping=AutoMapping(), smart_cast_fields=["salary"])
+        results = aggregate(
+            csv.iter_rows(),
+            by="job_title",
+            people="count",
+            total=("sum", "salary"),
+            typical=(median, "salary")
+        )
+
+    """
+    fields = _get_fields(by)
+    aggregators = [(name, _Aggregator(spec)) for name, spec in aggregates.items()]
+
+    if partitions and fields:
+        results = list()
+        for partition in _partition(rows, fields, partitions, temp_directory):
+            results += _aggregate(partition, fields, aggregators)
+
+        return results
+
+    return _aggregate(rows, fields, aggregators)
+
+
+def distinct(rows, fields=None, partitions=None, temp_directory=None):
+    """Get the first row for each unique value.
+
+    :param rows: The rows to be evaluated.
+
+    :param fields: The field name or names that identify a unique row. If omitted, all values of the row are used.
+    :type fields: str | list[str]
+
+    :param partitions: Spill rows to this number of temporary files (by hash of the key) and find the unique rows of
+                       one file at a time. This limits memory use when there are many unique values, but the rows are
+                       no longer yielded in their original order.
+    :type partitions: int
+
+    :param temp_directory: The directory in which partitions are written. Defaults to the system temporary directory.
+    :type temp_directory: str
+
+    :rtype: collections.Iterable
+    :returns: Yields the unique rows.
+
+    """
+    _fields = _get_fields(fields)
+
+    if partitions:
+        for partition in _partition(rows, _fields, partitions, temp_directory):
+            for row in _distinct(partition, _fields):
+                yield row
+
+        return
+
+    for row in _distinct(rows, _fields):
+        yield row
+
+
+def filter_rows(rows, callback=None, **criteria):
+    """Filter rows as they are iterated.
+
+    :param rows: The rows to be filtered.
+
+    :param callback: A callable that accepts a row and returns ``True`` if the row should be included.
+
+    :rtype: collections.Iterable
+    :returns: Yields the rows that match the callback (if given) *and* all criteria.
+
+    Keyword arguments are field name and value pairs that must be matched. The value may also be a list or tuple of
+    acceptable values.
+
+    .. code-block:: python
+
+        rows = filter_rows(csv.iter_rows(), lambda row: row['salary'] > 100000, job_title=["CEO", "CIO"])
+
+    """
+    conditions = list()
+    for field, value in criteria.items():
+        if type(value) in (list, tuple):
+            conditions.append((field, value))
+        else:
+            conditions.append((field, (value,)))
+
+    for row in rows:
+        if callback is not None and not callback(row):
+            continue
+
+        for field, values in conditions:
+            if _get_value(row, field) not in values:
+                break
+        else:
+            yield row
+
+
+def group_by(rows, fields, partitions=None, temp_directory=None):
+    """Group rows by the value of one or more fields.
+
+    :param rows: The rows to be grouped.
+
+    :param fields: The field name or names by which rows are grouped.
+    :type fields: str | list[str]
+
+    :param partitions: Spill rows to this number of temporary files (by hash of the group) and group one file at a
+                       time, so that only a portion of the rows is held in memory.
+    :type partitions: int
+
+    :param temp_directory: The directory in which partitions are written. Defaults to the system temporary directory.
+    :type temp_directory: str
+
+    :rtype: collections.Iterable
+    :returns: Yields a tuple of the group value(s) and the list of rows in the group.
+
+    .. note::
+        The rows of each group must be held in memory. Use ``aggregate()`` where possible.
+
+    """
+    _fields = _get_fields(fields)
+
+    if partitions:
+        for partition in _partition(rows, _fields, partitions, temp_directory):
+            for group in _group_by(partition, _fields):
+                yield group
+
+        return
+
+    for group in _group_by(rows, _fields):
+        yield group
+
+
+def to_csv_file(rows, path, fields=None):
+    """Create a CSV file instance for the given rows. The file is not written until ``write()`` is called.
+
+    :param rows: The rows of the file.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param fields: The field names, which are also used as column names. By default, these are taken from the first
+                   row.
+    :type fields: list[str]
+
+    :rtype: CSVFile
+
+    .. code-block:: python
+
+        results = aggregate(csv.iter_rows(), by="job_title", total=("sum", "salary"))
+        to_csv_file(results, "path/to/totals.csv").write()
+
+    """
+    _rows = list()
+    for row in rows:
+        if isinstance(row, CSVRow):
+            row = row.values
+
+        if fields is None:
+            fields = list(row.keys())
+
+        _rows.append(row)
+
+    mapping = KeywordMapping(**{field: field for field in fields or list()})
+
+    csv_file = CSVFile(path, mapping=mapping)
+    csv_file.rows = _rows
+    csv_file.is_loaded = True
+
+    return csv_file
+
+
+def _aggregate(rows, fields, aggregators):
+    """Calculate aggregates. See ``aggregate()``."""
+    groups = dict()
+    for row in rows:
+        key = _get_key(row, fields) if fields else ()
+
+        states = groups.get(key)
+        if states is None:
+            states = groups[key] = [aggregator.start() for name, aggregator in aggregators]
+
+        for index, (name, aggregator) in enumerate(aggregators):
+            states[index] = aggregator.step(states[index], row)
+
+    results = list()
+    for key, states in groups.items():
+        result = dict(zip(fields, key))
+        for index, (name, aggregator) in enumerate(aggregators):
+            result[name] = aggregator.finish(states[index])
+
+        results.append(result)
+
+    # Aggregating all rows produces a result even when there are no rows.
+    if not fields and not results:
+        results.append({name: aggregator.finish(aggregator.start()) for name, aggregator in aggregators})
+
+    return results
+
+
+def _distinct(rows, fields):
+    """Find unique rows. See ``distinct()``."""
+    seen = set()
+    for row in rows:
+        key = _get_key(row, fields)
+        if key in seen:
+            continue
+
+        seen.add(key)
+        yield row
+
+
+def _get_fields(fields):
+    """Normalize the given field or fields to a tuple."""
+    if fields is None:
+        return tuple()
+
+    if isinstance(fields, str):
+        return fields,
+
+    return tuple(fields)
+
+
+def _get_key(row, fields):
+    """Get the values of the given fields, or of the entire row when no fields are given, as a tuple."""
+    if fields:
+        return tuple([_get_value(row, field) for field in fields])
+
+    if isinstance(row, dict):
+        return tuple(row.values())
+
+    if isinstance(row, CSVRow):
+        return tuple(row.values.values())
+
+    return tuple(row)
+
+
+def _get_value(row, field):
+    """Get the value of a field from a dictionary, compact row, CSVRow, or other row class."""
+    if isinstance(row, CSVRow):
+        return row.values.get(field)
+
+    try:
+        return row[field]
+    except (KeyError, TypeError):
+        pass
+
+    # Methods such as tuple.count() and dict.items() are not values.
+    value = getattr(row, field, None)
+    if callable(value):
+        return None
+
+    return value
+
+
+def _group_by(rows, fields):
+    """Group rows. See ``group_by()``."""
+    groups = dict()
+    for row in rows:
+        key = _get_key(row, fields)
+        groups.setdefault(key, list()).append(row)
+
+    for key, group in groups.items():
+        yield key, group
+
+
+def _partition(rows, fields, partitions, temp_directory):
+    """Spill rows to temporary files by hash of the given fields.
+
+    :rtype: collections.Iterable
+    :returns: Yields an iterable of the rows of each partition.
+
+    """
+    paths = list()
+    streams = list()
+    try:
+        for index in range(partitions):
+            handle, path = tempfile.mkstemp(dir=temp_directory, prefix="partition-", suffix=".pickle")
+            paths.append(path)
+            streams.append(open(handle, "wb"))
+
+        for row in rows:
+            key = _get_key(row, fields)
+
+            # Generated compact row classes cannot be pickled, so the field names are stored with the values.
+            if isinstance(row, CompactRow):
+                record = (row.keys(), tuple(row))
+            else:
+                record = (None, row)
+
+            pickle.dump(record, streams[hash(key) % partitions], protocol=pickle.HIGHEST_PROTOCOL)
+
+        for stream in streams:
+            stream.close()
+
+        for path in paths:
+            yield _read_partition(path)
+    finally:
+        for stream in streams:
+            stream.close()
+
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _read_partition(path):
+    """Read the rows of a partition written by ``_partition()``."""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                fields, row = pickle.load(f)
+            except EOFError:
+                break
+
+            if fields is not None:
+                row = make_row_class(fields)(row)
+
+            yield row
+
+        f.close()
+
+
+# Classes
+
+
+class _Aggregator(object):
+    """Calculates an aggregate value from a stream of rows. See ``aggregate()``."""
+
+    FUNCTIONS = ("count", "max", "mean", "min", "sum")
+
+    def __init__(self, spec):
+        """Initialize the aggregator.
+
+        :param spec: The function and field name.
+        :type spec: str | tuple
+
+        :raise: ValueError
+
+        """
+        if isinstance(spec, str) or callable(spec):
+            spec = (spec, None)
+
+        self.function, self.field = spec
+
+        if not callable(self.function) and self.function not in self.FUNCTIONS:
+            raise ValueError("Unsupported aggregate: %s" % self.function)
+
+        if self.field is None and self.function != "count":
+            raise ValueError("A field name is required for the %s aggregate." % self.function)
+
+    def finish(self, state):
+        """Get the aggregate value from the final state."""
+        if callable(self.function):
+            return self.function(state)
+
+        if self.function == "mean":
+            total, count = state
+            return float(total / count) if count else None
+
+        return state
+
+    def start(self):
+        """Get the initial state."""
+        if self.function == "count":
+            return 0
+
+        if self.function == "mean":
+            return 0, 0
+
+        if callable(self.function):
+            return list()
+
+        return None
+
+    def step(self, state, row):
+        """Update the state with the given row and return the new state."""
+        if self.field is None:
+            return state + 1
+
+        value = _get_value(row, self.field)
+        if value is None:
+            return state
+
+        if self.function == "count":
+            return state + 1
+
+        if self.function == "sum":
+            value = self._get_number(value)
+            return value if state is None else state + value
+
+        if self.function == "min":
+            return value if state is None or value < state else state
+
+        if self.function == "max":
+            return value if state is None or value > state else state
+
+        if self.function == "mean":
+            return state[0] + self._get_number(value), state[1] + 1
+
+        state.append(value)
+        return state
+
+    def _get_number(self, value):
+        """Get a value as a number, casting strings (as read from a CSV file) with ``smart_cast()``.
+
+        :raise: ValueError
+
+        """
+        if isinstance(value, str):
+            value = smart_cast(value)
+
+        if type(value) is bool or not isinstance(value, Number):
+            raise ValueError("The %s of %s requires numbers: %r" % (self.function, self.field, value))
+
+        return value
@@ -0,0 +1,256 @@
+# Imports
+
+import csv
+import heapq
+import os
+import tempfile
+from ..files import open_file
+from ..types import smart_cast
+
+# Exports
+
+__all__ = (
+    "sort_csv",
+)
+
+# Constants
+
+ROW_OVERHEAD = 64
+"""The approximate number of bytes used by each row (and each value) in addition to the characters of the values. Used
+to estimate memory use when sorting."""
+
+# Functions
+
+
+def sort_csv(path, out, key, buffer_size=-1, cast=True, deduplicate=False, encoding="utf-8",
+             first_row_field_names=True, memory_limit=64 * 1024 * 1024, merge_limit=256, reverse=False,
+             temp_directory=None, **kwargs):
+    """Sort a CSV file that may be larger than available memory.
+
+    :param path: The path to the file to be sorted.
+    :type path: str
+
+    :param out: The path to which the sorted file is written.
+    :type out: str
+
+    :param key: The column name or names by which the file is sorted. When ``first_row_field_names`` is ``False``,
+                these are column indexes.
+    :type key: str | int | list[str] | list[int]
+
+    :param buffer_size: The size of the read and write buffers in bytes. See :py:func:`commonkit.files.open_file`.
+    :type buffer_size: int
+
+    :param cast: Compare key values using :py:func:`commonkit.types.smart_cast`, so that (for example) ``10`` sorts
+                 after ``9``. Numbers sort before other values.
+    :type cast: bool
+
+    :param deduplicate: Write only the first row for each key.
+    :type deduplicate: bool
+
+    :param encoding: The encoding of the file.
+    :type encoding: str
+
+    :param first_row_field_names: Indicates the first row contains the column names. The column row is written first
+                                  to the output.
+    :type first_row_field_names: bool
+
+    :param memory_limit: The approximate number of bytes of rows to hold in memory before a sorted run is written to a
+                         temporary file.
+    :type memory_limit: int
+
+    :param merge_limit: The maximum number of runs merged at once. When there are more runs, they are first merged
+                        into intermediate runs.
+    :type merge_limit: int
+
+    :param reverse: Sort in descending order.
+    :type reverse: bool
+
+    :param temp_directory: The directory in which runs are written. Defaults to the system temporary directory.
+    :type temp_directory: str
+
+    :rtype: int
+    :returns: The number of rows written, not including the column row.
+
+    :raise: ValueError
+
+    kwargs are passed to Python's ``csv.reader()`` and ``csv.writer()``.
+
+    .. code-block:: python
+
+        from commonkit.csv import sort_csv
+
+        sort_csv("path/to/people.csv.gz", "path/to/sorted.csv", key=["last_name", "salary"])
+
+    The file is read in chunks of (approximately) ``memory_limit`` bytes. Each chunk is sorted and written to a
+    temporary file. The runs are then merged using ``heapq.merge()``. Rows with the same key retain their original
+    order.
+
+    """
+    if merge_limit < 2:
+        raise ValueError("The merge_limit must be at least 2.")
+
+    keys = [key] if isinstance(key, (int, str)) else list(key)
+    runs = list()
+    temporary = list()
+
+    try:
+        with open_file(path, buffer_size=buffer_size, encoding=encoding, newline="") as f:
+            reader = csv.reader(f, **kwargs)
+
+            header = None
+            if first_row_field_names:
+                header = next(reader, None)
+                if header is None:
+                    header = list()
+
+                indexes = list()
+                for name in keys:
+                    if name not in header:
+                        raise ValueError("Sort column does not exist in %s: %s" % (path, name))
+
+                    indexes.append(header.index(name))
+            else:
+                indexes = keys
+
+            key_function = _get_key_function(indexes, cast)
+
+            chunk = list()
+            size = 0
+            for row in reader:
+                chunk.append(row)
+                size += ROW_OVERHEAD * (len(row) + 1) + sum(map(len, row))
+                if size >= memory_limit:
+                    chunk.sort(key=key_function, reverse=reverse)
+                    run = _write_run(chunk, encoding, temp_directory, **kwargs)
+                    runs.append(run)
+                    temporary.append(run)
+                    chunk = list()
+                    size = 0
+
+            f.close()
+
+        chunk.sort(key=key_function, reverse=reverse)
+
+        # Reduce the number of runs so that they (and the last chunk) may be opened at the same time. Runs are merged in
+        # order so that rows with the same key retain their original order.
+        while len(runs) + 1 > merge_limit:
+            merged = list()
+            for start in range(0, len(runs), merge_limit):
+                run = _merge_runs(runs[start:start + merge_limit], key_function, encoding, reverse, temp_directory,
+                                  **kwargs)
+                merged.append(run)
+                temporary.append(run)
+
+            runs = merged
+
+        streams = list()
+        try:
+            for run in runs:
+                streams.append(open(run, "r", encoding=encoding, newline=""))
+
+            sources = [csv.reader(stream, **kwargs) for stream in streams]
+            sources.append(chunk)
+
+            if len(sources) == 1:
+                rows = chunk
+            else:
+                rows = heapq.merge(*sources, key=key_function, reverse=reverse)
+
+            count = 0
+            with open_file(out, "w", buffer_size=buffer_size, encoding=encoding, newline="") as f:
+                writer = csv.writer(f, **kwargs)
+
+                if header is not None:
+                    writer.writerow(header)
+
+                previous_key = None
+                for row in rows:
+                    if deduplicate:
+                        current_key = key_function(row)
+                        if count > 0 and current_key == previous_key:
+                            continue
+
+                        previous_key = current_key
+
+                    writer.writerow(row)
+                    count += 1
+
+                f.close()
+        finally:
+            for stream in streams:
+                stream.close()
+    finally:
+        for run in temporary:
+            if os.path.exists(run):
+                os.remove(run)
+
+    return count
+
+
+def _get_key_function(indexes, cast):
+    """Get the function that produces the sort key of a row.
+
+    :param indexes: The indexes of the key columns.
+    :type indexes: list[int]
+
+    :param cast: Indicates whether values are cast before comparison.
+    :type cast: bool
+
+    :rtype: callable
+
+    """
+    def get_value(value):
+        value = smart_cast(value)
+        if isinstance(value, (float, int)):
+            return 0, value
+
+        return 1, str(value)
+
+    if cast:
+        def get_key(row):
+            return tuple([get_value(row[index]) if index < len(row) else (1, "") for index in indexes])
+    else:
+        def get_key(row):
+            return tuple([row[index] if index < len(row) else "" for index in indexes])
+
+    return get_key
+
+
+def _merge_runs(runs, key_function, encoding, reverse, temp_directory, **kwargs):
+    """Merge runs into a new run.
+
+    :rtype: str
+    :returns: The path to the new run.
+
+    """
+    streams = list()
+    try:
+        for run in runs:
+            streams.append(open(run, "r", encoding=encoding, newline=""))
+
+        readers = [csv.reader(stream, **kwargs) for stream in streams]
+        return _write_run(heapq.merge(*readers, key=key_function, reverse=reverse), encoding, temp_directory,
+                          **kwargs)
+    finally:
+        for stream in streams:
+            stream.close()
+
+        for run in runs:
+            if os.path.exists(run):
+                os.remove(run)
+
+
+def _write_run(rows, encoding, temp_directory, **kwargs):
+    """Write sorted rows to a temporary file.
+
+    :rtype: str
+    :returns: The path to the file.
+
+    """
+    handle, path = tempfile.mkstemp(dir=temp_directory, prefix="sort-", suffix=".csv")
+    with open(handle, "w", encoding=encoding, newline="") as f:
+        writer = csv.writer(f, **kwargs)
+        writer.writerows(rows)
+        f.close()
+
+    return path
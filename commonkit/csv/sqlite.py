@@ -0,0 +1,182 @@
+# Imports
+
+from itertools import chain, islice
+import re
+from ..types import is_float, is_integer
+from .library import CSVRow
+
+# Exports
+
+__all__ = (
+    "to_sqlite",
+)
+
+# Constants
+
+SQL_TYPES = ("INTEGER", "REAL", "TEXT")
+"""The column types used by ``to_sqlite()``, in order of precedence. A column takes the last type required by any of
+its values."""
+
+_LEADING_ZERO_PATTERN = re.compile(r"^\s*[-+]?0\d")
+"""Matches strings such as zip codes and identifiers whose leading zeros would be lost if stored as a number."""
+
+# Functions
+
+
+def to_sqlite(csv_file, table, path="memory", batch_size=1000, indexes=None, prefix=None, replace=True,
+              sample_size=1000, types=None):
+    """Load the rows of a CSV file into an SQLite table.
+
+    :param csv_file: The CSV file. If it has not been read, rows are streamed from the file. A mapping is required.
+    :type csv_file: commonkit.csv.library.CSVFile
+
+    :param table: The name of the table to be created.
+    :type table: str
+
+    :param path: The path to the database file or ``memory`` for an in-memory database.
+    :type path: str
+
+    :param batch_size: The number of rows inserted at once. All rows are inserted within a single transaction.
+    :type batch_size: int
+
+    :param indexes: Column names (or tuples of column names) on which indexes are created after the rows are loaded.
+    :type indexes: list[str | tuple[str]]
+
+    :param prefix: A prefix to be added to table names. See :py:class:`commonkit.database.library.Database`.
+    :type prefix: str
+
+    :param replace: Drop the table if it already exists. Otherwise, rows are added to the existing table.
+    :type replace: bool
+
+    :param sample_size: The number of rows used to infer column types.
+    :type sample_size: int
+
+    :param types: The SQL types of columns by field name. These take precedence over inferred types.
+    :type types: dict
+
+    :rtype: commonkit.database.library.Database
+    :returns: The database, ready for queries such as ``select()`` and ``sum()``.
+
+    :raise: ValueError
+
+    .. code-block:: python
+
+        from commonkit.csv import to_sqlite, AutoMapping, CSVFile
+
+        csv = CSVFile("path/to/people.csv", mapping=AutoMapping(), smart_cast_fields=["salary"])
+        db = to_sqlite(csv, "people", indexes=["job_title"])
+
+        result = db.select("people", job_title="CEO")
+        print(db.average("salary", "people").aggregate)
+
+    Column types are inferred from the first ``sample_size`` rows. Integers (including booleans) are stored as
+    ``INTEGER``, floats as ``REAL``, and everything else as ``TEXT``. String values that look like numbers are
+    identified as numbers too, so columns that are not included in ``smart_cast_fields`` are also typed. Strings with a
+    leading zero, such as the zip code ``02134``, are ``TEXT`` so that they are stored as given.
+
+    .. note::
+        Requires SQLAlchemy. See :py:mod:`commonkit.database`.
+
+    """
+    # SQLAlchemy is an optional dependency.
+    from ..database import load_database
+
+    if csv_file.mapping is None:
+        raise ValueError("A mapping is required to identify the columns of %s." % csv_file.path)
+
+    db = load_database("sqlite", path=path, prefix=prefix)
+    # noinspection PyProtectedMember
+    _table = _quote(db._prefix_table(table))
+
+    rows = csv_file.rows if csv_file.is_loaded else csv_file.iter_rows()
+    rows = (_get_values(row) for row in rows)
+
+    sample = list(islice(rows, sample_size))
+    columns = _get_columns(sample, csv_file.get_column_names())
+
+    _types = _get_types(sample, columns)
+    if types is not None:
+        _types.update(types)
+
+    if replace:
+        result = db.raw("DROP TABLE IF EXISTS %s" % _table)
+        if not result.success:
+            raise ValueError(result.error)
+
+    definitions = ", ".join(["%s %s" % (_quote(column), _types[column]) for column in columns])
+    result = db.raw("CREATE TABLE IF NOT EXISTS %s (%s)" % (_table, definitions))
+    if not result.success:
+        raise ValueError(result.error)
+
+    result = db.insert_many(table, chain(sample, rows), batch_size=batch_size, columns=columns)
+    if not result.success:
+        raise ValueError(result.error)
+
+    for index in indexes or list():
+        _columns = [index] if isinstance(index, str) else list(index)
+        name = _quote("%s_%s" % (db._prefix_table(table), "_".join(_columns)))
+        statement = "CREATE INDEX IF NOT EXISTS %s ON %s (%s)" % (name, _table, ", ".join(map(_quote, _columns)))
+        result = db.raw(statement)
+        if not result.success:
+            raise ValueError(result.error)
+
+    return db
+
+
+def _get_columns(sample, column_names):
+    """Get the column names from the mapping or, if not yet available, from the first row."""
+    if sample:
+        return list(sample[0].keys())
+
+    return list(column_names or list())
+
+
+def _get_types(sample, columns):
+    """Infer the SQL type of each column from a sample of rows.
+
+    :rtype: dict
+
+    """
+    precedence = dict()
+    for column in columns:
+        precedence[column] = None
+
+    for row in sample:
+        for column in columns:
+            value = row.get(column)
+            if value is None or precedence[column] == len(SQL_TYPES) - 1:
+                continue
+
+            if isinstance(value, str) and _LEADING_ZERO_PATTERN.match(value):
+                _type = 2
+            elif isinstance(value, (bool, int)) or (isinstance(value, str) and is_integer(value, cast=True)):
+                _type = 0
+            elif isinstance(value, float) or (isinstance(value, str) and is_float(value)):
+                _type = 1
+            else:
+                _type = 2
+
+            if precedence[column] is None or _type > precedence[column]:
+                precedence[column] = _type
+
+    types = dict()
+    for column, _type in precedence.items():
+        types[column] = SQL_TYPES[_type if _type is not None else -1]
+
+    return types
+
+
+def _get_values(row):
+    """Get the values of a row as a dictionary."""
+    if isinstance(row, CSVRow):
+        return row.values
+
+    if isinstance(row, dict):
+        return row
+
+    return dict(row)
+
+
+def _quote(identifier):
+    """Quote an SQL identifier."""
+    return '"%s"' % identifier.replace('"', '""')
@@ -0,0 +1,493 @@
+# Imports
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from decimal import Decimal, InvalidOperation
+import re
+from ..constants import BOOLEAN_VALUES
+from ..files import open_file
+from ..regex import DECIMAL_PATTERN, EMAIL_PATTERN
+from .library import AutoMapping, IndexMapping, KeywordMapping
+
+# Exports
+
+__all__ = (
+    "Field",
+    "FieldError",
+    "Schema",
+    "ValidationResult",
+)
+
+# Functions
+
+
+def _validate_chunk(columns, none_type_values, start, rows):
+    """Validate the values of a chunk of rows. This is a module-level function so that it may be run in a worker
+    process.
+
+    :param columns: The column index and field of each field to be checked.
+    :type columns: list[(int, Field)]
+
+    :param none_type_values: Values that are considered empty.
+    :type none_type_values: frozenset
+
+    :param start: The row number of the first row.
+    :type start: int
+
+    :param rows: The rows from Python's ``csv.reader``.
+    :type rows: list[list[str]]
+
+    :rtype: list[FieldError]
+
+    """
+    errors = list()
+    for number, row in enumerate(rows, start):
+        length = len(row)
+        for index, field in columns:
+            value = row[index].strip() if index < length else ""
+            if not value or value in none_type_values:
+                if field.required:
+                    errors.append(FieldError(number, index, field.name, "Value is required."))
+
+                continue
+
+            message = field.check(value)
+            if message is not None:
+                errors.append(FieldError(number, index, field.name, message, value))
+
+    return errors
+
+
+# Classes
+
+
+class Field(object):
+    """The validation rules of a field."""
+
+    TYPES = ("bool", "decimal", "email", "float", "integer", "string")
+    """The supported values of ``type``."""
+
+    def __init__(self, name, choices=None, maximum=None, minimum=None, pattern=None, required=False, type=None,
+                 unique=False):
+        """Initialize a field.
+
+        :param name: The field name as produced by the mapping of the CSV file. For a file without a mapping, this is
+                     the index of the column.
+        :type name: str | int
+
+        :param choices: The acceptable values.
+        :type choices: list | tuple
+
+        :param maximum: The maximum value (inclusive). For ``string`` fields, the maximum length. Not supported for
+                        ``bool`` and ``email`` fields.
+
+        :param minimum: The minimum value (inclusive). For ``string`` fields, the minimum length. Not supported for
+                        ``bool`` and ``email`` fields.
+
+        :param pattern: A regular expression that the whole value must match.
+        :type pattern: str | re.Pattern
+
+        :param required: Indicates a value must be given.
+        :type required: bool
+
+        :param type: One of ``TYPES``, or a callable that accepts the value and returns the cast value or raises
+                     ``ValueError``. Values are cast before ``choices``, ``maximum``, and ``minimum`` are checked.
+        :type type: str | callable
+
+        :param unique: Indicates the value may not be repeated.
+        :type unique: bool
+
+        :raise: ValueError
+
+        """
+        if type is not None and not callable(type) and type not in self.TYPES:
+            raise ValueError("Unsupported field type: %s" % type)
+
+        if type in ("bool", "email") and (minimum is not None or maximum is not None):
+            raise ValueError("A minimum or maximum is not supported for %s fields: %s" % (type, name))
+
+        self.choices = choices
+        self.maximum = maximum
+        self.minimum = minimum
+        self.name = name
+        self.required = required
+        self.type = type or "string"
+        self.unique = unique
+
+        if pattern is not None and not hasattr(pattern, "fullmatch"):
+            pattern = re.compile(pattern)
+
+        self.pattern = pattern
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.name)
+
+    def check(self, value):
+        """Check a (non-empty) value.
+
+        :param value: The value to be checked.
+        :type value: str
+
+        :rtype: str | None
+        :returns: A message describing the problem, or ``None`` if the value is valid.
+
+        """
+        if self.pattern is not None and self.pattern.fullmatch(value) is None:
+            return "Value does not match the required pattern."
+
+        try:
+            value = self.cast(value)
+        except (TypeError, ValueError):
+            return "Value is not a valid %s." % (self.type if isinstance(self.type, str) else "value")
+
+        if self.choices is not None and value not in self.choices:
+            return "Value is not one of the acceptable choices."
+
+        if self.type == "string" and (self.minimum is not None or self.maximum is not None):
+            value = len(value)
+
+        # A callable type may return a value that cannot be compared with the minimum or maximum.
+        try:
+            if self.minimum is not None and value < self.minimum:
+                return "Value is less than %s." % self.minimum
+
+            if self.maximum is not None and value > self.maximum:
+                return "Value is greater than %s." % self.maximum
+        except TypeError:
+            return "Value cannot be compared with the minimum or maximum."
+
+        return None
+
+    def cast(self, value):
+        """Cast a value according to the field type.
+
+        :param value: The value.
+        :type value: str
+
+        :raise: ValueError
+
+        """
+        if callable(self.type):
+            return self.type(value)
+
+        if self.type == "string":
+            return value
+
+        if self.type == "integer":
+            return int(value)
+
+        if self.type == "float":
+            return float(value)
+
+        if self.type == "decimal":
+            if DECIMAL_PATTERN.match(value) is None:
+                raise ValueError(value)
+
+            try:
+                return Decimal(value)
+            except InvalidOperation:
+                raise ValueError(value)
+
+        if self.type == "email":
+            if EMAIL_PATTERN.match(value) is None:
+                raise ValueError(value)
+
+            return value
+
+        # bool
+        if value.lower() not in BOOLEAN_VALUES:
+            raise ValueError(value)
+
+        return value
+
+
+class FieldError(object):
+    """A problem found with the value of a field."""
+
+    def __init__(self, row, column, field, message, value=None):
+        """Initialize an error.
+
+        :param row: The number of the row in the file, starting at 1. When the first row contains the column names, it
+                    is row 1 and data begins on row 2.
+        :type row: int
+
+        :param column: The index of the column, starting at 0. This is ``None`` when the column is missing from the
+                       file.
+        :type column: int
+
+        :param field: The field name.
+        :type field: str | int
+
+        :param message: A description of the problem.
+        :type message: str
+
+        :param value: The value, if any.
+        :type value: str
+
+        """
+        self.column = column
+        self.field = field
+        self.message = message
+        self.row = row
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, FieldError) and self.to_tuple() == other.to_tuple()
+
+    def __repr__(self):
+        return "<%s row %s, column %s (%s): %s>" % (self.__class__.__name__, self.row, self.column, self.field,
+                                                    self.message)
+
+    def to_tuple(self):
+        """Export the error as a tuple of ``(row, column, field, message, value)``.
+
+        :rtype: tuple
+
+        """
+        return self.row, self.column, self.field, self.message, self.value
+
+
+class Schema(object):
+    """A collection of field rules used to validate a CSV file."""
+
+    def __init__(self, *fields, chunk_size=10000, max_errors=1000):
+        """Initialize a schema.
+
+        :param fields: The fields to be validated.
+        :type fields: Field
+
+        :param chunk_size: The number of rows validated together. When validating in parallel, each chunk is sent to a
+                           worker process.
+        :type chunk_size: int
+
+        :param max_errors: Stop validating once this number of errors has been found. ``None`` or ``0`` collects all
+                           errors.
+        :type max_errors: int
+
+        """
+        self.chunk_size = chunk_size
+        self.fields = fields
+        self.max_errors = max_errors
+
+    def __repr__(self):
+        return "<%s %s fields>" % (self.__class__.__name__, len(self.fields))
+
+    def validate(self, csv_file, workers=None, **kwargs):
+        """Validate a CSV file. Rows are streamed from the file, and are not loaded into ``rows``.
+
+        :param csv_file: The file to be validated.
+        :type csv_file: commonkit.csv.library.CSVFile
+
+        :param workers: Validate chunks of rows in this number of processes. ``callable`` field types must then be
+                        importable, module-level functions.
+        :type workers: int
+
+        :rtype: ValidationResult
+
+        kwargs are passed to Python's ``csv.reader()``.
+
+        .. code-block:: python
+
+            from commonkit.csv import AutoMapping, CSVFile, Field, Schema
+
+            schema = Schema(
+                Field("email", required=True, type="email", unique=True),
+                Field("salary", type="integer", minimum=0),
+                Field("zip_code", pattern=r"[0-9]{5}"),
+            )
+
+            result = schema.validate(CSVFile("path/to/upload.csv", mapping=AutoMapping()))
+            if not result.is_valid:
+                for error in result.errors:
+                    print(error.row, error.column, error.message)
+
+        Empty values, including the ``none_type_values`` of the file, are only checked against ``required``. Unique
+        values are compared as they appear in the file.
+
+        """
+        result = ValidationResult()
+        none_type_values = frozenset(csv_file.get_none_type_values())
+
+        executor = None
+        pending = list()
+        if workers:
+            executor = ProcessPoolExecutor(max_workers=workers)
+
+        try:
+            with open_file(csv_file.path, buffer_size=csv_file.buffer_size, compression=csv_file.compression,
+                           encoding=csv_file.encoding, newline="") as f:
+                reader = csv.reader(f, **kwargs)
+
+                row_number = 1
+                header = None
+                if csv_file.first_row_field_names:
+                    header = next(reader, list())
+                    row_number = 2
+
+                columns = list()
+                for field in self.fields:
+                    index = self._get_column_index(field, csv_file.mapping, header)
+                    if index is None:
+                        if field.required:
+                            result.add(FieldError(1, None, field.name, "Column is missing."))
+
+                        continue
+
+                    columns.append((index, field))
+
+                unique = [(index, field.name, set()) for index, field in columns if field.unique]
+
+                if executor is None:
+                    for start, rows in self._get_chunks(reader, row_number):
+                        errors = _validate_chunk(columns, none_type_values, start, rows)
+                        errors += self._check_unique(unique, none_type_values, start, rows)
+                        if self._add_errors(result, errors, len(rows)):
+                            break
+                else:
+                    for start, rows in self._get_chunks(reader, row_number):
+                        future = executor.submit(_validate_chunk, columns, none_type_values, start, rows)
+                        pending.append((future, self._check_unique(unique, none_type_values, start, rows), len(rows)))
+
+                        # Limit the number of chunks held in memory.
+                        if len(pending) >= workers * 2:
+                            future, errors, count = pending.pop(0)
+                            if self._add_errors(result, future.result() + errors, count):
+                                break
+
+                    while pending and not result.is_truncated:
+                        future, errors, count = pending.pop(0)
+                        self._add_errors(result, future.result() + errors, count)
+
+                f.close()
+        finally:
+            if executor is not None:
+                for future, errors, count in pending:
+                    future.cancel()
+
+                executor.shutdown()
+
+        return result
+
+    def _add_errors(self, result, errors, count):
+        """Add the errors of a chunk to the result.
+
+        :rtype: bool
+        :returns: ``True`` if the maximum number of errors has been reached.
+
+        """
+        errors.sort(key=lambda e: (e.row, e.column))
+
+        result.rows += count
+        for error in errors:
+            if self.max_errors and len(result.errors) >= self.max_errors:
+                result.is_truncated = True
+                return True
+
+            result.add(error)
+
+        return False
+
+    # noinspection PyMethodMayBeStatic
+    def _check_unique(self, unique, none_type_values, start, rows):
+        """Check the unique fields of a chunk. This is done in the main process so that values are compared across
+        chunks.
+
+        :rtype: list[FieldError]
+
+        """
+        errors = list()
+        for index, name, seen in unique:
+            for number, row in enumerate(rows, start):
+                value = row[index].strip() if index < len(row) else ""
+                if not value or value in none_type_values:
+                    continue
+
+                if value in seen:
+                    errors.append(FieldError(number, index, name, "Value is not unique.", value))
+                else:
+                    seen.add(value)
+
+        return errors
+
+    def _get_chunks(self, reader, start):
+        """Read rows in chunks.
+
+        :rtype: collections.Iterable
+        :returns: Yields the row number of the first row and the rows of each chunk.
+
+        """
+        rows = list()
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= self.chunk_size:
+                yield start, rows
+                start += len(rows)
+                rows = list()
+
+        if rows:
+            yield start, rows
+
+    # noinspection PyMethodMayBeStatic
+    def _get_column_index(self, field, mapping, header):
+        """Get the index of the column for a field.
+
+        :rtype: int | None
+        :returns: The index or ``None`` if the column does not exist.
+
+        """
+        if isinstance(mapping, IndexMapping):
+            return mapping.fields.get(field.name)
+
+        if header is None:
+            return field.name if isinstance(field.name, int) else None
+
+        if isinstance(mapping, AutoMapping):
+            column_names = [mapping.slug(column_name, separator="_") for column_name in header]
+            name = field.name
+        elif isinstance(mapping, KeywordMapping):
+            column_names = header
+            name = mapping.fields.get(field.name)
+        else:
+            column_names = header
+            name = field.name
+
+        if name in column_names:
+            return column_names.index(name)
+
+        return None
+
+
+class ValidationResult(object):
+    """The result of validating a CSV file."""
+
+    def __init__(self):
+        self.errors = list()
+        self.is_truncated = False
+        self.rows = 0
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __repr__(self):
+        return "<%s %s rows, %s errors>" % (self.__class__.__name__, self.rows, len(self.errors))
+
+    def add(self, error):
+        """Add an error.
+
+        :param error: The error.
+        :type error: FieldError
+
+        """
+        self.errors.append(error)
+
+    @property
+    def is_valid(self):
+        """Indicates no errors were found.
+
+        :rtype: bool
+
+        """
+        return len(self.errors) == 0
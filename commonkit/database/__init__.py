@@ -123,6 +123,18 @@ Create, Read, Update, and Delete are supported.
     result = db.insert("page", values)
     print("Last ID: %s" % result.last_id)
 
+To add many records at once, use ``insert_many()``. The records are sent in batches within a single transaction, and
+none are added if any of them fails.
+
+.. code-block:: python
+
+    rows = [
+        {'title': "Page 2", 'body': "This is page 2."},
+        {'title': "Page 3", 'body': "This is page 3."},
+    ]
+    result = db.insert_many("page", rows, batch_size=500)
+    print("Added: %s" % result.count)
+
 **Read/Select**
 
 .. code-block:: python
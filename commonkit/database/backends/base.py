@@ -26,7 +26,7 @@ class Backend(object):
         self.params = kwargs
 
         # TODO: What exceptions may be raised on create_engine()?
-        self.engine = create_engine(self._get_url())
+        self.engine = create_engine(self._get_url(), **self._get_engine_options())
 
     def __enter__(self):
         return self
@@ -117,6 +117,15 @@ class Backend(object):
         """
         return self.__class__.__name__.lower()
 
+    # noinspection PyMethodMayBeStatic
+    def _get_engine_options(self):
+        """Get additional keyword arguments for ``create_engine()``.
+
+        :rtype: dict
+
+        """
+        return dict()
+
     def _get_url(self):
         """Get the connection URL.
 
@@ -1,6 +1,7 @@
 # Imports
 
 import os
+from sqlalchemy.pool import StaticPool
 from .base import Backend
 
 # Exports
@@ -25,6 +26,14 @@ class SQLite(Backend):
         _path = path or "tmp.db"
         super().__init__(path=_path, **kwargs)
 
+    def disconnect(self):
+        """Override to retain the connection of an in-memory database, which would otherwise lose its tables."""
+        if self.path == "memory":
+            self.is_open = False
+            return
+
+        super().disconnect()
+
     def get_database_name(self):
         """Override to return the base name of the path.
 
@@ -36,6 +45,16 @@ class SQLite(Backend):
 
         return os.path.basename(self.path)
 
+    def _get_engine_options(self):
+        """An in-memory database uses a single connection for the life of the engine."""
+        if self.path == "memory":
+            return {
+                'connect_args': {'check_same_thread': False},
+                'poolclass': StaticPool,
+            }
+
+        return dict()
+
     def _get_url(self):
         """Get the specific URL."""
         if self.path == "memory":
@@ -2,6 +2,7 @@
 
 from collections import OrderedDict
 from contextlib import contextmanager
+from itertools import islice
 from commonkit.types import is_string
 from sqlalchemy import text as query_to_text
 from .compat import tablib
@@ -180,6 +181,57 @@ class Database(object):
         # Return the query result.
         return query.run()
 
+    def insert_many(self, table, rows, batch_size=1000, columns=None):
+        """Add many records within a single transaction.
+
+        :param table: The table name.
+        :type table: str
+
+        :param rows: An iterable of dictionaries with the values of each record.
+
+        :param batch_size: The number of records sent to the database at once.
+        :type batch_size: int
+
+        :param columns: The column names. Defaults to the keys of the first row.
+        :type columns: list[str]
+
+        :rtype: Result
+        :returns: The query result. The ``count`` is the number of records added.
+
+        If any record cannot be added, none are added.
+
+        """
+        # Automatically prefix the table.
+        table = self._prefix_table(table)
+
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return Result("", count=0, success=True)
+
+        if columns is None:
+            columns = list(first.keys())
+
+        # Column names may not be valid bind parameter names, so the parameters are numbered.
+        parameters = ["p%s" % index for index in range(len(columns))]
+
+        # noinspection SqlDialectInspection
+        statement = "INSERT INTO %s (%s) VALUES (%s);" % (
+            table,
+            ", ".join(['"%s"' % column.replace('"', '""') for column in columns]),
+            ", ".join([":%s" % parameter for parameter in parameters])
+        )
+
+        def get_batches():
+            batch = [first]
+            while batch:
+                yield [dict(zip(parameters, [row.get(column) for column in columns])) for row in batch]
+                batch = list(islice(iterator, batch_size))
+
+        query = Query(self, Query.INSERT, statement=statement)
+
+        return query.run_many(get_batches())
+
     def max(self, column, table, **criteria):
         """Get the maximum value of a given column.
 
@@ -551,6 +603,33 @@ class Query(object):
 
         return result
 
+    def run_many(self, batches):
+        """Run the statement once for each set of bindings within a single transaction.
+
+        :param batches: An iterable of lists, each containing the bindings for a number of executions.
+
+        :rtype: Result
+
+        """
+        if self.db.debug:
+            message = "%s | (many)" % self.statement
+            if self.db.log is not None:
+                self.db.log.info(message)
+            else:
+                print("[DEBUG] %s" % message)
+
+        if not self.db.backend.is_open:
+            self.db.backend.connect()
+
+        with self.db.backend.get_session() as session:
+            result = session.raw_many(self.statement, batches)
+
+        self.db.backend.disconnect()
+
+        self.result = result
+
+        return result
+
 
 class Result(object):
     """Encapsulates the result of a query, populating attributes as appropriate.
@@ -856,6 +935,38 @@ class Session(object):
             except (OperationalError, ProgrammingError) as e:
                 return Result(statement, bindings=params, error=str(e), success=False)
 
+    def raw_many(self, statement, batches):
+        """Run a query statement for many sets of bindings within a single transaction.
+
+        :param statement: The query to execute.
+        :type statement: str
+
+        :param batches: An iterable of lists, each containing the bindings (dictionaries) for a number of executions.
+
+        :rtype: commonkit.database.library.Result
+
+        The transaction is rolled back if an error is encountered.
+
+        """
+        count = 0
+        error = None
+        with self.transaction() as transaction:
+            try:
+                _statement = query_to_text(statement)
+                for batch in batches:
+                    transaction.execute(_statement, batch)
+                    count += len(batch)
+            except Exception as e:
+                error = e
+
+                # Re-raise so that the transaction is rolled back.
+                raise
+
+        if error is not None:
+            return Result(statement, error=str(error), success=False)
+
+        return Result(statement, count=count, success=True)
+
     @contextmanager
     def transaction(self):
         """Allows execution of a query within a transaction.
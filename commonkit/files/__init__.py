@@ -30,6 +30,8 @@ Append content to a file.
 
     append_file("log.txt", "Something interesting has happened.")
 
+The file is opened in append mode, so the cost does not depend on the size of the file.
+
 copy_file
 .........
 
@@ -41,6 +43,17 @@ Copy a file from one location to another.
 
     copy_file("readme-template.txt", "path/to/project/readme.txt")
 
+Large files are copied within the kernel where possible; by cloning the file on file systems that support it, or with
+``os.copy_file_range()`` or ``os.sendfile()``. The ``chunk_size`` controls the number of bytes copied at a time, and a
+``progress`` callback receives the number of bytes copied and the total after each chunk.
+
+.. code-block:: python
+
+    def report(copied, total):
+        print("%s%%" % int(copied / total * 100))
+
+    copy_file("path/to/artifact.tar", "path/to/release/artifact.tar", chunk_size=64 * 1024 * 1024, progress=report)
+
 copy_tree
 .........
 
@@ -53,6 +66,31 @@ Recursively copy a source directory to a given destination.
     success = copy_tree("from/path", "to/path")
     print(success)
 
+For repeated copies, such as deployments, use ``incremental`` to skip files whose size and modification time already
+match (or, with ``checksum``, whose content matches), ``delete`` to remove files that no longer exist in the source, and
+``workers`` to copy files in parallel threads. With ``summary``, a :py:class:`commonkit.files.library.CopySummary` is
+returned.
+
+.. code-block:: python
+
+    result = copy_tree("from/path", "to/path", delete=True, incremental=True, summary=True, workers=8)
+    print(result.copied, result.skipped, result.deleted, result.failed)
+
+find_duplicates
+...............
+
+Find files with the same content in a directory tree.
+
+.. code-block:: python
+
+    from commonkit import find_duplicates
+
+    for paths in find_duplicates("path/to/photos", workers=8):
+        print(paths)
+
+Files are compared by size, then by a hash of their first and last blocks, and only then by a hash of their full
+content, so most files are never read in full.
+
 get_files
 .........
 
@@ -64,6 +102,65 @@ Get the file names in a a given directory.
 
     files = get_files("path/to/location")
 
+hash_file
+.........
+
+Get the hash of a file's content. The file is read in chunks, and any ``hashlib`` algorithm may be used.
+
+.. code-block:: python
+
+    from commonkit import hash_file
+
+    print(hash_file("path/to/release.tar.gz", algorithm="blake2b"))
+
+iter_files
+..........
+
+Iterate over the files of a directory tree, with optional filters. Unlike ``get_files()``, sub-directories are searched
+and paths are yielded as they are found.
+
+.. code-block:: python
+
+    from commonkit import iter_files
+
+    for path in iter_files("path/to/project", extensions=[".py"], ignore=["__pycache__", "build"], max_depth=3):
+        print(path)
+
+Hidden files and directories are skipped unless ``hidden=True``. Use ``pattern`` (a glob applied to the file name) or
+``regex`` (searched in the path relative to the directory) for additional filtering.
+
+map_file
+........
+
+Map a file into memory to search it without reading it into a string. Searches use bytes.
+
+.. code-block:: python
+
+    from commonkit import map_file
+
+    with map_file("path/to/server.log") as f:
+        print("%s errors" % f.count(b"ERROR"))
+
+        for match in f.search(rb"user=([a-z]+)"):
+            print(match.group(1))
+
+open_file
+.........
+
+Open a file, transparently decompressing (or compressing) files that use gzip, bzip2, or xz compression. The format is
+identified by the file extension (``.gz``, ``.bz2``, ``.xz``) and, when reading, by the first bytes of the file.
+
+.. code-block:: python
+
+    from commonkit import open_file
+
+    with open_file("path/to/archive.csv.gz", buffer_size=1024 * 1024) as f:
+        for line in f:
+            print(line)
+
+The same detection is used by ``read_csv()``, ``read_file()``, and ``write_file()``, so compressed files may be used
+without first decompressing them. Pass ``compression=False`` to open a file as is.
+
 parse_jinja_template
 ....................
 
@@ -82,6 +179,25 @@ Parse a Jinja 2 template.
 
     output = parse_jinja_template(template, context)
 
+The Jinja environment of each template directory is created once and reused, so a template is only parsed again when it
+changes. To also keep compiled templates between runs, give a directory for the ``bytecode_cache``:
+
+.. code-block:: python
+
+    output = parse_jinja_template(template, context, bytecode_cache="path/to/.jinja-cache")
+
+
+read_chunks
+...........
+
+Read a file in chunks of text or (with ``binary=True``) bytes.
+
+.. code-block:: python
+
+    from commonkit import read_chunks
+
+    for chunk in read_chunks("path/to/large.bin", binary=True, chunk_size=8 * 1024 * 1024):
+        process(chunk)
 
 read_csv
 ........
@@ -120,6 +236,33 @@ Read a file and return its contents.
     print(output)
 
 
+read_lines
+..........
+
+Read the lines of a (possibly compressed) file one at a time, without line endings.
+
+.. code-block:: python
+
+    from commonkit import read_lines
+
+    for line in read_lines("path/to/access.log.gz"):
+        print(line)
+
+tree_stats
+..........
+
+Get the total size and number of files of a directory tree, with a breakdown by extension and by sub-directory.
+
+.. code-block:: python
+
+    from commonkit import tree_stats
+
+    stats = tree_stats("/var/www", cache="/var/cache/www-stats.json")
+    print("%s files, %s bytes" % (stats.files, stats.size))
+
+The sub-directories of the path are walked in parallel threads. When a ``cache`` file is given, directories that have
+not been modified since the last call are not scanned again.
+
 write_file
 ..........
 
@@ -131,6 +274,24 @@ Write a file.
 
     write_file("path/to/readme.txt", "This is a test.")
 
+write_files
+...........
+
+Write many files at once using a pool of threads. By default, each file is written to a temporary file that then
+replaces the original, so a partially written file is never seen.
+
+.. code-block:: python
+
+    from commonkit import write_files, WRITE
+
+    results = write_files({"www/index.html": home, "www/about/index.html": about}, skip_unchanged=True)
+    for path, (status, error) in results.items():
+        if status == WRITE.FAILED:
+            print(error)
+
+Directories are created as needed, and with ``skip_unchanged`` files that already have the same content are not
+written.
+
 The File Class
 ..............
 
@@ -151,7 +312,25 @@ For more robust handling of paths, see `pathlib`_.
     print("Name: %s" % f.name
     print("Name Without Extension: %s" % f.basename)
     print("Extension: %s" % f.extension)
+
+The FileAppender Class
+......................
+
+The :py:class:`commonkit.files.library.FileAppender` class buffers lines and appends them in batches, which suits
+frequent writes such as an audit trail.
+
+.. code-block:: python
+
+    from commonkit import FileAppender
+
+    appender = FileAppender("path/to/audit.log", flush_size=64 * 1024, fsync=True, interval=1.0)
+    appender.write("User bob logged in.")
+    appender.close()
+
+Lines are written once ``flush_size`` characters are buffered, every ``interval`` seconds, or when ``flush()`` or
+``close()`` is called.
 """
+from .constants import *
 from .library import *
 
 __version__ = "0.22.0-d"
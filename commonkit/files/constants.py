@@ -0,0 +1,31 @@
+# noinspection PyPep8Naming
+class COMPRESSION:
+    """The compression formats supported by ``open_file()``."""
+    BZ2 = "bz2"
+    GZIP = "gzip"
+    XZ = "xz"
+
+    EXTENSIONS = {
+        '.bz2': BZ2,
+        '.gz': GZIP,
+        '.gzip': GZIP,
+        '.lzma': XZ,
+        '.xz': XZ,
+    }
+    """File extensions (including the dot) and the compression they indicate."""
+
+    MAGIC = (
+        # "BZh" is followed by the block size, 1 to 9.
+        ((b"BZh1", b"BZh2", b"BZh3", b"BZh4", b"BZh5", b"BZh6", b"BZh7", b"BZh8", b"BZh9"), BZ2),
+        (b"\x1f\x8b", GZIP),
+        (b"\xfd7zXZ\x00", XZ),
+    )
+    """Leading bytes of a file (or a tuple of alternatives) and the compression they indicate."""
+
+
+# noinspection PyPep8Naming
+class WRITE:
+    """The status of each file written by ``write_files()``."""
+    FAILED = "failed"
+    UNCHANGED = "unchanged"
+    WRITTEN = "written"
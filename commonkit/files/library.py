@@ -1,32 +1,67 @@
 # Imports
 
+import bz2
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import csv
+import errno
+from fnmatch import fnmatch
+from functools import lru_cache
+import gzip
+import hashlib
 import io
+from itertools import repeat
+import json
 import logging
+import lzma
+import mmap
 import os
-from shutil import copy2
-from ..compat import JinjaEnvironment, JinjaLoader
+import re
+from shutil import copy2, copyfileobj, copystat
+from stat import S_IMODE, S_ISREG
+import threading
+import time
+import uuid
+from ..compat import JinjaBytecodeCache, JinjaEnvironment, JinjaLoader
+from .constants import COMPRESSION, WRITE
 
 logger = logging.getLogger(__name__)
 
+FICLONE = 0x40049409
+"""The Linux ioctl request used to clone a file."""
+
 # Exports
 
 __all__ = (
     "append_file",
     "copy_file",
     "copy_tree",
+    "find_duplicates",
+    "get_compression",
     "get_files",
+    "hash_file",
+    "iter_files",
+    "map_file",
+    "open_file",
     "parse_jinja_template",
+    "read_chunks",
     "read_csv",
     "read_file",
+    "read_lines",
+    "tree_stats",
     "write_file",
+    "write_files",
+    "CopySummary",
     "File",
+    "FileAppender",
+    "MappedFile",
+    "TreeStats",
 )
 
 # Functions
 
 
-def append_file(path, content, line_feed=True):
+def append_file(path, content, line_feed=True, compression=None, encoding="utf-8"):
     """Append content to a file.
 
     :param path: The path to the file.
@@ -38,22 +73,32 @@ def append_file(path, content, line_feed=True):
     :param line_feed: Automatically add a line feed before the content.
     :type line_feed: bool
 
+    :param compression: The compression format of the file. See ``open_file()``.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the file.
+    :type encoding: str
+
     :rtype: bool
 
+    The file is opened in append mode, so the existing content is neither read nor rewritten. To append many lines, see
+    :py:class:`FileAppender`.
+
     """
     if not os.path.exists(path):
         return False
 
-    _content = read_file(path)
     if line_feed:
-        _content += "\n%s" % content
+        content = "\n%s" % content
 
-    write_file(path, _content)
+    with open_file(path, "a", compression=compression, encoding=encoding) as f:
+        f.write(content)
+        f.close()
 
     return True
 
 
-def copy_file(from_path, to_path, make_directories=False):
+def copy_file(from_path, to_path, make_directories=False, chunk_size=8 * 1024 * 1024, progress=None, reflink=True):
     """Copy a file from one location to another.
 
     :param from_path: The source path.
@@ -65,6 +110,15 @@ def copy_file(from_path, to_path, make_directories=False):
     :param make_directories: Create directories as needed along the ``to_path``.
     :type make_directories: bool
 
+    :param chunk_size: The maximum number of bytes copied by each system call.
+    :type chunk_size: int
+
+    :param progress: A callable that receives the number of bytes copied so far and the total size after each chunk.
+    :type progress: callable
+
+    :param reflink: Clone the file (sharing the data blocks) when the file system supports it.
+    :type reflink: bool
+
     :rtype: tuple(bool, str)
     :returns: Success or failure and a message if failure.
 
@@ -74,20 +128,40 @@ def copy_file(from_path, to_path, make_directories=False):
 
         copy_file("readme-template.txt", "path/to/project/readme.txt")
 
+        def report(copied, total):
+            print("%s of %s bytes" % (copied, total))
+
+        copy_file("path/to/artifact.tar", "path/to/release/artifact.tar", progress=report)
+
+    Data is copied within the kernel where possible, using (in order of preference) a reflink clone,
+    ``os.copy_file_range()``, and ``os.sendfile()``. Other platforms fall back to reading and writing chunks. As with
+    ``shutil.copy2()``, file metadata is also copied.
+
     """
     if make_directories:
         base_path = os.path.dirname(to_path)
         if not os.path.exists(base_path):
             os.makedirs(base_path)
 
+    if os.path.isdir(to_path):
+        to_path = os.path.join(to_path, os.path.basename(from_path))
+
     try:
-        copy2(from_path, to_path)
+        # Opening the destination would truncate the source.
+        if os.path.exists(to_path) and os.path.samefile(from_path, to_path):
+            return False, "%s and %s are the same file" % (from_path, to_path)
+
+        with open(from_path, "rb") as source:
+            with open(to_path, "wb") as destination:
+                _copy_file_data(source, destination, chunk_size, progress=progress, reflink=reflink)
+
+        copystat(from_path, to_path)
         return True, None
     except IOError as e:
         return False, str(e)
 
 
-def copy_tree(from_path, to_path):
+def copy_tree(from_path, to_path, checksum=False, delete=False, incremental=False, summary=False, workers=None):
     """Recursively copy a source directory to a given destination.
 
     :param from_path: The source directory.
@@ -96,7 +170,23 @@ def copy_tree(from_path, to_path):
     :param to_path: The destination directory. This must already exist.
     :type to_path: str
 
-    :rtype: bool
+    :param checksum: When ``incremental``, compare the content of files of the same size rather than their modification
+                     times.
+    :type checksum: bool
+
+    :param delete: Remove files and directories from the destination that do not exist in the source.
+    :type delete: bool
+
+    :param incremental: Skip files whose size and modification time (or content) already match the destination.
+    :type incremental: bool
+
+    :param summary: Return a :py:class:`CopySummary` rather than a boolean.
+    :type summary: bool
+
+    :param workers: Copy files using this number of threads.
+    :type workers: int
+
+    :rtype: bool | CopySummary
     :returns: ``True`` if successful.
 
     .. note::
@@ -109,33 +199,199 @@ def copy_tree(from_path, to_path):
         success = copy_tree("from/path", "to/path")
         print(success)
 
+        result = copy_tree("from/path", "to/path", delete=True, incremental=True, summary=True, workers=8)
+        print("Copied %s, skipped %s files." % (len(result.copied), len(result.skipped)))
+
     """
     # Deal with absolutes and user expansion.
     source = os.path.abspath(os.path.expanduser(from_path))
     destination = os.path.abspath(os.path.expanduser(to_path))
 
+    result = CopySummary()
+
     if not os.path.exists(destination):
         logger.error("Destination does not exist: %s" % destination)
-        return False
+        result.failed.append((".", "Destination does not exist."))
+        return result if summary else False
 
     # Iterate through the source.
-    success = True
+    expected = set()
+    tasks = list()
     for root, dirs, files in os.walk(source):
-        directory_path = os.path.join(destination, os.path.relpath(root, source))
+        directory_path = os.path.normpath(os.path.join(destination, os.path.relpath(root, source)))
         if not os.path.exists(directory_path):
             os.mkdir(directory_path)
 
+        expected.add(directory_path)
+
         for f in files:
-            source_file = os.path.join(root, f)
             file_path = os.path.join(directory_path, f)
+            expected.add(file_path)
+            tasks.append((os.path.join(root, f), file_path))
+
+    def copy(task):
+        source_file, file_path = task
+        try:
+            if incremental and _is_same_file(source_file, file_path, checksum=checksum):
+                return task, None, False
+
+            copy2(source_file, file_path)
+            return task, None, True
+        except (IOError, OSError) as e:
+            return task, e, False
+
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(copy, tasks))
+    else:
+        results = map(copy, tasks)
+
+    for (source_file, file_path), error, copied in results:
+        relative_path = os.path.relpath(file_path, destination)
+        if error is not None:
+            logger.warning("Could not copy %s: %s" % (source_file, error))
+            result.failed.append((relative_path, str(error)))
+        elif copied:
+            result.copied.append(relative_path)
+        else:
+            result.skipped.append(relative_path)
+
+    if delete:
+        for root, dirs, files in os.walk(destination, topdown=False):
+            for name in files + dirs:
+                path = os.path.join(root, name)
+                if path in expected:
+                    continue
+
+                try:
+                    if os.path.isdir(path) and not os.path.islink(path):
+                        os.rmdir(path)
+                    else:
+                        os.remove(path)
+
+                    result.deleted.append(os.path.relpath(path, destination))
+                except OSError as e:
+                    logger.warning("Could not delete %s: %s" % (path, e))
+                    result.failed.append((os.path.relpath(path, destination), str(e)))
+
+    if summary:
+        return result
 
+    return result.success
+
+
+def find_duplicates(path, algorithm="sha256", block_size=64 * 1024, min_size=1, workers=None):
+    """Find files with the same content.
+
+    :param path: The directory to be searched, including sub-directories.
+    :type path: str
+
+    :param algorithm: The name of the ``hashlib`` algorithm used to compare content.
+    :type algorithm: str
+
+    :param block_size: The number of bytes at the start and at the end of a file that are compared before the whole
+                       file is hashed.
+    :type block_size: int
+
+    :param min_size: Ignore files smaller than this number of bytes. By default, empty files are ignored.
+    :type min_size: int
+
+    :param workers: The number of threads used to hash files. Defaults to that of ``ThreadPoolExecutor``.
+    :type workers: int
+
+    :rtype: list[list[str]]
+    :returns: Groups of two or more paths whose files have the same content.
+
+    .. code-block:: python
+
+        from commonkit import find_duplicates
+
+        for paths in find_duplicates("path/to/photos"):
+            print("Same content: %s" % ", ".join(paths))
+
+    Files are first grouped by size. Only files of the same size are compared by a hash of their first and last blocks,
+    and only files that still match are hashed in full, so most files are read partially (if at all). Symbolic links
+    and additional hard links to the same file are ignored.
+
+    """
+    sizes = dict()
+    inodes = set()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for f in sorted(files):
+            file_path = os.path.join(root, f)
             try:
-                copy2(source_file, file_path)
-            except IOError as e:
-                success = False
-                logger.warning("Could not copy %s: %s" % (source_file, e))
+                stat = os.lstat(file_path)
+            except OSError as e:
+                logger.warning("Could not read %s: %s" % (file_path, e))
+                continue
+
+            if not S_ISREG(stat.st_mode) or stat.st_size < min_size or (stat.st_dev, stat.st_ino) in inodes:
+                continue
+
+            inodes.add((stat.st_dev, stat.st_ino))
+            sizes.setdefault(stat.st_size, list()).append(file_path)
+
+    def get_partial_hash(file_path):
+        digest = hashlib.new(algorithm)
+        with open(file_path, "rb") as _f:
+            digest.update(_f.read(block_size))
+            if os.fstat(_f.fileno()).st_size > block_size:
+                _f.seek(-block_size, os.SEEK_END)
+                digest.update(_f.read(block_size))
+
+            _f.close()
+
+        return digest.hexdigest()
+
+    def regroup(groups, function):
+        # The index of the group is part of the key so that groups are only ever divided.
+        keys = [(index, file_path) for index, group in enumerate(groups) for file_path in group]
+        digests = executor.map(_safe_hash, [file_path for index, file_path in keys], repeat(function))
+
+        _groups = dict()
+        for (index, file_path), digest in zip(keys, digests):
+            if digest is not None:
+                _groups.setdefault((index, digest), list()).append(file_path)
+
+        return [group for group in _groups.values() if len(group) > 1]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        candidates = regroup([group for group in sizes.values() if len(group) > 1], get_partial_hash)
+
+        # The partial hash covers the whole file when it is no larger than two blocks.
+        duplicates = [group for group in candidates if os.path.getsize(group[0]) <= 2 * block_size]
+        remaining = [group for group in candidates if os.path.getsize(group[0]) > 2 * block_size]
+        duplicates += regroup(remaining, lambda file_path: hash_file(file_path, algorithm=algorithm))
+
+    return sorted(duplicates)
+
+
+def get_compression(path, detect=True):
+    """Get the compression format of a file.
+
+    :param path: The path to the file.
+    :type path: str
 
-    return success
+    :param detect: When the extension does not indicate compression, check the first bytes of the file (if it exists).
+    :type detect: bool
+
+    :rtype: str | None
+    :returns: One of the ``COMPRESSION`` formats or ``None`` if the file is not compressed.
+
+    """
+    extension = os.path.splitext(path)[-1].lower()
+    if extension in COMPRESSION.EXTENSIONS:
+        return COMPRESSION.EXTENSIONS[extension]
+
+    if not detect or not os.path.isfile(path):
+        return None
+
+    with io.open(path, "rb") as f:
+        compression = _detect_compression(f)
+        f.close()
+
+    return compression
 
 
 def get_files(path, extension=None, raise_exception=True):
@@ -176,7 +432,285 @@ def get_files(path, extension=None, raise_exception=True):
     return a
 
 
-def parse_jinja_template(path, context):
+def hash_file(path, algorithm="sha256", chunk_size=1024 * 1024):
+    """Get the hash of the content of a file. The file is read in chunks, so it need not fit in memory.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param algorithm: The name of the ``hashlib`` algorithm, such as ``md5``, ``sha1``, ``sha256``, or ``blake2b``.
+    :type algorithm: str
+
+    :param chunk_size: The number of bytes read at a time.
+    :type chunk_size: int
+
+    :rtype: str
+    :returns: The hexadecimal digest.
+
+    :raise: ValueError
+
+    .. code-block:: python
+
+        from commonkit import hash_file
+
+        print(hash_file("path/to/release.tar.gz", algorithm="blake2b"))
+
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+
+            digest.update(view[:count])
+
+        f.close()
+
+    return digest.hexdigest()
+
+
+def iter_files(path, entries=False, extensions=None, follow_links=False, hidden=False, ignore=None, max_depth=None,
+               pattern=None, regex=None):
+    """Iterate over the files in a directory and (optionally) its sub-directories.
+
+    :param path: The path to the directory.
+    :type path: str
+
+    :param entries: Yield the ``os.DirEntry`` of each file rather than its path. The entry caches the results of
+                    ``is_file()`` and ``stat()``.
+    :type entries: bool
+
+    :param extensions: Include only files with the given extension or extensions.
+    :type extensions: str | list[str]
+
+    :param follow_links: Descend into symbolic links to directories.
+    :type follow_links: bool
+
+    :param hidden: Include hidden files and directories; those whose names begin with a dot.
+    :type hidden: bool
+
+    :param ignore: Names or glob patterns of directories that are not searched; for example, ``__pycache__``.
+    :type ignore: list[str]
+
+    :param max_depth: The number of levels of sub-directories to search. ``0`` searches only the given directory.
+                      By default, there is no limit.
+    :type max_depth: int
+
+    :param pattern: A glob pattern that the file name must match; for example, ``test_*.py``.
+    :type pattern: str
+
+    :param regex: A regular expression that must be found in the path of the file relative to ``path``.
+    :type regex: str | re.Pattern
+
+    :raise: ValueError
+
+    :rtype: collections.Iterable
+    :returns: Yields the path (or entry) of each file. Files are not yielded in any particular order.
+
+    .. code-block:: python
+
+        from commonkit import iter_files
+
+        for path in iter_files("path/to/project", extensions=[".md", ".rst"], ignore=["build", "node_modules"]):
+            print(path)
+
+    Directories are read with ``os.scandir()``, so the file type is usually known without an additional system call,
+    and files are yielded as they are found rather than collected in a list.
+
+    """
+    if not os.path.isdir(path):
+        raise ValueError("The path provided to iter_files() must be a directory: %s" % path)
+
+    if isinstance(extensions, str):
+        extensions = (extensions,)
+    elif extensions is not None:
+        extensions = tuple(extensions)
+
+    if regex is not None and not hasattr(regex, "search"):
+        regex = re.compile(regex)
+
+    ignore = list(ignore or list())
+
+    # Each item is the directory path, its path relative to the top, and its depth.
+    directories = [(path, "", 0)]
+    while directories:
+        directory, relative_directory, depth = directories.pop()
+        try:
+            iterator = os.scandir(directory)
+        except OSError as e:
+            logger.warning("Could not read directory %s: %s" % (directory, e))
+            continue
+
+        with iterator:
+            for entry in iterator:
+                name = entry.name
+                if not hidden and name.startswith("."):
+                    continue
+
+                try:
+                    if entry.is_dir(follow_symlinks=follow_links):
+                        if max_depth is not None and depth >= max_depth:
+                            continue
+
+                        if any([fnmatch(name, _pattern) for _pattern in ignore]):
+                            continue
+
+                        directories.append((entry.path, os.path.join(relative_directory, name), depth + 1))
+                        continue
+
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                if extensions is not None and not name.endswith(extensions):
+                    continue
+
+                if pattern is not None and not fnmatch(name, pattern):
+                    continue
+
+                if regex is not None and regex.search(os.path.join(relative_directory, name)) is None:
+                    continue
+
+                yield entry if entries else entry.path
+
+
+@contextmanager
+def map_file(path, writable=False):
+    """Map a file into memory. Data is read from the file by the operating system as it is accessed, so large files may
+    be scanned without being loaded.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param writable: Allow the content of the file to be changed (but not resized).
+    :type writable: bool
+
+    :raise: ValueError
+
+    :rtype: MappedFile
+
+    .. code-block:: python
+
+        from commonkit import map_file
+
+        with map_file("path/to/server.log") as f:
+            print(f.count(b"ERROR"))
+            for offset in f.find_all(b"Traceback"):
+                print(f.get_line(offset))
+
+    .. note::
+        Compressed files cannot be mapped.
+
+    """
+    if get_compression(path, detect=False):
+        raise ValueError("A compressed file cannot be mapped: %s" % path)
+
+    with open(path, "r+b" if writable else "rb") as f:
+        # An empty file cannot be mapped.
+        if os.fstat(f.fileno()).st_size == 0:
+            mapped = MappedFile(path, bytearray() if writable else b"")
+        else:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            mapped = MappedFile(path, mmap.mmap(f.fileno(), 0, access=access))
+
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+            f.close()
+
+
+def open_file(path, mode="r", buffer_size=-1, compression=None, encoding="utf-8", newline=None):
+    """Open a file, transparently compressing or decompressing its content.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param mode: The mode in which the file is opened. Binary (``b``) modes return a binary stream.
+    :type mode: str
+
+    :param buffer_size: The size of the buffer in bytes. ``-1`` uses the default buffer size.
+    :type buffer_size: int
+
+    :param compression: The compression format; one of ``COMPRESSION.BZ2``, ``COMPRESSION.GZIP``, or
+                        ``COMPRESSION.XZ``. By default, this is identified by ``get_compression()``. Use ``False`` to
+                        open the file as is.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the file. Not used for binary modes.
+    :type encoding: str
+
+    :param newline: Controls line endings as with Python's ``open()``. Not used for binary modes.
+    :type newline: str
+
+    :raise: ValueError
+
+    :returns: A file object that may be used as a context manager.
+
+    .. code-block:: python
+
+        from commonkit import open_file
+
+        with open_file("path/to/data.csv.gz") as f:
+            for line in f:
+                print(line)
+
+    .. note::
+        Compression is identified by file extension, and when reading also by the first bytes of the file. Writing to
+        a compressed file uses the extension only.
+
+    """
+    binary = "b" in mode
+
+    if compression is None:
+        compression = get_compression(path, detect=False)
+
+        # Check the first bytes of the file, keeping the stream if it turns out to be uncompressed.
+        if compression is None and "r" in mode and "+" not in mode:
+            stream = io.open(path, "rb", buffering=buffer_size)
+            compression = _detect_compression(stream)
+            if not compression:
+                if binary:
+                    return stream
+
+                return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+
+            stream.close()
+
+    if not compression:
+        if binary:
+            return io.open(path, mode, buffering=buffer_size)
+
+        return io.open(path, mode, buffering=buffer_size, encoding=encoding, newline=newline)
+
+    openers = {
+        COMPRESSION.BZ2: bz2.open,
+        COMPRESSION.GZIP: gzip.open,
+        COMPRESSION.XZ: lzma.open,
+    }
+    if compression not in openers:
+        raise ValueError("Unsupported compression: %s" % compression)
+
+    _mode = mode.replace("t", "").replace("b", "") + "b"
+    stream = openers[compression](path, _mode)
+
+    if buffer_size > 0:
+        if "r" in _mode:
+            stream = io.BufferedReader(stream, buffer_size=buffer_size)
+        else:
+            stream = io.BufferedWriter(stream, buffer_size=buffer_size)
+
+    if binary:
+        return stream
+
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+
+
+def parse_jinja_template(path, context, bytecode_cache=None):
     """Parse a Jinja 2 template.
 
     :param path: Path to the template.
@@ -185,6 +719,10 @@ def parse_jinja_template(path, context):
     :param context: The context to be parsed into the template.
     :type context: dict
 
+    :param bytecode_cache: The directory in which compiled templates are stored, so that they need not be compiled
+                           again by subsequent processes.
+    :type bytecode_cache: str
+
     :rtype: str
 
     .. code-block:: python
@@ -200,9 +738,12 @@ def parse_jinja_template(path, context):
 
         output = parse_jinja_template(template, context)
 
+    The Jinja environment of each template directory is created once per process and reused, so templates that have
+    already been loaded (and have not changed) are not parsed again.
+
     """
-    search_path = os.path.dirname(path)
-    env = JinjaEnvironment(loader=JinjaLoader(search_path))
+    search_path = os.path.abspath(os.path.dirname(path))
+    env = _get_jinja_environment(search_path, bytecode_cache)
 
     template_name = os.path.basename(path)
     template = env.get_template(template_name)
@@ -210,7 +751,7 @@ def parse_jinja_template(path, context):
     return template.render(**context)
 
 
-def read_csv(path, encoding="utf-8", first_row_field_names=False, **kwargs):
+def read_csv(path, encoding="utf-8", first_row_field_names=False, buffer_size=-1, compression=None, **kwargs):
     """Read the contents of a CSV file.
 
     :param path: The path to the file.
@@ -224,6 +765,12 @@ def read_csv(path, encoding="utf-8", first_row_field_names=False, **kwargs):
 
     :type first_row_field_names: bool
 
+    :param buffer_size: The size of the read buffer in bytes. See ``open_file()``.
+    :type buffer_size: int
+
+    :param compression: The compression format of the file. By default, this is detected. See ``open_file()``.
+    :type compression: str | bool
+
     :rtype: list[list] || list[dict]
 
     kwargs are passed to Python's ``csv.DictReader`` (when ``first_row_field_names`` is ``True``) or ``csv.reader``.
@@ -247,7 +794,7 @@ def read_csv(path, encoding="utf-8", first_row_field_names=False, **kwargs):
             print("%s: %s" % (row['identifier'], row['url']
 
     """
-    with io.open(path, "r", encoding=encoding) as f:
+    with open_file(path, buffer_size=buffer_size, compression=compression, encoding=encoding) as f:
         if first_row_field_names:
             reader = csv.DictReader(f, **kwargs)
         else:
@@ -262,12 +809,58 @@ def read_csv(path, encoding="utf-8", first_row_field_names=False, **kwargs):
         return rows
 
 
-def read_file(path):
+def read_chunks(path, binary=False, chunk_size=1024 * 1024, compression=None, encoding="utf-8"):
+    """Read a file in chunks.
+
+    :param path: The path to the file.
+    :type path: str
+
+    :param binary: Yield bytes rather than strings.
+    :type binary: bool
+
+    :param chunk_size: The (maximum) size of each chunk; in bytes for binary chunks or characters otherwise.
+    :type chunk_size: int
+
+    :param compression: The compression format of the file. By default, this is detected. See ``open_file()``.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the file. Not used for binary chunks.
+    :type encoding: str
+
+    :rtype: collections.Iterable
+    :returns: Yields each chunk.
+
+    .. code-block:: python
+
+        from commonkit import read_chunks
+
+        for chunk in read_chunks("path/to/large.bin", binary=True, chunk_size=8 * 1024 * 1024):
+            process(chunk)
+
+    """
+    mode = "rb" if binary else "r"
+    with open_file(path, mode, compression=compression, encoding=encoding) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b"" if binary else ""):
+            yield chunk
+
+        f.close()
+
+
+def read_file(path, buffer_size=-1, compression=None, encoding="utf-8"):
     """Read a file and return its contents.
 
     :param path: The path to the file.
     :type path: str || unicode
 
+    :param buffer_size: The size of the read buffer in bytes. See ``open_file()``.
+    :type buffer_size: int
+
+    :param compression: The compression format of the file. By default, this is detected. See ``open_file()``.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the file.
+    :type encoding: str
+
     :rtype: str
 
     .. code-block:: python
@@ -278,75 +871,603 @@ def read_file(path):
         print(output)
 
     """
-    with io.open(path, "r", encoding="utf-8") as f:
+    with open_file(path, buffer_size=buffer_size, compression=compression, encoding=encoding) as f:
         output = f.read()
         f.close()
 
         return output
 
 
-def write_file(path, content="", make_directories=False):
-    """Write a file.
+def read_lines(path, buffer_size=-1, compression=None, encoding="utf-8", line_endings=False):
+    """Read the lines of a file one at a time.
 
     :param path: The path to the file.
-    :type path: str || unicode
+    :type path: str
 
-    :param content: The content of the file. An empty string is effectively the same as a "touch".
-    :type content: str || unicode
+    :param buffer_size: The size of the read buffer in bytes. See ``open_file()``.
+    :type buffer_size: int
 
-    :param make_directories: Create directories as needed along the file path.
-    :type make_directories: bool
+    :param compression: The compression format of the file. By default, this is detected. See ``open_file()``.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the file.
+    :type encoding: str
+
+    :param line_endings: Include the line ending at the end of each line.
+    :type line_endings: bool
+
+    :rtype: collections.Iterable
+    :returns: Yields each line.
 
     .. code-block:: python
 
-        from superpython.utils import write_file
+        from commonkit import read_lines
 
-        write_file("path/to/readme.txt", "This is a test.")
+        for line in read_lines("path/to/access.log.gz", buffer_size=1024 * 1024):
+            if "POST" in line:
+                print(line)
 
     """
-    if make_directories:
-        base_path = os.path.dirname(path)
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
+    with open_file(path, buffer_size=buffer_size, compression=compression, encoding=encoding) as f:
+        if line_endings:
+            for line in f:
+                yield line
+        else:
+            for line in f:
+                yield line.rstrip("\r\n")
 
-    with io.open(path, "w", encoding="utf-8") as f:
-        f.write(content)
         f.close()
 
 
-# Classes
+def tree_stats(path, cache=None, follow_links=False, workers=None):
+    """Get the total size and number of files in a directory tree.
 
+    :param path: The path to the directory.
+    :type path: str
 
-class File(object):
-    """A simple helper class for working with file names.
+    :param cache: The path to a (JSON) file in which the results for each directory are stored. On subsequent calls,
+                  the files of a directory are only scanned again if the modification time of the directory has
+                  changed.
+    :type cache: str
 
-    For more robust handling of paths, see `pathlib`_.
+    :param follow_links: Descend into symbolic links to directories.
+    :type follow_links: bool
 
-    .. _pathlib: https://docs.python.org/3/library/pathlib.html
+    :param workers: The number of threads used to walk the sub-directories of ``path``. Defaults to that of
+                    ``ThreadPoolExecutor``.
+    :type workers: int
 
-    """
-    # Use decimal or binary base?
-    # https://www.gbmb.org/gigabytes
-    SIZE_BYTES = "bytes"
-    SIZE_KILOBYTES = "kilobytes"
-    SIZE_MEGABYTES = "megabytes"
-    SIZE_GIGABYTES = "gigabytes"
+    :raise: ValueError
 
-    def __init__(self, path):
-        """Initialize the file instance.
+    :rtype: TreeStats
 
-        :param path: The path to the file.
-        :type path: str
+    .. code-block:: python
 
-        """
-        self.basename = os.path.basename(path)
-        self.directory = os.path.dirname(path)
-        self.extension = os.path.splitext(path)[-1]
-        self.name = os.path.basename(os.path.splitext(path)[0])
-        self.path = path
+        from commonkit import tree_stats
 
-    def __repr__(self):
-        return "<%s %s>" % (self.__class__.__name__, self.basename)
+        stats = tree_stats("/var/www", cache="/var/cache/www-stats.json")
+        print("%s files, %s bytes" % (stats.files, stats.size))
+
+        for name, usage in stats.subdirectories.items():
+            print(name, usage['size'])
+
+    .. note::
+        The modification time of a directory changes when files are added, removed, or renamed, but not when the
+        content of a file changes. A cached directory may therefore report an outdated size for a file that has been
+        modified in place.
+
+    """
+    if not os.path.isdir(path):
+        raise ValueError("The path provided to tree_stats() must be a directory: %s" % path)
+
+    root = os.path.abspath(path)
+
+    cached = dict()
+    if cache is not None and os.path.exists(cache):
+        try:
+            cached = json.loads(read_file(cache))
+        except ValueError:
+            logger.warning("Ignoring invalid tree stats cache: %s" % cache)
+
+    stats = TreeStats(path)
+    entries = dict()
+
+    subdirectories = _scan_directory(root, cached, entries, stats, follow_links)
+
+    def walk(directory):
+        _stats = TreeStats(directory)
+        _entries = dict()
+
+        directories = [directory]
+        while directories:
+            _directory = directories.pop()
+            _stats.directories += 1
+            directories += _scan_directory(_directory, cached, _entries, _stats, follow_links)
+
+        return _stats, _entries
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for directory, (_stats, _entries) in zip(subdirectories, executor.map(walk, subdirectories)):
+            stats.merge(_stats)
+            stats.subdirectories[os.path.basename(directory)] = {'files': _stats.files, 'size': _stats.size}
+            entries.update(_entries)
+
+    if cache is not None:
+        write_file(cache, json.dumps(entries), make_directories=bool(os.path.dirname(cache)))
+
+    return stats
+
+
+def write_file(path, content="", make_directories=False, buffer_size=-1, compression=None, encoding="utf-8"):
+    """Write a file.
+
+    :param path: The path to the file.
+    :type path: str || unicode
+
+    :param content: The content of the file. An empty string is effectively the same as a "touch".
+    :type content: str || unicode
+
+    :param make_directories: Create directories as needed along the file path.
+    :type make_directories: bool
+
+    :param buffer_size: The size of the write buffer in bytes. See ``open_file()``.
+    :type buffer_size: int
+
+    :param compression: The compression format of the file. By default, this is identified by the file extension. See
+                        ``open_file()``.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the file.
+    :type encoding: str
+
+    .. code-block:: python
+
+        from superpython.utils import write_file
+
+        write_file("path/to/readme.txt", "This is a test.")
+
+    """
+    if make_directories:
+        base_path = os.path.dirname(path)
+        if not os.path.exists(base_path):
+            os.makedirs(base_path)
+
+    with open_file(path, "w", buffer_size=buffer_size, compression=compression, encoding=encoding) as f:
+        f.write(content)
+        f.close()
+
+
+def write_files(files, atomic=True, compression=None, encoding="utf-8", make_directories=True, skip_unchanged=False,
+                workers=None):
+    """Write many files at once.
+
+    :param files: Path and content pairs, as a dictionary or list of tuples.
+    :type files: dict | list[tuple(str, str)]
+
+    :param atomic: Write each file to a temporary file in the same directory and then replace the original. Readers
+                   never see a partially written file.
+    :type atomic: bool
+
+    :param compression: The compression format of the files. By default, this is identified by the extension of each
+                        file. See ``open_file()``.
+    :type compression: str | bool
+
+    :param encoding: The encoding of the files.
+    :type encoding: str
+
+    :param make_directories: Create directories as needed. Each directory is checked only once.
+    :type make_directories: bool
+
+    :param skip_unchanged: Do not write files that already have the same content. The size of the file is compared
+                           before the content is read.
+    :type skip_unchanged: bool
+
+    :param workers: The number of threads used to write files. Defaults to that of ``ThreadPoolExecutor``.
+    :type workers: int
+
+    :rtype: dict
+    :returns: A tuple of the status (one of the ``WRITE`` constants) and an error message (or ``None``) for each path.
+
+    .. code-block:: python
+
+        from commonkit import write_files, WRITE
+
+        pages = {
+            "www/index.html": "<h1>Home</h1>",
+            "www/about/index.html": "<h1>About</h1>",
+        }
+        results = write_files(pages, skip_unchanged=True)
+        for path, (status, error) in results.items():
+            if status == WRITE.FAILED:
+                print("Could not write %s: %s" % (path, error))
+
+    """
+    items = list(files.items()) if isinstance(files, dict) else list(files)
+
+    if make_directories:
+        directories = set([os.path.dirname(path) for path, content in items])
+        for directory in sorted(directories):
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+
+    def write(item):
+        path, content = item
+        _compression = compression if compression is not None else get_compression(path, detect=False)
+
+        try:
+            if skip_unchanged and _has_content(path, content, _compression, encoding):
+                return WRITE.UNCHANGED, None
+
+            if not atomic:
+                write_file(path, content, compression=_compression, encoding=encoding)
+                return WRITE.WRITTEN, None
+
+            temporary_path = _create_temporary_file(path)
+            try:
+                write_file(temporary_path, content, compression=_compression or False, encoding=encoding)
+
+                # The temporary file already has the permissions of a new file, so only existing ones are kept.
+                try:
+                    os.chmod(temporary_path, S_IMODE(os.stat(path).st_mode))
+                except FileNotFoundError:
+                    pass
+
+                os.replace(temporary_path, path)
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+
+            return WRITE.WRITTEN, None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not write %s: %s" % (path, e))
+            return WRITE.FAILED, str(e)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(write, items)
+
+        return dict(zip([path for path, content in items], results))
+
+
+def _copy_file_data(source, destination, chunk_size, progress=None, reflink=True):
+    """Copy the data of one open (binary) file to another.
+
+    :param source: The source file.
+    :param destination: The destination file.
+
+    :param chunk_size: The maximum number of bytes per call.
+    :type chunk_size: int
+
+    :param progress: Receives the number of bytes copied and the total size.
+    :type progress: callable
+
+    :param reflink: Attempt to clone the file.
+    :type reflink: bool
+
+    Each method continues from where the previous one stopped, so a method that is not supported for the given files
+    (for example, across file systems) falls through to the next. The remainder is always read until the end of the
+    file, so files whose size is not known in advance (such as those in ``/proc``, which report a size of 0) are copied
+    in full; for these, the total given to ``progress`` is the number of bytes copied so far.
+
+    """
+    source_fd = source.fileno()
+    destination_fd = destination.fileno()
+    stat = os.fstat(source_fd)
+    total = stat.st_size
+
+    # Copying within the kernel is bounded by the size, so it is only used when the size can be trusted.
+    is_sized = S_ISREG(stat.st_mode) and total > 0
+
+    if reflink and is_sized and _reflink(source_fd, destination_fd):
+        if progress is not None:
+            progress(total, total)
+
+        return
+
+    offset = 0
+    methods = list()
+    if is_sized and hasattr(os, "copy_file_range"):
+        methods.append(lambda count: os.copy_file_range(source_fd, destination_fd, count, offset, offset))
+
+    if is_sized and hasattr(os, "sendfile"):
+        methods.append(lambda count: os.sendfile(destination_fd, source_fd, offset, count))
+
+    for method in methods:
+        try:
+            while offset < total:
+                copied = method(min(chunk_size, total - offset))
+                if copied == 0:
+                    break
+
+                offset += copied
+                if progress is not None:
+                    progress(offset, total)
+
+            break
+        except OSError as e:
+            # Unsupported for these files, so try the next method.
+            if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP, errno.EXDEV):
+                raise
+
+    # The kernel methods do not move the file positions.
+    if offset > 0:
+        source.seek(offset)
+        destination.seek(offset)
+
+    if progress is None:
+        copyfileobj(source, destination, chunk_size)
+        return
+
+    for chunk in iter(lambda: source.read(chunk_size), b""):
+        destination.write(chunk)
+        offset += len(chunk)
+        progress(offset, max(total, offset))
+
+
+def _create_temporary_file(path):
+    """Create an empty temporary file next to the given path.
+
+    :rtype: str
+    :returns: The path of the temporary file.
+
+    Unlike ``tempfile.mkstemp()``, which creates files that only the owner may read, the file is created with the usual
+    permissions (subject to the umask) of a new file.
+
+    """
+    directory, file_name = os.path.split(path)
+    temporary_path = os.path.join(directory, ".%s.%s.tmp" % (file_name, uuid.uuid4().hex))
+
+    os.close(os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+
+    return temporary_path
+
+
+def _detect_compression(stream):
+    """Identify the compression format from the first bytes of a binary stream. The stream position is unchanged.
+
+    :param stream: A binary stream positioned at the start of the file.
+
+    :rtype: str | None
+
+    """
+    if hasattr(stream, "peek"):
+        header = stream.peek(6)[:6]
+    else:
+        header = stream.read(6)
+        stream.seek(0)
+
+    for magic, compression in COMPRESSION.MAGIC:
+        if header.startswith(magic):
+            return compression
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_jinja_environment(search_path, bytecode_cache=None):
+    """Get the (shared) Jinja environment for the given template directory.
+
+    :param search_path: The absolute path to the template directory.
+    :type search_path: str
+
+    :param bytecode_cache: The directory in which compiled templates are stored.
+    :type bytecode_cache: str
+
+    """
+    if bytecode_cache is not None:
+        if not os.path.exists(bytecode_cache):
+            os.makedirs(bytecode_cache)
+
+        return JinjaEnvironment(bytecode_cache=JinjaBytecodeCache(bytecode_cache), loader=JinjaLoader(search_path))
+
+    return JinjaEnvironment(loader=JinjaLoader(search_path))
+
+
+def _has_content(path, content, compression, encoding):
+    """Determine whether a file already has the given content.
+
+    :rtype: bool
+
+    """
+    if compression:
+        try:
+            return read_file(path, compression=compression, encoding=encoding) == content
+        except (EOFError, OSError):
+            return False
+
+    data = content.encode(encoding)
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+    except FileNotFoundError:
+        return False
+
+    with open(path, "rb") as f:
+        return f.read() == data
+
+
+def _is_same_file(from_path, to_path, checksum=False):
+    """Determine whether the destination of a copy already matches the source.
+
+    :param from_path: The source path.
+    :type from_path: str
+
+    :param to_path: The destination path.
+    :type to_path: str
+
+    :param checksum: Compare the content of the files rather than their modification times.
+    :type checksum: bool
+
+    :rtype: bool
+
+    """
+    try:
+        destination = os.stat(to_path)
+    except FileNotFoundError:
+        return False
+
+    source = os.stat(from_path)
+    if source.st_size != destination.st_size:
+        return False
+
+    if checksum:
+        return hash_file(from_path) == hash_file(to_path)
+
+    # copy2() preserves the modification time, but not every file system stores it with the same precision.
+    return int(source.st_mtime) == int(destination.st_mtime)
+
+
+def _reflink(source_fd, destination_fd):
+    """Clone the data blocks of a file, on Linux file systems that support it (such as Btrfs and XFS).
+
+    :rtype: bool
+    :returns: ``True`` if the file was cloned.
+
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        fcntl.ioctl(destination_fd, FICLONE, source_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _safe_hash(path, function):
+    """Call a hash function, logging (rather than raising) errors for files that cannot be read.
+
+    :rtype: str | None
+
+    """
+    try:
+        return function(path)
+    except OSError as e:
+        logger.warning("Could not hash %s: %s" % (path, e))
+        return None
+
+
+def _scan_directory(directory, cached, entries, stats, follow_links):
+    """Add the files of a directory (but not its sub-directories) to the stats. See ``tree_stats()``.
+
+    :param directory: The absolute path to the directory.
+    :type directory: str
+
+    :param cached: Cached entries by directory path.
+    :type cached: dict
+
+    :param entries: Receives the (new) cache entry of the directory.
+    :type entries: dict
+
+    :param stats: The stats to which the files are added.
+    :type stats: TreeStats
+
+    :param follow_links: Descend into symbolic links to directories.
+    :type follow_links: bool
+
+    :rtype: list[str]
+    :returns: The paths of the sub-directories.
+
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError as e:
+        logger.warning("Could not read directory %s: %s" % (directory, e))
+        return list()
+
+    entry = cached.get(directory)
+    if entry is None or entry['mtime'] != mtime:
+        entry = {'directories': list(), 'extensions': dict(), 'mtime': mtime}
+        try:
+            with os.scandir(directory) as iterator:
+                for item in iterator:
+                    try:
+                        if item.is_dir(follow_symlinks=follow_links):
+                            entry['directories'].append(item.name)
+                        elif item.is_file(follow_symlinks=False):
+                            extension = os.path.splitext(item.name)[-1]
+                            counts = entry['extensions'].setdefault(extension, [0, 0])
+                            counts[0] += 1
+                            counts[1] += item.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning("Could not read directory %s: %s" % (directory, e))
+            return list()
+
+    entries[directory] = entry
+
+    for extension, (count, size) in entry['extensions'].items():
+        stats.add(extension, count, size)
+
+    return [os.path.join(directory, name) for name in entry['directories']]
+
+
+# Classes
+
+
+class CopySummary(object):
+    """The result of ``copy_tree()``. Paths are relative to the destination."""
+
+    def __init__(self):
+        self.copied = list()
+        self.deleted = list()
+        self.failed = list()
+        self.skipped = list()
+
+    def __bool__(self):
+        return self.success
+
+    def __repr__(self):
+        return "<%s copied=%s skipped=%s deleted=%s failed=%s>" % (
+            self.__class__.__name__,
+            len(self.copied),
+            len(self.skipped),
+            len(self.deleted),
+            len(self.failed)
+        )
+
+    @property
+    def success(self):
+        """Indicates no errors occurred.
+
+        :rtype: bool
+
+        """
+        return len(self.failed) == 0
+
+
+class File(object):
+    """A simple helper class for working with file names.
+
+    For more robust handling of paths, see `pathlib`_.
+
+    .. _pathlib: https://docs.python.org/3/library/pathlib.html
+
+    """
+    # Use decimal or binary base?
+    # https://www.gbmb.org/gigabytes
+    SIZE_BYTES = "bytes"
+    SIZE_KILOBYTES = "kilobytes"
+    SIZE_MEGABYTES = "megabytes"
+    SIZE_GIGABYTES = "gigabytes"
+
+    def __init__(self, path):
+        """Initialize the file instance.
+
+        :param path: The path to the file.
+        :type path: str
+
+        """
+        self.basename = os.path.basename(path)
+        self.directory = os.path.dirname(path)
+        self.extension = os.path.splitext(path)[-1]
+        self.name = os.path.basename(os.path.splitext(path)[0])
+        self.path = path
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.basename)
 
     @property
     def exists(self):
@@ -389,3 +1510,339 @@ class File(object):
             return "%sKB" % self.get_file_size(unit=self.SIZE_KILOBYTES)
 
         return "%sB" % size
+
+
+class FileAppender(object):
+    """Append lines to a file in batches.
+
+    .. code-block:: python
+
+        from commonkit import FileAppender
+
+        with FileAppender("path/to/audit.log", flush_size=64 * 1024, interval=1.0) as appender:
+            for event in events:
+                appender.write(event)
+
+    Lines are held in memory until ``flush_size`` characters have been buffered or (when given) ``interval`` seconds
+    have passed, and are then written at once. Writing is thread safe.
+
+    """
+
+    def __init__(self, path, compression=None, encoding="utf-8", flush_size=64 * 1024, fsync=False, interval=None,
+                 line_feed="\n", make_directories=False):
+        """Initialize the appender and open the file.
+
+        :param path: The path to the file. It is created if it does not exist.
+        :type path: str
+
+        :param compression: The compression format of the file. See ``open_file()``.
+        :type compression: str | bool
+
+        :param encoding: The encoding of the file.
+        :type encoding: str
+
+        :param flush_size: The number of characters that may be buffered before the lines are written.
+        :type flush_size: int
+
+        :param fsync: Call ``os.fsync()`` after each flush so that the lines are written to disk.
+        :type fsync: bool
+
+        :param interval: The maximum number of seconds that lines are buffered. A background thread flushes the buffer
+                         at this interval.
+        :type interval: float
+
+        :param line_feed: Added after each line.
+        :type line_feed: str
+
+        :param make_directories: Create the directories of the path as needed.
+        :type make_directories: bool
+
+        """
+        self.flush_size = flush_size
+        self.fsync = fsync
+        self.interval = interval
+        self.is_closed = False
+        self.line_feed = line_feed
+        self.path = path
+        self._buffer = list()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._stopped = threading.Event()
+        self._thread = None
+
+        if make_directories:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+        self._stream = open_file(path, "a", compression=compression, encoding=encoding)
+        self.last_flush = time.monotonic()
+
+        if interval:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.path)
+
+    def close(self):
+        """Flush remaining lines and close the file."""
+        if self.is_closed:
+            return
+
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        with self._lock:
+            self._flush()
+            self._stream.close()
+            self.is_closed = True
+
+    def flush(self):
+        """Write the buffered lines to the file."""
+        with self._lock:
+            self._flush()
+
+    def write(self, line):
+        """Add a line.
+
+        :param line: The line to be added.
+        :type line: str
+
+        :raise: ValueError
+
+        """
+        with self._lock:
+            if self.is_closed:
+                raise ValueError("Cannot write to a closed appender: %s" % self.path)
+
+            self._buffer.append(line)
+            self._buffer.append(self.line_feed)
+            self._size += len(line) + len(self.line_feed)
+
+            if self._size >= self.flush_size:
+                self._flush()
+
+    def _flush(self):
+        """Write the buffer. The lock must be held."""
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer = list()
+            self._size = 0
+
+            self._stream.flush()
+            if self.fsync:
+                os.fsync(self._stream.fileno())
+
+        self.last_flush = time.monotonic()
+
+    def _run(self):
+        """Flush the buffer at the given interval until the appender is closed."""
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+
+class MappedFile(object):
+    """A file mapped into memory. See ``map_file()``.
+
+    The ``data`` attribute is an ``mmap`` (or, for an empty file, an empty bytes object) that supports slicing and
+    regular expressions with bytes patterns. ``view()`` provides a ``memoryview`` for slicing without copying.
+
+    """
+
+    def __init__(self, path, data):
+        """Initialize the mapped file.
+
+        :param path: The path to the file.
+        :type path: str
+
+        :param data: The mapped data.
+        :type data: mmap.mmap | bytes | bytearray
+
+        """
+        self.data = data
+        self.path = path
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.path)
+
+    def close(self):
+        """Release the mapping."""
+        if isinstance(self.data, mmap.mmap) and not self.data.closed:
+            self.data.close()
+
+    def count(self, sub):
+        """Count the (non-overlapping) occurrences of a byte string.
+
+        :param sub: The bytes to be found.
+        :type sub: bytes
+
+        :rtype: int
+
+        """
+        count = 0
+        for offset in self.find_all(sub):
+            count += 1
+
+        return count
+
+    def find(self, sub, start=0, end=None):
+        """Find the offset of a byte string.
+
+        :param sub: The bytes to be found.
+        :type sub: bytes
+
+        :param start: The offset at which to start.
+        :type start: int
+
+        :param end: The offset at which to stop.
+        :type end: int
+
+        :rtype: int
+        :returns: The offset or ``-1`` if the bytes were not found.
+
+        """
+        if end is None:
+            end = len(self.data)
+
+        return self.data.find(sub, start, end)
+
+    def find_all(self, sub, start=0):
+        """Find the offset of each (non-overlapping) occurrence of a byte string.
+
+        :param sub: The bytes to be found.
+        :type sub: bytes
+
+        :param start: The offset at which to start.
+        :type start: int
+
+        :rtype: collections.Iterable
+        :returns: Yields each offset.
+
+        """
+        if not sub:
+            return
+
+        offset = self.data.find(sub, start)
+        while offset != -1:
+            yield offset
+            offset = self.data.find(sub, offset + len(sub))
+
+    def get_line(self, offset):
+        """Get the line (without its line ending) that contains the given offset.
+
+        :param offset: The offset.
+        :type offset: int
+
+        :rtype: bytes
+
+        """
+        start = self.data.rfind(b"\n", 0, offset) + 1
+
+        end = self.data.find(b"\n", offset)
+        if end == -1:
+            end = len(self.data)
+
+        return bytes(self.data[start:end]).rstrip(b"\r")
+
+    def search(self, pattern, flags=0):
+        """Search the file with a regular expression.
+
+        :param pattern: The bytes pattern.
+        :type pattern: bytes | re.Pattern
+
+        :param flags: Regular expression flags; used when the pattern is not already compiled.
+        :type flags: int
+
+        :rtype: collections.Iterable
+        :returns: Yields each match object.
+
+        """
+        if not hasattr(pattern, "finditer"):
+            pattern = re.compile(pattern, flags)
+
+        return pattern.finditer(self.data)
+
+    def view(self, start=0, end=None):
+        """Get a view of the data without copying it. The view must be released before the file is closed.
+
+        :param start: The offset at which the view starts.
+        :type start: int
+
+        :param end: The offset at which the view ends.
+        :type end: int
+
+        :rtype: memoryview
+
+        """
+        return memoryview(self.data)[start:end]
+
+
+class TreeStats(object):
+    """The result of ``tree_stats()``.
+
+    The ``extensions`` and ``subdirectories`` (the immediate sub-directories of the path) are dictionaries of the number
+    of ``files`` and their total ``size`` in bytes. The ``directories`` count does not include the path itself.
+
+    """
+
+    def __init__(self, path):
+        """Initialize the stats.
+
+        :param path: The path to the directory.
+        :type path: str
+
+        """
+        self.directories = 0
+        self.extensions = dict()
+        self.files = 0
+        self.path = path
+        self.size = 0
+        self.subdirectories = dict()
+
+    def __repr__(self):
+        return "<%s %s files=%s size=%s>" % (self.__class__.__name__, self.path, self.files, self.size)
+
+    def add(self, extension, files, size):
+        """Add files to the stats.
+
+        :param extension: The file extension, including the dot. Files without an extension use an empty string.
+        :type extension: str
+
+        :param files: The number of files.
+        :type files: int
+
+        :param size: The total size of the files in bytes.
+        :type size: int
+
+        """
+        self.files += files
+        self.size += size
+
+        usage = self.extensions.setdefault(extension, {'files': 0, 'size': 0})
+        usage['files'] += files
+        usage['size'] += size
+
+    def merge(self, stats):
+        """Add the files and directories of other stats.
+
+        :param stats: The stats to be added.
+        :type stats: TreeStats
+
+        """
+        self.directories += stats.directories
+        for extension, usage in stats.extensions.items():
+            self.add(extension, usage['files'], usage['size'])
@@ -175,8 +175,8 @@ slug
 Convert the given text into a slugline.
 
 .. note::
-    This slug routine is both *simple* and *slow*. If you need faster or more sophisticated processing, check out
-    `awesome-slugify`_. If you are using Django, use the builtin ``slugify`` function.
+    This slug routine is *simple*. If you need more sophisticated processing, check out `awesome-slugify`_. If you are
+    using Django, use the builtin ``slugify`` function.
 
 .. _awesome-slugify: https://pypi.org/project/awesome-slugify/
 
@@ -187,6 +187,15 @@ Convert the given text into a slugline.
     string = "It's a Test"
     print(slug(string))
 
+Results are cached, and ASCII text does not require Unidecode. To slug many strings at once, such as column names, use
+``slug_many()``:
+
+.. code-block:: python
+
+    from commonkit import slug_many
+
+    print(slug_many(["First Name", "Last Name"], separator="_"))
+
 strip_html_tags
 ...............
 
@@ -199,6 +208,29 @@ Strip HTML tags from a string.
     html = "<p>This string contains <b>HTML</b> tags.</p>"
     print(strip_html_tags(html))
 
+Extracting Text from Large Documents
+....................................
+
+``iter_html_text()`` parses HTML with Python's ``html.parser`` as it is read, yielding the text of each chunk. Content
+of ``script`` and ``style`` tags is skipped and entities are decoded. The source may be a string, a file object, or an
+iterable of chunks, so memory use stays flat regardless of the size of the document.
+
+.. code-block:: python
+
+    from commonkit.strings import iter_html_text
+
+    with open("path/to/page.html", "rb") as f:
+        for text in iter_html_text(f):
+            index.add(text)
+
+To get the text of many (smaller) documents, use ``strip_html_many()``, which reuses a single parser:
+
+.. code-block:: python
+
+    from commonkit.strings import strip_html_many
+
+    texts = strip_html_many(["<p>One &amp; two.</p>", "<p>Three.</p>"])
+
 truncate
 ........
 
@@ -237,5 +269,6 @@ Convert a string from ``under_score_case`` to ``Title Case``.
 
 """
 from .library import *
+from .markup import *
 
 __version__ = "0.25.0"
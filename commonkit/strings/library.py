@@ -1,5 +1,6 @@
 # Imports
 
+from functools import lru_cache
 import re
 from ..constants import BASE10, BASE62
 from ..compat import get_formatter_by_name, get_lexer_by_name, highlight, remove_html, unidecode, JinjaTemplate
@@ -19,12 +20,18 @@ __all__ = (
     "remove_non_ascii",
     "replace_non_ascii",
     "slug",
+    "slug_many",
     "strip_html_tags",
     "truncate",
     "underscore_to_camelcase",
     "underscore_to_title_case",
 )
 
+# Constants
+
+SLUG_REMOVED_CHARACTERS = ",:;'\"|/\\"
+"""The characters removed by ``slug()``."""
+
 # Functions
 
 
@@ -218,8 +225,10 @@ def parse_jinja_string(string, context):
 
         output = parse_jinja_string(template, context)
 
+    Compiled templates are cached, so the same string is only compiled once.
+
     """
-    template = JinjaTemplate(string)
+    template = _get_jinja_template(string)
 
     return template.render(context)
 
@@ -267,29 +276,35 @@ def slug(text, separator="-"):
 
     :rtype: str
 
+    Non-ASCII characters are replaced using Unidecode; ASCII text does not require it. Results are cached, so slugging
+    the same text again is a dictionary lookup.
+
     .. note::
-        This slug routine is both *simple* and *slow*. If you need faster or more sophisticated processing, check out
-        awesome-slugify.
+        This slug routine is *simple*. If you need more sophisticated processing, check out awesome-slugify.
 
     """
-    text = replace_non_ascii(text)
+    return _slug(str(text), separator)
 
-    removes = [
-        ",",
-        ":",
-        ";",
-        "'",
-        '"',
-        "|",
-        "/",
-        "\\",
-    ]
-    for r in removes:
-        text = text.replace(r, "")
 
-    text = text.replace(" ", separator)
+def slug_many(texts, separator="-"):
+    """Convert a number of strings into sluglines. See ``slug()``.
 
-    return text.lower()
+    :param texts: The texts to be slugged.
+    :type texts: collections.Iterable
+
+    :param separator: The separator to use.
+    :type separator: str
+
+    :rtype: list[str]
+
+    .. code-block:: python
+
+        from commonkit import slug_many
+
+        print(slug_many(["First Name", "Last Name", "E-Mail Address"], separator="_"))
+
+    """
+    return [_slug(str(text), separator) for text in texts]
 
 
 def strip_html_tags(html):
@@ -374,3 +389,31 @@ def underscore_to_title_case(string):
 
     """
     return string.replace("_", " ").title()
+
+
+@lru_cache(maxsize=256)
+def _get_jinja_template(string):
+    """Get the compiled template for a string. See ``parse_jinja_string()``."""
+    return JinjaTemplate(string)
+
+
+@lru_cache(maxsize=32)
+def _get_slug_table(separator):
+    """Get the translation table used by ``slug()`` for the given separator.
+
+    :rtype: dict
+
+    """
+    table = dict.fromkeys(map(ord, SLUG_REMOVED_CHARACTERS))
+    table[ord(" ")] = separator
+
+    return table
+
+
+@lru_cache(maxsize=4096)
+def _slug(text, separator):
+    """Slug a string. See ``slug()``."""
+    if not is_ascii(text):
+        text = replace_non_ascii(text)
+
+    return text.translate(_get_slug_table(separator)).lower()
@@ -0,0 +1,163 @@
+# Imports
+
+import codecs
+from html.parser import HTMLParser
+
+# Exports
+
+__all__ = (
+    "iter_html_text",
+    "strip_html_many",
+    "SKIPPED_HTML_TAGS",
+)
+
+# Constants
+
+SKIPPED_HTML_TAGS = ("script", "style")
+"""The tags whose content is not text and is skipped by ``iter_html_text()``."""
+
+# Functions
+
+
+def iter_html_text(source, chunk_size=64 * 1024, encoding="utf-8", skip_tags=SKIPPED_HTML_TAGS):
+    """Extract the text of an HTML document as it is read.
+
+    :param source: The HTML. This may be a string, a file object (opened in text or binary mode), or an iterable of
+                   chunks such as :py:func:`commonkit.files.library.read_chunks`.
+    :type source: str | io.IOBase | collections.Iterable
+
+    :param chunk_size: The number of characters (or bytes) read from a file object at a time.
+    :type chunk_size: int
+
+    :param encoding: The encoding used to decode chunks given as bytes.
+    :type encoding: str
+
+    :param skip_tags: The tags whose content is skipped.
+    :type skip_tags: list[str] | tuple[str]
+
+    :rtype: collections.Iterable[str]
+    :returns: Yields the text found in each chunk. Entities are decoded.
+
+    .. code-block:: python
+
+        from commonkit.files import read_chunks
+        from commonkit.strings import iter_html_text
+
+        with open("path/to/page.html", "r") as f:
+            for text in iter_html_text(f):
+                index.add(text)
+
+        text = "".join(iter_html_text(read_chunks("path/to/page.html")))
+
+    Only the text of the current chunk is held in memory, so the size of the document does not matter.
+
+    """
+    parser = _TextParser(skip_tags=skip_tags)
+
+    for text in parser.parse(_iter_chunks(source, chunk_size, encoding)):
+        yield text
+
+
+def strip_html_many(documents, skip_tags=SKIPPED_HTML_TAGS):
+    """Get the text of a number of HTML documents. See ``iter_html_text()``.
+
+    :param documents: The HTML documents.
+    :type documents: collections.Iterable[str]
+
+    :param skip_tags: The tags whose content is skipped.
+    :type skip_tags: list[str] | tuple[str]
+
+    :rtype: list[str]
+
+    .. code-block:: python
+
+        from commonkit.strings import strip_html_many
+
+        texts = strip_html_many(["<p>One &amp; two.</p>", "<p>Three.</p><script>four()</script>"])
+
+    """
+    parser = _TextParser(skip_tags=skip_tags)
+
+    return ["".join(parser.parse((document,))) for document in documents]
+
+
+def _iter_chunks(source, chunk_size, encoding):
+    """Get the chunks of a source as strings. See ``iter_html_text()``."""
+    if isinstance(source, str):
+        chunks = (source,)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
+
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+            chunk = decoder.decode(chunk)
+
+        yield chunk
+
+    if decoder is not None:
+        yield decoder.decode(b"", final=True)
+
+
+# Classes
+
+
+class _TextParser(HTMLParser):
+    """Collect the text of an HTML document. See ``iter_html_text()``."""
+
+    def __init__(self, skip_tags=SKIPPED_HTML_TAGS):
+        super().__init__(convert_charrefs=True)
+
+        self.skip_tags = frozenset(skip_tags)
+        self._depth = 0
+        self._texts = list()
+
+    def handle_data(self, data):
+        if not self._depth:
+            self._texts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag in self.skip_tags and self._depth:
+            self._depth -= 1
+
+    def handle_startendtag(self, tag, attrs):
+        pass
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.skip_tags:
+            self._depth += 1
+
+    def parse(self, chunks):
+        """Parse a document.
+
+        :param chunks: The chunks of the document.
+        :type chunks: collections.Iterable[str]
+
+        :rtype: collections.Iterable[str]
+        :returns: Yields the text of each chunk.
+
+        """
+        self.reset()
+        self._depth = 0
+        self._texts = list()
+
+        for chunk in chunks:
+            self.feed(chunk)
+            if self._texts:
+                yield self._flush()
+
+        self.close()
+        if self._texts:
+            yield self._flush()
+
+    def _flush(self):
+        """Get and clear the collected text."""
+        text = "".join(self._texts)
+        self._texts = list()
+
+        return text
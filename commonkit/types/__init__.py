@@ -246,6 +246,33 @@ Intelligently cast the given value to a Python data type.
     value = "yes"
     print(type(smart_cast(value)), smart_cast(value))
 
+To cast many values, such as the values of a column, use ``smart_cast_many()``. The ``cache_size`` remembers the results
+for repeated values:
+
+.. code-block:: python
+
+    from commonkit import smart_cast_many
+
+    values = smart_cast_many(["1", "2", "yes", "1"], cache_size=1000)
+
+Checking Many Values
+....................
+
+``is_bool_many()``, ``is_decimal_many()``, ``is_email_many()``, ``is_float_many()``, and ``is_integer_many()`` check a
+sequence of values, such as a column, and return a mask or (with ``indexes=True``) the indexes of the matching values.
+The result is the same as calling the single value function for each value.
+
+.. code-block:: python
+
+    from commonkit import is_integer_many
+
+    values = ["17", "17.5", "abc", 17]
+    print(is_integer_many(values, cast=True))  # [True, False, False, True]
+    print(is_integer_many(values, cast=True, indexes=True))  # [0, 3]
+
+When given a NumPy array, the result is also an array. The type of numeric and boolean arrays is determined from the
+array itself, without examining each value. NumPy is not required.
+
 BooleanBecause
 ..............
 
@@ -277,6 +304,7 @@ settings and class-based constants.
         # ...
 
 """
+from .batch import *
 from .library import *
 
 __version__ = "0.30.0-d"
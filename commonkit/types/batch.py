@@ -0,0 +1,249 @@
+# Imports
+
+import sys
+from ..constants import BOOLEAN_VALUES
+from ..regex import DECIMAL_PATTERN, EMAIL_PATTERN, STRICT_EMAIL_PATTERN
+from .library import _smart_cast_string
+
+# Exports
+
+__all__ = (
+    "is_bool_many",
+    "is_decimal_many",
+    "is_email_many",
+    "is_float_many",
+    "is_integer_many",
+)
+
+# Constants
+
+_NUMERIC_KINDS = "fiu"
+"""The NumPy dtype kinds of float, signed, and unsigned integer arrays."""
+
+# Functions
+
+
+def is_bool_many(values, indexes=False, test_values=BOOLEAN_VALUES):
+    """Determine which values are booleans. See ``is_bool()``.
+
+    :param values: The values to be checked.
+    :type values: collections.Iterable | numpy.ndarray
+
+    :param indexes: Return the indexes of matching values instead of a mask.
+    :type indexes: bool
+
+    :param test_values: The possible values that could be True or False.
+    :type test_values: list | tuple
+
+    :rtype: list[bool] | list[int] | numpy.ndarray
+    :returns: A mask with ``True`` for each matching value, or the indexes of the matching values.
+
+    """
+    array = _get_array(values)
+    if array is not None and array.dtype.kind in "b" + _NUMERIC_KINDS:
+        numpy = _get_numpy()
+        numbers = [value for value in test_values if isinstance(value, (bool, float, int))]
+        return _get_result(numpy.isin(array, numbers), indexes, array)
+
+    try:
+        _test_values = frozenset(test_values)
+    except TypeError:
+        _test_values = test_values
+
+    mask = list()
+    for value in _iter_values(values, array):
+        try:
+            mask.append(value in _test_values)
+        except TypeError:
+            mask.append(value in test_values)
+
+    return _get_result(mask, indexes, array)
+
+
+def is_decimal_many(values, indexes=False):
+    """Determine which values are decimal numbers. See ``is_decimal()``.
+
+    :param values: The values to be checked.
+    :type values: collections.Iterable | numpy.ndarray
+
+    :param indexes: Return the indexes of matching values instead of a mask.
+    :type indexes: bool
+
+    :rtype: list[bool] | list[int] | numpy.ndarray
+
+    """
+    array = _get_array(values)
+    if array is not None and array.dtype.kind == "b":
+        numpy = _get_numpy()
+        return _get_result(numpy.zeros(len(array), dtype=bool), indexes, array)
+
+    match = DECIMAL_PATTERN.match
+
+    mask = list()
+    for value in _iter_values(values, array):
+        mask.append(type(value) is not bool and match(str(value)) is not None)
+
+    return _get_result(mask, indexes, array)
+
+
+def is_email_many(values, indexes=False, strict=False):
+    """Determine which values are email addresses. See ``is_email()``.
+
+    :param values: The values to be checked.
+    :type values: collections.Iterable | numpy.ndarray
+
+    :param indexes: Return the indexes of matching values instead of a mask.
+    :type indexes: bool
+
+    :param strict: Use a stricter match for evaluating the address.
+    :type strict: bool
+
+    :rtype: list[bool] | list[int] | numpy.ndarray
+
+    """
+    array = _get_array(values)
+    if array is not None and array.dtype.kind not in "OU":
+        numpy = _get_numpy()
+        return _get_result(numpy.zeros(len(array), dtype=bool), indexes, array)
+
+    match = STRICT_EMAIL_PATTERN.match if strict else EMAIL_PATTERN.match
+
+    mask = list()
+    for value in _iter_values(values, array):
+        mask.append(isinstance(value, str) and match(value) is not None)
+
+    return _get_result(mask, indexes, array)
+
+
+def is_float_many(values, indexes=False):
+    """Determine which values are floats. See ``is_float()``.
+
+    :param values: The values to be checked.
+    :type values: collections.Iterable | numpy.ndarray
+
+    :param indexes: Return the indexes of matching values instead of a mask.
+    :type indexes: bool
+
+    :rtype: list[bool] | list[int] | numpy.ndarray
+
+    """
+    array = _get_array(values)
+    if array is not None and array.dtype.kind in "b" + _NUMERIC_KINDS:
+        numpy = _get_numpy()
+        mask = numpy.full(len(array), array.dtype.kind == "f", dtype=bool)
+        return _get_result(mask, indexes, array)
+
+    mask = list()
+    for value in _iter_values(values, array):
+        if isinstance(value, float):
+            mask.append(True)
+        elif isinstance(value, str):
+            mask.append(type(_smart_cast_string(value)) is float)
+        elif type(value) is bool or isinstance(value, int):
+            mask.append(False)
+        else:
+            try:
+                float(value)
+                mask.append(True)
+            except (TypeError, ValueError):
+                mask.append(False)
+
+    return _get_result(mask, indexes, array)
+
+
+def is_integer_many(values, cast=False, indexes=False):
+    """Determine which values are integers. See ``is_integer()``.
+
+    :param values: The values to be checked.
+    :type values: collections.Iterable | numpy.ndarray
+
+    :param cast: Indicates whether values given as strings may be cast to an integer.
+    :type cast: bool
+
+    :param indexes: Return the indexes of matching values instead of a mask.
+    :type indexes: bool
+
+    :rtype: list[bool] | list[int] | numpy.ndarray
+
+    .. code-block:: python
+
+        from commonkit.types import is_integer_many
+
+        print(is_integer_many(["17", "17.5", "abc", 17], cast=True))
+        print(is_integer_many(["17", "17.5", "abc", 17], cast=True, indexes=True))
+
+    """
+    array = _get_array(values)
+    if array is not None and array.dtype.kind in "b" + _NUMERIC_KINDS:
+        numpy = _get_numpy()
+        mask = numpy.full(len(array), array.dtype.kind in "iu", dtype=bool)
+        return _get_result(mask, indexes, array)
+
+    mask = list()
+    for value in _iter_values(values, array):
+        if type(value) is bool:
+            mask.append(False)
+        elif isinstance(value, int):
+            mask.append(True)
+        elif cast and isinstance(value, str):
+            mask.append(type(_smart_cast_string(value)) is int)
+        else:
+            mask.append(False)
+
+    return _get_result(mask, indexes, array)
+
+
+def _get_array(values):
+    """Get the values as a flat NumPy array, if the values are an array.
+
+    :rtype: numpy.ndarray | None
+
+    """
+    numpy = _get_numpy()
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.ravel()
+
+    return None
+
+
+def _get_numpy():
+    """Get NumPy, if it has been imported. An array can only exist once NumPy has been imported, so it is not imported
+    here; NumPy remains optional and adds nothing to the import time of this module.
+
+    :rtype: module | None
+
+    """
+    return sys.modules.get("numpy")
+
+
+def _get_result(mask, indexes, array):
+    """Get the result of a batch check.
+
+    :param mask: The result of checking each value.
+    :type mask: list[bool] | numpy.ndarray
+
+    :param indexes: Return the indexes of the matching values.
+    :type indexes: bool
+
+    :param array: The values, if given as a NumPy array. The result is then also an array.
+    :type array: numpy.ndarray | None
+
+    :rtype: list[bool] | list[int] | numpy.ndarray
+
+    """
+    if array is not None:
+        mask = _get_numpy().asarray(mask, dtype=bool)
+        return _get_numpy().flatnonzero(mask) if indexes else mask
+
+    if indexes:
+        return [index for index, matched in enumerate(mask) if matched]
+
+    return mask
+
+
+def _iter_values(values, array):
+    """Iterate over the values as Python objects."""
+    if array is not None:
+        return array.tolist()
+
+    return values
@@ -4,6 +4,7 @@ from collections import OrderedDict
 from datetime import timedelta
 from decimal import Decimal
 import operator
+import re
 import six
 from ..regex import DECIMAL_PATTERN, EMAIL_PATTERN, HUMAN_FRIENDLY_DURATION_PATTERN, STRICT_EMAIL_PATTERN, \
     VARIABLE_NAME_PATTERN
@@ -25,6 +26,7 @@ __all__ = (
     "is_string",
     "is_variable_name",
     "smart_cast",
+    "smart_cast_many",
     "to_bool",
     "to_decimal",
     "to_ordered_dict",
@@ -35,6 +37,19 @@ __all__ = (
     "TrueBecause",
 )
 
+# Constants
+
+_BOOLEAN_STRINGS = {value: value in TRUE_VALUES for value in BOOLEAN_VALUES if isinstance(value, str)}
+"""The boolean value of each string in ``BOOLEAN_VALUES``, for ``smart_cast()``."""
+
+_DIGIT_PATTERN = re.compile(r"\d")
+
+_FLOAT_PATTERN = re.compile(r"[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|[+-]?[0-9]+[eE][+-]?[0-9]+")
+
+_FLOAT_WORDS = ("inf", "infinity", "nan")
+
+_INTEGER_PATTERN = re.compile(r"[+-]?[0-9]+")
+
 # Decorators
 
 
@@ -288,7 +303,13 @@ def smart_cast(value):
     :param value: The value to be cast.
     :type value: str
 
+    Strings are classified in a single pass where possible. Less common numbers, such as ``" 17 "`` or ``"1_000"``, are
+    still identified by Python's ``int()`` and ``float()``.
+
     """
+    if isinstance(value, str):
+        return _smart_cast_string(value)
+
     # Handle integers first because is_bool() may interpret 0s and 1s as booleans.
     if is_integer(value, cast=True):
         return int(value)
@@ -300,6 +321,47 @@ def smart_cast(value):
         return value
 
 
+def smart_cast_many(values, cache_size=None):
+    """Cast a number of values. See ``smart_cast()``.
+
+    :param values: The values to be cast.
+    :type values: collections.Iterable
+
+    :param cache_size: Remember the result for up to this number of distinct string values, which is faster when values
+                       are often repeated; for example, the values of a column in a CSV file.
+    :type cache_size: int
+
+    :rtype: list
+
+    .. code-block:: python
+
+        from commonkit import smart_cast_many
+
+        print(smart_cast_many(["17", "1.5", "yes", "Rocket Skates"]))
+
+    """
+    if not cache_size:
+        return [smart_cast(value) for value in values]
+
+    cache = dict()
+    results = list()
+    for value in values:
+        if not isinstance(value, str):
+            results.append(smart_cast(value))
+            continue
+
+        try:
+            result = cache[value]
+        except KeyError:
+            result = _smart_cast_string(value)
+            if len(cache) < cache_size:
+                cache[value] = result
+
+        results.append(result)
+
+    return results
+
+
 def to_bool(value, false_values=FALSE_VALUES, true_values=TRUE_VALUES):
     """Convert the given value to it's boolean equivalent.
 
@@ -416,6 +478,31 @@ def to_timedelta(value):
     # Return the delta.
     return timedelta(**kwargs)
 
+
+def _smart_cast_string(value):
+    """Cast a string. See ``smart_cast()``."""
+    if _INTEGER_PATTERN.fullmatch(value) is not None:
+        return int(value)
+
+    if _FLOAT_PATTERN.fullmatch(value) is not None:
+        return float(value)
+
+    # Without a digit, the value can only be a number if it is infinity or "not a number".
+    if _DIGIT_PATTERN.search(value) is None and value.strip().lstrip("+-").lower() not in _FLOAT_WORDS:
+        return _BOOLEAN_STRINGS.get(value, value)
+
+    try:
+        return int(value)
+    except ValueError:
+        pass
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    return _BOOLEAN_STRINGS.get(value, value)
+
 # Classes
 
 
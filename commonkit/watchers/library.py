@@ -134,6 +134,7 @@ class Watcher(object):
                 except OSError as e:
                     self.errors.append("File watcher failed: %s (%s)" % (self.path, e))
                     yield None
+                    continue
 
                 if modified_time > self.last_modified_time:
                     self.last_modified_time = modified_time
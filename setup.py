@@ -38,6 +38,7 @@ setup(
             "beautifulsoup4",
             "colorama",
             "jinja2",
+            "numpy",
             "pygments",
             "SQLAlchemy",
             "tabulate",
@@ -53,3 +53,28 @@ def database_handle():
     yield db
 
     os.remove(path)
+
+
+@pytest.fixture
+def ini_path():
+    from commonkit.config.cache import clear_config_cache
+
+    path = os.path.join("tests", "config", "tmp-config.ini")
+    with open(path, "w") as f:
+        f.write("[project]\ntitle = Rocket Skates\nrelease = 1\n")
+
+    clear_config_cache()
+
+    yield path
+
+    os.remove(path)
+    clear_config_cache()
+
+
+def rewrite(path, content):
+    """Write a file, making sure the modification time changes."""
+    stat = os.stat(path)
+    with open(path, "w") as f:
+        f.write(content)
+
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
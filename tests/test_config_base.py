@@ -1,6 +1,6 @@
 import os
 import pytest
-from commonkit.config.base import Base as BaseConfig
+from commonkit.config.base import Base as BaseConfig, LazyValues
 from commonkit.config.exceptions import VariableNameNotAllowed
 
 # Tests
@@ -68,3 +68,57 @@ class TestBase(object):
 
         key, value = config._process_key_value_pair("testing", "17")
         assert value == 17
+
+    def test_to_dict(self):
+        config = BaseConfig("test.cfg")
+        with pytest.raises(NotImplementedError):
+            config.to_dict()
+
+
+class TestLazyValues(object):
+
+    def test_cast(self):
+        calls = list()
+
+        def cast(key, value):
+            calls.append(key)
+            return int(value)
+
+        values = LazyValues(cast, raw={'a': "1", 'b': "2"}, values={'c': "3"})
+        assert values.pending == 2
+        assert "a" in values
+        assert len(values) == 3
+
+        assert values['a'] == 1
+        assert values.get("a") == 1
+        assert values.get("c") == "3"
+        assert values.get("d", default=4) == 4
+        assert calls == ["a"]
+        assert values.pending == 1
+
+        values['b'] = 5
+        assert values['b'] == 5
+        assert values.pending == 0
+
+        values.update_raw({'d': "6"})
+        values.update(e=7)
+        assert values.copy() == {'a': 1, 'b': 5, 'c': "3", 'd': 6, 'e': 7}
+        assert list(values.values()) == ["3", 1, 5, 6, 7]
+        assert calls == ["a", "d"]
+        assert repr(values) == "<LazyValues 5 values, 0 pending>"
+
+    def test_mapping(self):
+        def cast(key, value):
+            return int(value)
+
+        # Values are cast however they are accessed.
+        assert dict(LazyValues(cast, raw={'a': "1"})) == {'a': 1}
+        assert {**LazyValues(cast, raw={'a': "1"})} == {'a': 1}
+        assert LazyValues(cast, raw={'a': "1"}) == {'a': 1}
+        assert LazyValues(cast, raw={'a': "1"}).pop("a") == 1
+        assert LazyValues(cast, raw={'a': "1"}).setdefault("a", 2) == 1
+
+        values = LazyValues(cast, raw={'a': "1", 'b': "2"})
+        del values['a']
+        assert "a" not in values
+        assert values.pending == 1
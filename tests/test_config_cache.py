@@ -0,0 +1,174 @@
+import os
+import pytest
+from commonkit.config.cache import *
+from commonkit.config.flat import FlatConfig
+from commonkit.config.ini import INIConfig
+from commonkit.config.py import PythonConfig
+from tests.conftest import rewrite
+
+# Tests
+
+
+class TestConfigCache(object):
+
+    def test_clear(self):
+        cache = ConfigCache()
+        stat = os.stat(__file__)
+        cache.set(cache.get_key(INIConfig, "a.ini"), stat, 1)
+        cache.set(cache.get_key(INIConfig, "a.ini", {'b': 2, 'a': 1}), stat, 2)
+        cache.set(cache.get_key(INIConfig, "b.ini"), stat, 3)
+        assert len(cache) == 3
+
+        cache.clear("a.ini")
+        assert len(cache) == 1
+        assert cache.get(cache.get_key(INIConfig, "b.ini"), stat) == 3
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_get(self):
+        cache = ConfigCache(max_size=2)
+        stat = os.stat(__file__)
+        assert repr(cache) == "<ConfigCache 0/2>"
+
+        key = cache.get_key(FlatConfig, "a.cfg", {'b': 2, 'a': 1})
+        assert key == cache.get_key(FlatConfig, "a.cfg", {'a': 1, 'b': 2})
+        assert key != cache.get_key(FlatConfig, "a.cfg", {'a': 2, 'b': 2})
+
+        assert cache.get(key, stat) is None
+        cache.set(key, stat, "a")
+        assert cache.get(key, stat) == "a"
+
+        # The least recently used entry is removed.
+        cache.set(cache.get_key(FlatConfig, "b.cfg"), stat, "b")
+        assert cache.get(key, stat) == "a"
+        cache.set(cache.get_key(FlatConfig, "c.cfg"), stat, "c")
+        assert key in cache
+        assert cache.get(cache.get_key(FlatConfig, "b.cfg"), stat) is None
+
+        # A changed file is not returned.
+        changed = os.stat_result((0, 0, 0, 0, 0, 0, stat.st_size + 1, 0, 0, 0))
+        assert cache.get(key, changed) is None
+        assert key not in cache
+
+
+class TestCachedConfig(object):
+
+    def test_flat(self):
+        path = os.path.join("tests", "config", "tmp-cache.cfg")
+        with open(path, "w") as f:
+            f.write("user = deploy\n")
+
+        config = FlatConfig(path, defaults={'port': 22})
+        assert config.load() is True
+
+        config = FlatConfig(path, defaults={'user': "nobody", 'host': "example.com"})
+        assert config.load() is True
+        assert config.user == "deploy"
+        assert config.host == "example.com"
+        assert config.port is None
+
+        rewrite(path, "user = root\n")
+        config = FlatConfig(path)
+        assert config.load() is True
+        assert config.user == "root"
+
+        os.remove(path)
+        clear_config_cache()
+
+    def test_ini(self, ini_path, monkeypatch):
+        config = INIConfig(ini_path)
+        assert config.load() is True
+        assert config.project.release == 1
+        assert len(CONFIG_CACHE) == 1
+
+        # Loading again does not read the file.
+        def read_file(*args, **kwargs):
+            raise AssertionError("The file should not be read.")
+
+        monkeypatch.setattr("commonkit.config.ini.read_file", read_file)
+
+        config = INIConfig(ini_path, flatten="project")
+        assert config.load() is True
+        assert config.title == "Rocket Skates"
+
+        # Sections are not shared between instances.
+        assert config.project is not INIConfig(ini_path).project
+        monkeypatch.undo()
+
+        rewrite(ini_path, "[project]\ntitle = Rocket Boots\n")
+        config = INIConfig(ini_path)
+        assert config.load() is True
+        assert config.project.title == "Rocket Boots"
+        assert config.project.release is None
+
+        monkeypatch.setattr("commonkit.config.ini.read_file", read_file)
+        assert INIConfig(ini_path).load() is True
+        with pytest.raises(AssertionError):
+            INIConfig(ini_path, cache=False).load()
+
+        monkeypatch.undo()
+        clear_config_cache(ini_path)
+        assert len(CONFIG_CACHE) == 0
+
+    def test_python(self):
+        path = os.path.join("tests", "config", "tmp_cache.py")
+        with open(path, "w") as f:
+            f.write("value = 1\n")
+
+        config = PythonConfig(path)
+        assert config.load() is True
+        assert config.value == 1
+
+        rewrite(path, "value = 2\n")
+        config = PythonConfig(path)
+        assert config.load() is True
+        assert config.value == 2
+
+        # The module is reloaded when the file changes after its cache entry has been cleared (or evicted).
+        clear_config_cache()
+        rewrite(path, "value = 3\n")
+        config = PythonConfig(path)
+        assert config.load() is True
+        assert config.value == 3
+
+        rewrite(path, "value = 4\n")
+        config = PythonConfig(path, cache=False)
+        assert config.load() is True
+        assert config.value == 4
+
+        os.remove(path)
+        clear_config_cache()
+
+    def test_python_imported(self):
+        path = os.path.join("tests", "config", "tmp_imported.py")
+        with open(path, "w") as f:
+            f.write("import tests.config\n")
+            f.write("tests.config.executed = getattr(tests.config, \"executed\", 0) + 1\n")
+            f.write("value = 1\n")
+
+        import tests.config
+        from tests.config import tmp_imported
+        assert tests.config.executed == 1
+
+        # A module that has already been imported is not executed again.
+        config = PythonConfig(path)
+        assert config.load() is True
+        assert config.value == 1
+        assert tests.config.executed == 1
+
+        clear_config_cache()
+        assert PythonConfig(path).load() is True
+        assert tests.config.executed == 1
+
+        # It is reloaded once the file changes.
+        rewrite(path, "import tests.config\ntests.config.executed += 1\nvalue = 2\n")
+        config = PythonConfig(path)
+        assert config.load() is True
+        assert config.value == 2
+        assert tmp_imported.value == 2
+        assert tests.config.executed == 2
+
+        del tests.config.executed
+        os.remove(path)
+        clear_config_cache()
@@ -48,3 +48,27 @@ class TestFlat(object):
         with pytest.raises(VariableNameNotAllowed):
             config = FlatConfig(os.path.join("tests", "config", "example-bad.cfg"))
             config.load()
+
+    def test_load_lazy(self):
+        config = FlatConfig(os.path.join("tests", "config", "example.cfg"), defaults={'port': 22}, lazy=True)
+        assert config.load() is True
+        assert len(config) == 6
+        assert config._variables.pending == 5
+
+        assert config.project_active is True
+        assert config.get("project_release") == 1
+        assert config.has("client_code") is True
+        assert config.port == 22
+        assert config._variables.pending == 2
+
+        assert config.to_dict()['project_title'] == "Example Project"
+        assert config._variables.pending == 0
+
+    def test_to_dict(self):
+        config = FlatConfig(os.path.join("tests", "config", "example.cfg"))
+        assert config.load() is True
+
+        values = config.to_dict()
+        assert len(values) == 5
+        assert values['project_active'] is True
+        assert values['project_title'] == "Example Project"
@@ -85,6 +85,34 @@ class TestINIConfig(object):
             config = INIConfig(os.path.join("tests", "config", "example-bad2.ini"))
             config.load()
 
+    def test_load_lazy(self):
+        config = INIConfig(os.path.join("tests", "config", "example.ini"), flatten="project", lazy=True)
+        assert config.load() is True
+        assert config.project.get_attributes().pending == 3
+
+        assert config.project.active is True
+        assert config.release == 1
+        assert config.get("project", key="title") == "Example Project"
+        assert config.has("client", key="code") is True
+        assert config.project.get_attributes().pending == 0
+
+        # Copies of the attributes are cast too.
+        attributes = config.client.get_attributes()
+        assert dict(attributes) == {'name': "ACME, Inc.", 'code': "ACME"}
+        assert attributes.pending == 0
+
+        eager = INIConfig(os.path.join("tests", "config", "example.ini"))
+        assert eager.load() is True
+        assert config.to_dict() == eager.to_dict()
+
+    def test_to_dict(self):
+        config = INIConfig(os.path.join("tests", "config", "example.ini"))
+        assert config.load() is True
+
+        values = config.to_dict()
+        assert values['client.code'] == "ACME"
+        assert values['project.release'] == 1
+
 
 class TestSection(object):
 
@@ -97,6 +125,12 @@ class TestSection(object):
         s = Section("testing", **{'test1': True, 'test2': "testing", 'test3': 17})
         assert s.get_name() == "testing"
 
+    def test_from_values(self):
+        values = {'test1': True}
+        s = Section.from_values("testing", values)
+        assert s.get_attributes() is values
+        assert s.test1 is True
+
     def test_repr(self):
         s = Section("testing", **{'test1': True, 'test2': "testing", 'test3': 17})
         assert repr(s) == "<Section testing>"
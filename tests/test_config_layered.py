@@ -0,0 +1,119 @@
+import os
+import pytest
+import shutil
+from commonkit.config.cache import clear_config_cache
+from commonkit.config.flat import FlatConfig
+from commonkit.config.layered import *
+from commonkit.context_managers import modified_environ
+
+# Fixtures
+
+
+@pytest.fixture
+def conf_d():
+    path = os.path.join("tests", "tmp-conf.d")
+    os.makedirs(path)
+
+    with open(os.path.join(path, "10-project.ini"), "w") as f:
+        f.write("[project]\ntitle = Rocket Boots\n")
+
+    with open(os.path.join(path, "20-client.ini"), "w") as f:
+        f.write("[client]\ncode = WILE\n")
+
+    with open(os.path.join(path, "30-project.ini"), "w") as f:
+        f.write("[project]\nrelease = 2\n")
+
+    with open(os.path.join(path, "40-local.py"), "w") as f:
+        f.write("debug = True\n")
+
+    with open(os.path.join(path, "README.txt"), "w") as f:
+        f.write("Ignored.\n")
+
+    yield path
+
+    shutil.rmtree(path)
+    clear_config_cache()
+
+# Tests
+
+
+class TestLayeredConfig(object):
+
+    def test_load(self, conf_d):
+        config = LayeredConfig(
+            os.path.join("tests", "config", "example.ini"),
+            conf_d,
+            defaults={'project.owner': "ACME", 'project.release': 0},
+            workers=2
+        )
+        assert config.load() is True
+        assert config.is_loaded is True
+        assert repr(config) == "<LayeredConfig 6 layers>"
+
+        assert config.get("project.title") == "Rocket Boots"
+        assert config.get_source("project.title") == os.path.join(conf_d, "10-project.ini")
+
+        assert config['project.release'] == 2
+        assert config.get_source("project.release") == os.path.join(conf_d, "30-project.ini")
+
+        assert config.get("client.name") == "ACME, Inc."
+        assert config.get_source("client.name") == os.path.join("tests", "config", "example.ini")
+        assert config.get("client.code") == "WILE"
+
+        assert config.get("project.owner") == "ACME"
+        assert config.get_source("project.owner") == "defaults"
+
+        assert config.get("nonexistent", default="testing") == "testing"
+        assert config.get_source("nonexistent") is None
+        assert config.has("project.active") is True
+        assert config.has("nonexistent") is False
+        assert "client.code" in config
+        assert len(config) == len(config.to_dict()) == 7
+
+        # Python files are loaded although their path is not a module name.
+        assert config.get("debug") is True
+        assert config.get_source("debug") == os.path.join(conf_d, "40-local.py")
+        assert sorted(config) == sorted(config.to_dict())
+
+    def test_load_environment(self):
+        config = LayeredConfig(os.path.join("tests", "config", "example.ini"), environment_prefix="EXAMPLE_")
+        with modified_environ(EXAMPLE_PROJECT__RELEASE="3", EXAMPLE_DEBUG="yes", EXAMPLE_="ignored"):
+            assert config.load() is True
+
+        assert config.get("project.release") == 3
+        assert config.get_source("project.release") == "environment"
+        assert config.get("debug") is True
+        assert config.layers == ["defaults", os.path.join("tests", "config", "example.ini"), "environment"]
+
+    def test_load_error(self):
+        config = LayeredConfig("nonexistent.ini")
+        assert config.load() is False
+        assert config.has_error is True
+        assert "nonexistent.ini" in config.get_error()
+
+        config = LayeredConfig(os.path.join("tests", "config", "example-bad.ini"))
+        assert config.load() is False
+        assert config.get_error() is not None
+
+        with pytest.raises(ValueError):
+            LayeredConfig(os.path.join("tests", "config", "example.xyz")).load()
+
+    def test_load_exception(self, conf_d):
+        with open(os.path.join(conf_d, "50-broken.py"), "w") as f:
+            f.write("debug = \n")
+
+        # Exceptions raised while loading a file (on a worker thread) are reported as errors.
+        config = LayeredConfig(conf_d, workers=2)
+        assert config.load() is False
+        assert "50-broken.py" in config.get_error()
+        assert config.is_loaded is False
+
+    def test_load_instances(self):
+        flat = FlatConfig(os.path.join("tests", "config", "example.cfg"))
+        assert flat.load() is True
+
+        config = LayeredConfig(flat, os.path.join("tests", "config", "config_test.py"))
+        assert config.load() is True
+        assert config.get("project_title") == "Example Project"
+        assert config.get("test2") == 123
+        assert config.has_error is False
@@ -33,3 +33,18 @@ class TestPython(object):
 
         config = PythonConfig(os.path.join("tests", "config", "config_test.py"), defaults={'test5': "testing"})
         assert config.load() is True
+
+        # An isolated configuration has its own module.
+        isolated = PythonConfig(os.path.join("tests", "config", "config_test.py"), isolated=True)
+        assert isolated.load() is True
+        assert isolated.get("test2") == 123
+        assert isolated._module is not config._module
+
+    def test_to_dict(self):
+        config = PythonConfig(os.path.join("tests", "config", "config_test.py"), defaults={'test5': "testing"})
+        config.load()
+
+        values = config.to_dict()
+        assert values['test2'] == 123
+        assert values['test5'] == "testing"
+        assert "os" not in values
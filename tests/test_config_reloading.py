@@ -0,0 +1,134 @@
+import os
+import pytest
+import time
+from commonkit.config.cache import clear_config_cache
+from commonkit.config.flat import FlatConfig
+from commonkit.config.ini import INIConfig
+from commonkit.config.py import PythonConfig
+from commonkit.config.reloading import *
+from tests.conftest import rewrite
+
+# Tests
+
+
+class TestReloadingConfig(object):
+
+    def test_background(self, ini_path):
+        received = list()
+
+        def on_change(changed=None, **kwargs):
+            received.append(changed)
+            return True, None
+
+        config_changed.connect(on_change, sender=ReloadingConfig)
+
+        with ReloadingConfig(INIConfig, ini_path, interval=0.05) as config:
+            assert config.is_running is True
+
+            rewrite(ini_path, "[project]\ntitle = Rocket Boots\nrelease = 1\n")
+
+            for i in range(100):
+                if received:
+                    break
+
+                time.sleep(0.05)
+
+            assert config.project.title == "Rocket Boots"
+
+        assert config.is_running is False
+        assert received == [["project.title"]]
+
+        config_changed.disconnect(on_change, sender=ReloadingConfig)
+
+    def test_reload(self, ini_path):
+        received = list()
+
+        def on_change(changed=None, config=None, reloader=None, **kwargs):
+            received.append((changed, config, reloader))
+            return True, None
+
+        config_changed.connect(on_change, sender=ReloadingConfig)
+
+        config = ReloadingConfig(INIConfig, ini_path, interval=None)
+        assert repr(config) == "<ReloadingConfig %s>" % ini_path
+        assert config.is_running is False
+        assert config.project.title == "Rocket Skates"
+        assert config.reload() is False
+
+        current = config.config
+        rewrite(ini_path, "[project]\ntitle = Rocket Boots\n\n[client]\ncode = ACME\n")
+        assert config.reload() is True
+        assert config.config is not current
+        assert config.client.code == "ACME"
+
+        changed, new_config, reloader = received[0]
+        assert changed == ["client.code", "project.release", "project.title"]
+        assert new_config is config.config
+        assert reloader is config
+
+        # Nothing has changed, so the signal is not sent.
+        assert config.reload(force=True) is True
+        assert len(received) == 1
+
+        config_changed.disconnect(on_change, sender=ReloadingConfig)
+
+    def test_reload_invalid(self, ini_path):
+        config = ReloadingConfig(INIConfig, ini_path, interval=None, validator=lambda c: c.has("project"))
+
+        # A broken file leaves the current configuration in place.
+        rewrite(ini_path, "[project\ntitle = Rocket Boots\n")
+        assert config.reload() is False
+        assert config.error is not None
+        assert config.project.title == "Rocket Skates"
+
+        rewrite(ini_path, "[client]\ncode = ACME\n")
+        assert config.reload() is False
+        assert config.error == "Validation failed for %s" % ini_path
+        assert config.project.release == 1
+
+        rewrite(ini_path, "[project]\ntitle = Rocket Boots\n")
+        assert config.reload() is True
+        assert config.error is None
+        assert config.project.title == "Rocket Boots"
+
+    def test_reload_flat(self):
+        path = os.path.join("tests", "config", "tmp-reloading.cfg")
+        with open(path, "w") as f:
+            f.write("user = deploy\n")
+
+        config = ReloadingConfig(FlatConfig, path, interval=None, defaults={'host': "example.com"})
+        assert config.user == "deploy"
+
+        rewrite(path, "user = root\n")
+        assert config.reload() is True
+        assert config.user == "root"
+        assert config.host == "example.com"
+
+        with pytest.raises(AttributeError):
+            config._nonexistent
+
+        os.remove(path)
+        clear_config_cache()
+
+    def test_reload_python(self):
+        path = os.path.join("tests", "config", "tmp_reloading.py")
+        with open(path, "w") as f:
+            f.write("title = \"Rocket Skates\"\n")
+
+        config = ReloadingConfig(PythonConfig, path, interval=None, validator=lambda c: c.has("title"))
+        assert config.title == "Rocket Skates"
+
+        # An invalid file does not change the current configuration while it is validated.
+        current = config.config
+        rewrite(path, "name = \"Rocket Boots\"\n")
+        assert config.reload() is False
+        assert config.config is current
+        assert config.title == "Rocket Skates"
+
+        rewrite(path, "title = \"Rocket Boots\"\n")
+        assert config.reload() is True
+        assert config.title == "Rocket Boots"
+        assert current.title == "Rocket Skates"
+
+        os.remove(path)
+        clear_config_cache()
@@ -0,0 +1,127 @@
+import os
+import pickle
+import pytest
+from commonkit.config.cache import clear_config_cache
+from commonkit.config.flat import FlatConfig
+from commonkit.config.ini import INIConfig
+from commonkit.config.snapshots import *
+from tests.conftest import rewrite
+
+# Fixtures
+
+
+@pytest.fixture
+def paths(ini_path):
+    rewrite(ini_path, "[project]\ntitle = {{ title }}\nrelease = 1\n")
+    snapshot_path = ini_path + ".snapshot"
+
+    yield ini_path, snapshot_path
+
+    if os.path.exists(snapshot_path):
+        os.remove(snapshot_path)
+
+# Tests
+
+
+def test_get_snapshot_header():
+    stat = os.stat(__file__)
+    header = get_snapshot_header(INIConfig, __file__, stat, {'b': 2, 'a': 1}, "dummy")
+    assert header[0] == SNAPSHOT_VERSION
+    assert header[1] == "commonkit.config.ini.INIConfig"
+    assert header == get_snapshot_header(INIConfig, __file__, stat, {'a': 1, 'b': 2}, "dummy")
+    assert header != get_snapshot_header(INIConfig, __file__, stat, {'a': 1, 'b': 3}, "dummy")
+    assert header != get_snapshot_header(FlatConfig, __file__, stat, {'a': 1, 'b': 2}, "dummy")
+    assert header != get_snapshot_header(INIConfig, __file__, stat, {'a': 1, 'b': 2})
+
+
+def test_read_snapshot(paths):
+    path, snapshot_path = paths
+    header = get_snapshot_header(INIConfig, path, os.stat(path))
+
+    assert read_snapshot(snapshot_path, header) is None
+
+    assert write_snapshot(snapshot_path, header, {'a': 1}) is True
+    assert read_snapshot(snapshot_path, header) == {'a': 1}
+    assert read_snapshot(snapshot_path, header[:-1] + ("changed",)) is None
+
+    with open(snapshot_path, "wb") as f:
+        f.write(b"not a snapshot")
+
+    assert read_snapshot(snapshot_path, header) is None
+
+    with open(snapshot_path, "wb") as f:
+        pickle.dump(header, f)
+
+    assert read_snapshot(snapshot_path, header) is None
+
+
+def test_write_snapshot(paths):
+    path, snapshot_path = paths
+    header = get_snapshot_header(INIConfig, path, os.stat(path))
+
+    assert write_snapshot(os.path.join("nonexistent", "snapshot"), header, dict()) is False
+    assert write_snapshot(snapshot_path, header, {'a': lambda: None}) is False
+
+    # The temporary file is removed.
+    assert not [name for name in os.listdir(os.path.join("tests", "config")) if name.startswith(".snapshot-")]
+    assert not os.path.exists(snapshot_path)
+
+
+def test_flat_snapshot():
+    path = os.path.join("tests", "config", "tmp-snapshot.cfg")
+    with open(path, "w") as f:
+        f.write("user = deploy\n")
+
+    snapshot_path = path + ".snapshot"
+
+    config = FlatConfig(path, cache=False, snapshot=snapshot_path)
+    assert config.load() is True
+    assert os.path.exists(snapshot_path)
+
+    header = get_snapshot_header(FlatConfig, path, os.stat(path), None, False)
+    assert read_snapshot(snapshot_path, header) == {'user': "deploy"}
+
+    config = FlatConfig(path, cache=False, defaults={'port': 22}, snapshot=snapshot_path)
+    assert config.load() is True
+    assert config.user == "deploy"
+    assert config.port == 22
+
+    os.remove(path)
+    os.remove(snapshot_path)
+
+
+def test_ini_snapshot(paths, monkeypatch):
+    path, snapshot_path = paths
+
+    config = INIConfig(path, context={'title': "Rocket Skates"}, snapshot=snapshot_path)
+    assert config.load() is True
+    assert os.path.exists(snapshot_path)
+
+    # A valid snapshot is loaded without rendering or parsing the file.
+    def parse_jinja_template(*args, **kwargs):
+        raise AssertionError("The file should not be parsed.")
+
+    monkeypatch.setattr("commonkit.config.ini.parse_jinja_template", parse_jinja_template)
+
+    clear_config_cache()
+    config = INIConfig(path, context={'title': "Rocket Skates"}, snapshot=snapshot_path)
+    assert config.load() is True
+    assert config.project.title == "Rocket Skates"
+    assert config.project.release == 1
+
+    # A different context is parsed again.
+    with pytest.raises(AssertionError):
+        INIConfig(path, context={'title': "Rocket Boots"}, snapshot=snapshot_path).load()
+
+    monkeypatch.undo()
+
+    config = INIConfig(path, context={'title': "Rocket Boots"}, snapshot=snapshot_path)
+    assert config.load() is True
+    assert config.project.title == "Rocket Boots"
+
+    # A changed file is parsed again.
+    rewrite(path, "[project]\ntitle = {{ title }}\n")
+    clear_config_cache()
+    config = INIConfig(path, context={'title': "Rocket Boots"}, snapshot=snapshot_path)
+    assert config.load() is True
+    assert config.project.release is None
@@ -1,5 +1,6 @@
 import os
-from commonkit.files import read_csv
+import pytest
+from commonkit.files import get_compression, read_csv, read_file, write_file, COMPRESSION
 from commonkit.csv.library import *
 
 
@@ -25,6 +26,30 @@ class TestCSVFile(object):
         csv = CSVFile(path)
         assert csv.first_row_field_names is False
 
+    def test_init_compact(self):
+        path = os.path.join("tests", "data", "example.csv")
+
+        with pytest.raises(ValueError):
+            CSVFile(path, compact=True, row_class=CSVRow)
+
+        with pytest.raises(ValueError):
+            CSVFile(path, columnar=True)
+
+        csv = CSVFile(path, columnar=True, mapping=AutoMapping())
+        assert csv.compact is True
+        assert isinstance(csv.rows, ColumnStore)
+
+    def test_follow(self):
+        path = os.path.join("tests", "data", "tmp.csv")
+        write_file(path, "first_name,salary\nBob,125000\nEd,120000\n")
+
+        csv = CSVFile(path, mapping=AutoMapping())
+        rows = list(csv.follow(interval=0.01, timeout=0.02))
+        assert len(rows) == 2
+        assert rows[1]['first_name'] == "Ed"
+
+        os.remove(path)
+
     def test_exists(self):
         path = os.path.join("tests", "data", "example.csv")
         csv = CSVFile(path)
@@ -126,6 +151,103 @@ class TestCSVFile(object):
         csv = CSVFile(path)
         assert csv.read() is True
 
+    def test_read_new(self):
+        path = os.path.join("tests", "data", "tmp.csv")
+        csv = CSVFile(path, mapping=AutoMapping(), smart_cast_fields=["salary"])
+        assert csv.read_new() == list()
+
+        # An incomplete row is left for the next call.
+        write_file(path, "first_name,salary\nBob,125000\nEd,")
+        rows = csv.read_new()
+        assert len(rows) == 1
+        assert rows[0]['salary'] == 125000
+        assert csv.read_new() == list()
+
+        # A line feed within a quoted value does not complete the row.
+        with open(path, "a") as f:
+            f.write('120000\nJack,"12\n')
+        rows = csv.read_new()
+        assert len(rows) == 1
+        assert rows[0]['first_name'] == "Ed"
+
+        with open(path, "a") as f:
+            f.write('000"\n')
+        rows = csv.read_new()
+        assert rows[0]['salary'] == "12\n000"
+        assert len(csv) == 3
+
+        # A truncated file is read from the top.
+        write_file(path, "first_name,salary\nJohn,100000\n")
+        rows = csv.read_new()
+        assert len(rows) == 1
+        assert rows[0]['first_name'] == "John"
+
+        # As is a file that has been replaced.
+        os.remove(path)
+        write_file(path, "first_name,salary\nAlice,1\nCarol,2\n")
+        rows = csv.read_new()
+        assert [row['first_name'] for row in rows] == ["Alice", "Carol"]
+
+        os.remove(path)
+
+        # Rows loaded by read() are not read again.
+        write_file(path, "first_name,salary\nBob,125000\n")
+        csv = CSVFile(path, mapping=AutoMapping(), smart_cast_fields=["salary"])
+        assert csv.read() is True
+        assert csv.read_new() == list()
+        assert len(csv) == 1
+
+        with open(path, "a") as f:
+            f.write("Ed,120000\n")
+        rows = csv.read_new()
+        assert len(rows) == 1
+        assert rows[0]['first_name'] == "Ed"
+        assert len(csv) == 2
+
+        os.remove(path)
+
+        csv = CSVFile(os.path.join("tests", "data", "example-no-columns.csv"), columnar=True,
+                      mapping=IndexMapping(first_name=0, salary=3), smart_cast_fields=["salary"])
+        rows = csv.read_new()
+        assert rows[0].salary == 125000
+        assert csv.rows.get_column("salary").typecode == "q"
+
+    def test_read_compressed(self):
+        path = os.path.join("tests", "data", "tmp.csv.gz")
+        write_file(path, read_file(os.path.join("tests", "data", "example.csv")))
+
+        csv = CSVFile(path, mapping=AutoMapping(), buffer_size=4096)
+        assert csv.read() is True
+        assert len(csv) == 3
+
+        with pytest.raises(ValueError):
+            csv.read_new()
+
+        os.remove(path)
+
+    def test_read_columnar(self):
+        path = os.path.join("tests", "data", "example.csv")
+        csv = CSVFile(path, columnar=True, mapping=AutoMapping(), smart_cast_fields=["salary"])
+        assert csv.read() is True
+        assert len(csv) == 3
+        assert csv.rows.get_column("salary").typecode == "q"
+        assert [row.salary for row in csv] == [125000, 120000, 12000]
+
+    def test_read_compact(self):
+        path = os.path.join("tests", "data", "example.csv")
+        csv = CSVFile(path, compact=True, mapping=AutoMapping(), smart_cast_fields=["salary"])
+        assert csv.read() is True
+        row = csv.rows[0]
+        assert isinstance(row, CompactRow)
+        assert row.first_name == "Bob"
+        assert row['salary'] == 125000
+        assert type(csv.rows[0]) is type(csv.rows[1])
+
+        path = os.path.join("tests", "data", "example-no-columns.csv")
+        csv = CSVFile(path, compact=True)
+        assert csv.read() is True
+        assert csv.rows[0] == ("Bob", "White", "CEO", "125000")
+
     def test_smart_cast(self):
         path = os.path.join("tests", "data", "example.csv")
         csv = CSVFile(path, mapping=AutoMapping(), smart_cast_fields=["salary"])
@@ -185,6 +307,94 @@ class TestCSVFile(object):
         assert os.path.exists(path)
         os.remove(path)
 
+        csv = CSVFile(os.path.join("tests", "data", "example.csv"), columnar=True, mapping=AutoMapping())
+        csv.read()
+        csv.write(path=path)
+        assert read_csv(path) == read_csv(os.path.join("tests", "data", "example.csv"))
+        os.remove(path)
+
+        path = os.path.join("tests", "data", "tmp.csv.bz2")
+        csv.write(path=path)
+        assert get_compression(path, detect=False) == COMPRESSION.BZ2
+        assert read_csv(path) == read_csv(os.path.join("tests", "data", "example.csv"))
+        os.remove(path)
+
+
+class TestColumnStore(object):
+
+    def test_append(self):
+        store = ColumnStore(fields=["name", "total"])
+        store.append({'name': "Bob", 'total': 1})
+        store.append({'name': "Ed", 'total': 2})
+        store.pack()
+        assert store.get_column("total").typecode == "q"
+
+        # A value that cannot be stored in the array unpacks the column.
+        store.append({'name': "Jack", 'total': None})
+        assert type(store.get_column("total")) is list
+        assert store[-1].total is None
+
+    def test_getitem(self):
+        store = ColumnStore()
+        store.append({'name': "Bob", 'total': 1.5})
+        store.append({'name': "Ed", 'total': 2.5})
+        assert store[0].name == "Bob"
+        assert store[-1]['total'] == 2.5
+        assert len(store[0:2]) == 2
+
+        with pytest.raises(IndexError):
+            print(store[2])
+
+    def test_iter(self):
+        store = ColumnStore()
+        store.append({'name': "Bob", 'total': 1})
+        store.append({'name': "Ed", 'total': 2})
+        assert [row.name for row in store] == ["Bob", "Ed"]
+
+    def test_pack(self):
+        store = ColumnStore()
+        store.append({'name': "Bob", 'rate': 1.5, 'total': 1, 'mixed': 1})
+        store.append({'name': "Ed", 'rate': 2.5, 'total': 2, 'mixed': 2.0})
+        store.pack()
+        assert type(store.get_column("name")) is list
+        assert store.get_column("rate").typecode == "d"
+        assert store.get_column("total").typecode == "q"
+        assert type(store.get_column("mixed")) is list
+        assert type(store[1].mixed) is float
+
+    def test_repr(self):
+        store = ColumnStore()
+        assert repr(store) == "<ColumnStore 0 rows>"
+
+
+class TestCompactRow(object):
+
+    def test_access(self):
+        row_class = make_row_class(["first_name", "count", "job title", "get"])
+        row = row_class(["Bob", 3, "CEO", "x"])
+        assert row.first_name == "Bob"
+        assert row.count == 3
+        assert row.nonexistent is None
+        assert row['job title'] == "CEO"
+        assert row['get'] == "x"
+        assert row.get("first_name") == "Bob"
+        assert row.get("nonexistent", "default") == "default"
+        assert row[0] == "Bob"
+        assert "count" in row
+        assert dict(row) == row.as_dict()
+        assert list(row.keys()) == ["first_name", "count", "job title", "get"]
+        assert dict(row.items())['count'] == 3
+
+    def test_make_row_class(self):
+        row_class = make_row_class(["first_name", "last_name"])
+        assert row_class is make_row_class(("first_name", "last_name"))
+        assert issubclass(row_class, CompactRow)
+        assert row_class.__dictoffset__ == 0
+
+    def test_repr(self):
+        row = make_row_class(["first_name"])(["Bob"])
+        assert repr(row) == "CompactRow(first_name='Bob')"
+
 
 class TestCSVRow(object):
 
@@ -0,0 +1,147 @@
+import os
+import pytest
+from commonkit.csv.library import AutoMapping, CSVFile, CSVRow
+from commonkit.csv.operators import *
+from commonkit.files import read_csv
+from commonkit.math import median
+
+ROWS = [
+    {'name': "Bob", 'team': "red", 'score': 10},
+    {'name': "Ed", 'team': "blue", 'score': 20},
+    {'name': "Jack", 'team': "red", 'score': 30},
+    {'name': "John", 'team': "blue", 'score': None},
+    {'name': "Bob", 'team': "green", 'score': 5},
+]
+
+
+def get_csv():
+    path = os.path.join("tests", "data", "example.csv")
+    return CSVFile(path, compact=True, mapping=AutoMapping(), smart_cast_fields=["salary"])
+
+
+def test_aggregate():
+    results = aggregate(
+        ROWS,
+        by="team",
+        members="count",
+        scores=("count", "score"),
+        total=("sum", "score"),
+        low=("min", "score"),
+        high=("max", "score"),
+        mean=("mean", "score"),
+        middle=(median, "score")
+    )
+    assert len(results) == 3
+    red = results[0]
+    assert red == {'team': "red", 'members': 2, 'scores': 2, 'total': 40, 'low': 10, 'high': 30, 'mean': 20.0,
+                   'middle': 20.0}
+
+    blue = results[1]
+    assert blue['members'] == 2
+    assert blue['scores'] == 1
+    assert blue['mean'] == 20.0
+
+    results = aggregate(ROWS, total=("sum", "score"))
+    assert results == [{'total': 65}]
+
+    results = aggregate(list(), members="count", mean=("mean", "score"))
+    assert results == [{'members': 0, 'mean': None}]
+
+    results = aggregate(get_csv().iter_rows(), by=["job_title"], total=("sum", "salary"))
+    assert results[0] == {'job_title': "CEO", 'total': 125000}
+
+    # Values that have not been cast are summed as numbers.
+    rows = [{'salary': "10"}, {'salary': "20.5"}, {'salary': None}]
+    results = aggregate(rows, total=("sum", "salary"), mean=("mean", "salary"))
+    assert results == [{'total': 30.5, 'mean': 15.25}]
+
+    csv = CSVFile(os.path.join("tests", "data", "example.csv"), mapping=AutoMapping())
+    results = aggregate(csv.iter_rows(), total=("sum", "salary"))
+    assert results == [{'total': 257000}]
+
+    with pytest.raises(ValueError):
+        aggregate(csv.iter_rows(), total=("sum", "job_title"))
+
+    with pytest.raises(ValueError):
+        aggregate(ROWS, total="sum")
+
+    with pytest.raises(ValueError):
+        aggregate(ROWS, total=("nonexistent", "score"))
+
+
+def test_aggregate_partitions():
+    results = aggregate(ROWS, by="team", partitions=2, members="count", total=("sum", "score"))
+    results = {result['team']: result for result in results}
+    assert results['red']['total'] == 40
+    assert results['blue']['members'] == 2
+    assert results['green']['total'] == 5
+
+    # There is only one group without by, so a single result is returned.
+    results = aggregate(ROWS, partitions=3, members="count", total=("sum", "score"))
+    assert results == [{'members': 5, 'total': 65}]
+
+
+def test_distinct():
+    rows = list(distinct(ROWS, "name"))
+    assert [row['name'] for row in rows] == ["Bob", "Ed", "Jack", "John"]
+    assert rows[0]['team'] == "red"
+
+    rows = list(distinct(ROWS + ROWS))
+    assert len(rows) == 5
+
+    rows = list(distinct([CSVRow(name="Bob"), CSVRow(name="Bob")]))
+    assert len(rows) == 1
+
+    rows = list(distinct(ROWS, ["name"], partitions=3))
+    assert sorted([row['name'] for row in rows]) == ["Bob", "Ed", "Jack", "John"]
+
+    # Compact rows are restored when read back from a partition.
+    rows = list(distinct(get_csv().iter_rows(), partitions=2))
+    assert len(rows) == 3
+    assert sorted([row.first_name for row in rows]) == ["Bob", "Ed", "Jack"]
+
+
+def test_filter_rows():
+    rows = list(filter_rows(ROWS, team="red"))
+    assert len(rows) == 2
+
+    rows = list(filter_rows(ROWS, team=["red", "green"], name="Bob"))
+    assert len(rows) == 2
+
+    rows = list(filter_rows(ROWS, lambda row: row['score'] is not None and row['score'] > 10))
+    assert [row['name'] for row in rows] == ["Ed", "Jack"]
+
+    rows = list(filter_rows(get_csv().iter_rows(), lambda row: row.salary > 100000))
+    assert len(rows) == 2
+
+    # Row methods are not mistaken for missing fields.
+    rows = list(filter_rows(get_csv().iter_rows(), count=None, index=None))
+    assert len(rows) == 3
+
+
+def test_group_by():
+    groups = dict(group_by(ROWS, "team"))
+    assert len(groups[("red",)]) == 2
+    assert len(groups[("green",)]) == 1
+
+    groups = dict(group_by(ROWS, ["team", "name"], partitions=2))
+    assert len(groups) == 5
+    assert groups[("red", "Bob")][0]['score'] == 10
+
+
+def test_to_csv_file():
+    path = os.path.join("tests", "data", "tmp.csv")
+    results = aggregate(ROWS, by="team", total=("sum", "score"))
+
+    csv = to_csv_file(results, path)
+    assert isinstance(csv, CSVFile)
+    assert len(csv) == 3
+
+    csv.write()
+    rows = read_csv(path)
+    assert rows[0] == ["team", "total"]
+    assert rows[1] == ["red", "40"]
+    os.remove(path)
+
+    csv = to_csv_file([CSVRow(name="Bob")], path, fields=["name"])
+    assert csv.rows[0] == {'name': "Bob"}
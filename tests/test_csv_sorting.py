@@ -0,0 +1,63 @@
+import os
+import pytest
+from commonkit.files import read_csv, write_file
+from commonkit.csv.sorting import *
+
+
+def test_sort_csv():
+    path = os.path.join("tests", "data", "tmp-unsorted.csv")
+    out = os.path.join("tests", "data", "tmp-sorted.csv")
+
+    lines = ["name,group,total"]
+    for index in range(100):
+        lines.append("row%s,%s,%s" % (index, "ab"[index % 2], 100 - index))
+
+    write_file(path, "\n".join(lines) + "\n")
+
+    # A small memory limit forces several runs to be merged, and the merge limit forces intermediate runs.
+    assert sort_csv(path, out, key="total", memory_limit=500, merge_limit=3) == 100
+    rows = read_csv(out)
+    assert rows[0] == ["name", "group", "total"]
+    assert [int(row[2]) for row in rows[1:]] == list(range(1, 101))
+
+    # Without casting, values are compared as strings.
+    sort_csv(path, out, key="total", cast=False)
+    rows = read_csv(out)
+    assert rows[1][2] == "1"
+    assert rows[2][2] == "10"
+
+    # Rows with the same key retain their original order.
+    sort_csv(path, out, key=["group"], memory_limit=500)
+    rows = read_csv(out)
+    assert rows[1][0] == "row0"
+    assert rows[2][0] == "row2"
+    assert rows[51][0] == "row1"
+
+    sort_csv(path, out, key=["group", "total"], memory_limit=500, reverse=True)
+    rows = read_csv(out)
+    assert rows[1] == ["row1", "b", "99"]
+
+    assert sort_csv(path, out, key="group", deduplicate=True, memory_limit=500) == 2
+    rows = read_csv(out)
+    assert rows[1][0] == "row0"
+    assert rows[2][0] == "row1"
+
+    with pytest.raises(ValueError):
+        sort_csv(path, out, key="nonexistent")
+
+    with pytest.raises(ValueError):
+        sort_csv(path, out, key="total", merge_limit=1)
+
+    os.remove(out)
+    os.remove(path)
+
+
+def test_sort_csv_without_column_names():
+    path = os.path.join("tests", "data", "example-no-columns.csv")
+    out = os.path.join("tests", "data", "tmp-sorted.csv.gz")
+
+    assert sort_csv(path, out, key=3, first_row_field_names=False) == 3
+    rows = read_csv(out)
+    assert [row[3] for row in rows] == ["12000", "120000", "125000"]
+
+    os.remove(out)
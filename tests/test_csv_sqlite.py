@@ -0,0 +1,69 @@
+import os
+import pytest
+from commonkit.csv.library import AutoMapping, CSVFile, CSVRow, KeywordMapping
+from commonkit.csv.sqlite import *
+
+
+def test_to_sqlite():
+    path = os.path.join("tests", "data", "example.csv")
+    csv = CSVFile(path, mapping=AutoMapping())
+
+    db = to_sqlite(csv, "people", indexes=["job_title", ("last_name", "first_name")])
+    assert csv.is_loaded is False
+
+    columns = {column['name']: str(column['type']) for column in db.backend.get_columns("people", verbose=True)}
+    assert columns == {'first_name': "TEXT", 'last_name': "TEXT", 'job_title': "TEXT", 'salary': "INTEGER"}
+
+    result = db.select("people", job_title="CEO")
+    assert result.count == 1
+    assert result.rows[0].salary == 125000
+    assert db.sum("salary", "people").aggregate == 257000
+
+    result = db.raw("SELECT * FROM people INDEXED BY people_job_title WHERE job_title = 'CIO'")
+    assert result.success is True
+
+
+def test_to_sqlite_file():
+    path = os.path.join("tests", "data", "example-unnormalized-columns.csv")
+    mapping = KeywordMapping(first_name="First Name", salary="Salary")
+    csv = CSVFile(path, mapping=mapping, row_class=CSVRow, smart_cast_fields=["salary"])
+    assert csv.read() is True
+
+    db_path = os.path.join("tests", "tmp-csv.db")
+    db = to_sqlite(csv, "people", path=db_path, prefix="test", types={'salary': "REAL"})
+    assert db.average("salary", "people").aggregate == 85666.66666666667
+
+    columns = {column['name']: str(column['type']) for column in db.backend.get_columns("test_people", verbose=True)}
+    assert columns['salary'] == "REAL"
+
+    # Rows are added to an existing table unless it is replaced.
+    to_sqlite(csv, "people", path=db_path, prefix="test", replace=False)
+    assert db.count("people", column="salary").aggregate == 6
+
+    db = to_sqlite(csv, "people", path=db_path, prefix="test")
+    assert db.count("people", column="salary").aggregate == 3
+
+    os.remove(db_path)
+
+
+def test_to_sqlite_types():
+    path = os.path.join("tests", "data", "tmp.csv")
+    with open(path, "w") as f:
+        f.write("name,rate,mixed,empty,zip,count\nBob,1.5,1,,02134,0\nEd,2,abc,NA,10001,-5\n")
+
+    csv = CSVFile(path, compact=True, mapping=AutoMapping())
+    db = to_sqlite(csv, "rates", batch_size=1)
+    columns = {column['name']: str(column['type']) for column in db.backend.get_columns("rates", verbose=True)}
+    assert columns == {'name': "TEXT", 'rate': "REAL", 'mixed': "TEXT", 'empty': "TEXT", 'zip': "TEXT",
+                       'count': "INTEGER"}
+    assert db.count("rates", column="name").aggregate == 2
+
+    # Leading zeros are kept.
+    result = db.select("rates", name="Bob")
+    assert result.rows[0].zip == "02134"
+
+    os.remove(path)
+
+    csv = CSVFile(os.path.join("tests", "data", "example-no-columns.csv"))
+    with pytest.raises(ValueError):
+        to_sqlite(csv, "people")
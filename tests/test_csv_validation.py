@@ -0,0 +1,137 @@
+import os
+import pytest
+from commonkit.csv.library import AutoMapping, CSVFile, IndexMapping, KeywordMapping
+from commonkit.csv.validation import *
+
+UPLOAD = """Email,Salary,Zip Code,Active
+bob@example.com,125000,12345,yes
+not-an-email,-5,1234,maybe
+bob@example.com,abc,,no
+,N/A,54321,
+"""
+
+
+@pytest.fixture
+def upload():
+    path = os.path.join("tests", "data", "tmp-upload.csv")
+    with open(path, "w") as f:
+        f.write(UPLOAD)
+
+    yield path
+
+    os.remove(path)
+
+
+def get_schema(**kwargs):
+    return Schema(
+        Field("email", required=True, type="email", unique=True),
+        Field("salary", type="integer", minimum=0),
+        Field("zip_code", pattern=r"[0-9]{5}"),
+        Field("active", type="bool"),
+        **kwargs
+    )
+
+
+class TestField(object):
+
+    def test_check(self):
+        f = Field("salary", type="integer", minimum=0, maximum=100)
+        assert f.check("50") is None
+        assert f.check("-1") == "Value is less than 0."
+        assert f.check("101") == "Value is greater than 100."
+        assert f.check("1.5") == "Value is not a valid integer."
+
+        f = Field("title", minimum=2, maximum=4)
+        assert f.check("abc") is None
+        assert f.check("a") == "Value is less than 2."
+
+        f = Field("job_title", choices=["CEO", "CIO"])
+        assert f.check("CIO") is None
+        assert f.check("CFO") == "Value is not one of the acceptable choices."
+
+        f = Field("amount", type="decimal")
+        assert f.check("1.50") is None
+        assert f.check("1.5.0") == "Value is not a valid decimal."
+
+        f = Field("rate", type="float", maximum=1.0)
+        assert f.check("0.5") is None
+        assert f.check("nope") == "Value is not a valid float."
+
+        f = Field("total", type=lambda v: int(v, 16))
+        assert f.check("ff") is None
+        assert f.check("zz") == "Value is not a valid value."
+
+        f = Field("code", type=str.upper, minimum=1)
+        assert f.check("abc") == "Value cannot be compared with the minimum or maximum."
+
+    def test_init(self):
+        with pytest.raises(ValueError):
+            Field("testing", type="unknown")
+
+        with pytest.raises(ValueError):
+            Field("active", type="bool", minimum=0)
+
+        with pytest.raises(ValueError):
+            Field("email", type="email", maximum=100)
+
+        f = Field("testing", pattern=r"[a-z]+")
+        assert f.pattern.fullmatch("abc") is not None
+        assert f.type == "string"
+        assert repr(f) == "<Field testing>"
+
+
+class TestSchema(object):
+
+    def test_validate(self, upload):
+        result = get_schema().validate(CSVFile(upload, mapping=AutoMapping()))
+        assert result.is_valid is False
+        assert result.is_truncated is False
+        assert result.rows == 4
+
+        errors = [(e.row, e.column, e.field, e.message) for e in result]
+        assert errors == [
+            (3, 0, "email", "Value is not a valid email."),
+            (3, 1, "salary", "Value is less than 0."),
+            (3, 2, "zip_code", "Value does not match the required pattern."),
+            (3, 3, "active", "Value is not a valid bool."),
+            (4, 0, "email", "Value is not unique."),
+            (4, 1, "salary", "Value is not a valid integer."),
+            (5, 0, "email", "Value is required."),
+        ]
+        assert result.errors[0].value == "not-an-email"
+        assert repr(result) == "<ValidationResult 4 rows, 7 errors>"
+
+    def test_validate_chunks(self, upload):
+        expected = get_schema().validate(CSVFile(upload, mapping=AutoMapping())).errors
+
+        result = get_schema(chunk_size=1).validate(CSVFile(upload, mapping=AutoMapping()))
+        assert result.errors == expected
+
+        result = get_schema(chunk_size=2).validate(CSVFile(upload, mapping=AutoMapping()), workers=2)
+        assert result.errors == expected
+        assert result.rows == 4
+
+    def test_validate_mappings(self, upload):
+        mapping = KeywordMapping(email="Email", phone="Phone")
+        schema = Schema(Field("email", unique=True), Field("phone", required=True), Field("fax"))
+        result = schema.validate(CSVFile(upload, mapping=mapping))
+        assert [e.to_tuple() for e in result] == [
+            (1, None, "phone", "Column is missing.", None),
+            (4, 0, "email", "Value is not unique.", "bob@example.com"),
+        ]
+
+        schema = Schema(Field("salary", type="integer"))
+        result = schema.validate(CSVFile(upload, mapping=IndexMapping(salary=1)))
+        assert [(e.row, e.value) for e in result] == [(1, "Salary"), (4, "abc")]
+
+        result = Schema(Field(2, required=True)).validate(CSVFile(upload))
+        assert [(e.row, e.column) for e in result] == [(4, 2)]
+
+    def test_validate_max_errors(self, upload):
+        result = get_schema(max_errors=3).validate(CSVFile(upload, mapping=AutoMapping()))
+        assert len(result) == 3
+        assert result.is_truncated is True
+
+        result = get_schema(max_errors=3, chunk_size=1).validate(CSVFile(upload, mapping=AutoMapping()), workers=2)
+        assert len(result) == 3
+        assert result.is_truncated is True
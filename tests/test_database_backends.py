@@ -137,3 +137,12 @@ class TestSQLite(object):
 
         b = SQLite(path="memory")
         assert b._get_url() == "sqlite://"
+
+    def test_memory(self):
+        db = load_database("sqlite", path="memory")
+        assert db.raw("CREATE TABLE testing (title VARCHAR(128))").success is True
+        assert db.insert("testing", {'title': "Testing"}).success is True
+
+        # The table remains after the connection has been closed.
+        assert db.backend.is_open is False
+        assert db.count("testing", column="title").aggregate == 1
@@ -89,6 +89,22 @@ class TestDatabase(object):
         assert result.error is None
         assert result.count == 1
 
+    def test_insert_many(self, database_handle):
+        rows = [{'title': "Bulk Page %s" % i, 'popularity': float(i)} for i in range(5)]
+        result = db.insert_many("page", rows, batch_size=2)
+        assert result.error is None
+        assert result.count == 5
+        assert db.count("page").aggregate == 8
+
+        result = db.insert_many("page", list())
+        assert result.count == 0
+
+        # Nothing is added when a record fails.
+        rows = [{'title': "Bulk Page 6"}, {'title': None}]
+        result = db.insert_many("page", rows, batch_size=1)
+        assert result.success is False
+        assert db.count("page").aggregate == 8
+
     def test_max(self, database_handle):
         """Check that max is correctly calculated."""
         result = db.max("popularity", "page")
@@ -1,10 +1,16 @@
+import errno
+import hashlib
+import json
 import logging
 import os
 import shutil
+import time
 
 import pytest
 
+from commonkit.files.constants import COMPRESSION, WRITE
 from commonkit.files.library import *
+from commonkit.files.library import _get_jinja_environment
 
 
 def patch_os_path_getsize_0(path):
@@ -40,10 +46,69 @@ def test_append_file():
     content = read_file(path)
     assert "Something else has happened." in content
 
+    assert append_file(path, " And more.", line_feed=False) is True
+    content = read_file(path)
+    assert content.endswith("Something else has happened. And more.")
+
+    os.remove(path)
+
+    path = os.path.join("tmp", "test.log.gz")
+    write_file(path, content="first")
+    assert append_file(path, "second") is True
+    assert read_file(path) == "first\nsecond"
+
     os.remove(path)
     os.rmdir(os.path.dirname(path))
 
 
+class TestFileAppender(object):
+
+    def test_write(self):
+        path = os.path.join("tests", "tmp-appender", "audit.log")
+        appender = FileAppender(path, flush_size=20, fsync=True, make_directories=True)
+        assert repr(appender) == "<FileAppender %s>" % path
+
+        appender.write("one")
+        assert read_file(path) == ""
+
+        appender.write("two two two two")
+        assert read_file(path) == "one\ntwo two two two\n"
+
+        appender.write("three")
+        appender.flush()
+        assert read_file(path) == "one\ntwo two two two\nthree\n"
+
+        appender.close()
+        appender.close()
+        with pytest.raises(ValueError):
+            appender.write("four")
+
+        with FileAppender(path, line_feed="|") as appender:
+            appender.write("four")
+
+        assert read_file(path) == "one\ntwo two two two\nthree\nfour|"
+
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+    def test_interval(self):
+        path = os.path.join("tests", "tmp-appender", "audit.log")
+        appender = FileAppender(path, interval=0.05, make_directories=True)
+        appender.write("one")
+
+        for i in range(100):
+            if read_file(path):
+                break
+
+            time.sleep(0.01)
+
+        assert read_file(path) == "one\n"
+        appender.close()
+
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
 def test_copy_file():
     """Check that files copy correctly."""
     from_path = os.path.join("tests", "readme.markdown")
@@ -61,6 +126,75 @@ def test_copy_file():
     assert success is False
     assert isinstance(message, str)
 
+    # A missing source is reported even when the destination exists.
+    success, message = copy_file(os.path.join("tests", "nonexistent.txt"), from_path)
+    assert success is False
+    assert isinstance(message, str)
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/cpuinfo"), reason="Requires /proc.")
+def test_copy_file_unsized():
+    """Check that files which report a size of 0 are copied in full."""
+    to_path = os.path.join("tests", "tmp-cpuinfo.txt")
+    assert os.stat("/proc/cpuinfo").st_size == 0
+
+    calls = list()
+    success, message = copy_file("/proc/cpuinfo", to_path, progress=lambda *args: calls.append(args))
+    assert success is True
+    assert os.path.getsize(to_path) > 0
+    assert calls[-1] == (os.path.getsize(to_path), os.path.getsize(to_path))
+
+    os.remove(to_path)
+
+
+def test_copy_file_chunks(monkeypatch):
+    from_path = os.path.join("tests", "readme.markdown")
+    to_path = os.path.join("tests", "tmp-copy")
+    os.makedirs(to_path)
+
+    with open(from_path, "rb") as f:
+        expected = f.read()
+
+    calls = list()
+    success, message = copy_file(from_path, to_path, chunk_size=100, progress=lambda *args: calls.append(args),
+                                 reflink=False)
+    assert success is True
+    copied_path = os.path.join(to_path, "readme.markdown")
+    with open(copied_path, "rb") as f:
+        assert f.read() == expected
+
+    assert calls[-1] == (len(expected), len(expected))
+    assert len(calls) == (len(expected) + 99) // 100
+    assert os.stat(copied_path).st_mtime == os.stat(from_path).st_mtime
+
+    # Unsupported system calls fall back to reading and writing.
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+
+    calls = list()
+    success, message = copy_file(from_path, copied_path, chunk_size=100, progress=lambda *args: calls.append(args))
+    assert success is True
+    with open(copied_path, "rb") as f:
+        assert f.read() == expected
+
+    assert calls[-1] == (len(expected), len(expected))
+
+    # Copying a file onto itself, a hard link, or its own directory does not truncate it.
+    link_path = os.path.join(to_path, "link.markdown")
+    os.link(copied_path, link_path)
+    for path in (copied_path, link_path, to_path):
+        success, message = copy_file(copied_path, path)
+        assert success is False
+        assert "same file" in message
+
+    with open(copied_path, "rb") as f:
+        assert f.read() == expected
+
+    shutil.rmtree(to_path)
+
 
 def test_copy_tree(caplog):
     """Check that a tree is copied correctly."""
@@ -86,6 +220,104 @@ def test_copy_tree(caplog):
     shutil.rmtree(to_path)
 
 
+def test_copy_tree_incremental():
+    from_path = os.path.join("tests", "tmp-source")
+    to_path = os.path.join("tests", "tmp-destination")
+    write_file(os.path.join(from_path, "a.txt"), "a", make_directories=True)
+    write_file(os.path.join(from_path, "sub", "b.txt"), "b", make_directories=True)
+    os.makedirs(to_path)
+
+    result = copy_tree(from_path, to_path, incremental=True, summary=True)
+    assert result.success is True
+    assert sorted(result.copied) == ["a.txt", os.path.join("sub", "b.txt")]
+    assert result.skipped == []
+
+    write_file(os.path.join(from_path, "a.txt"), "aa")
+    write_file(os.path.join(to_path, "extra.txt"), "extra")
+    write_file(os.path.join(to_path, "old", "c.txt"), "c", make_directories=True)
+
+    result = copy_tree(from_path, to_path, delete=True, incremental=True, summary=True, workers=2)
+    assert result.copied == ["a.txt"]
+    assert result.skipped == [os.path.join("sub", "b.txt")]
+    assert sorted(result.deleted) == ["extra.txt", "old", os.path.join("old", "c.txt")]
+    assert os.path.exists(os.path.join(to_path, "old")) is False
+    assert read_file(os.path.join(to_path, "a.txt")) == "aa"
+    assert repr(result) == "<CopySummary copied=1 skipped=1 deleted=3 failed=0>"
+
+    # Content is compared when the modification time differs.
+    os.utime(os.path.join(to_path, "a.txt"), (0, 0))
+    result = copy_tree(from_path, to_path, checksum=True, incremental=True, summary=True)
+    assert result.copied == []
+    assert len(result.skipped) == 2
+
+    result = copy_tree(from_path, to_path, incremental=True, summary=True)
+    assert result.copied == ["a.txt"]
+
+    result = copy_tree(from_path, os.path.join("tests", "nonexistent"), summary=True)
+    assert bool(result) is False
+
+    shutil.rmtree(from_path)
+    shutil.rmtree(to_path)
+
+
+def test_find_duplicates():
+    path = os.path.join("tests", "tmp-duplicates")
+    write_file(os.path.join(path, "a.txt"), "same", make_directories=True)
+    write_file(os.path.join(path, "sub", "b.txt"), "same", make_directories=True)
+    write_file(os.path.join(path, "c.txt"), "diff")
+    write_file(os.path.join(path, "empty1.txt"))
+    write_file(os.path.join(path, "empty2.txt"))
+
+    # Large files that differ only in the middle are identified by the full hash.
+    large = "x" * 100 + "%s" + "x" * 100
+    write_file(os.path.join(path, "large1.txt"), large % "1")
+    write_file(os.path.join(path, "large2.txt"), large % "2")
+    write_file(os.path.join(path, "large3.txt"), large % "1")
+    os.link(os.path.join(path, "large3.txt"), os.path.join(path, "large4.txt"))
+    os.symlink("a.txt", os.path.join(path, "link.txt"))
+
+    duplicates = find_duplicates(path, block_size=10, workers=2)
+    assert duplicates == [
+        [os.path.join(path, "a.txt"), os.path.join(path, "sub", "b.txt")],
+        [os.path.join(path, "large1.txt"), os.path.join(path, "large3.txt")],
+    ]
+
+    duplicates = find_duplicates(path, algorithm="md5", min_size=0)
+    assert [os.path.join(path, "empty1.txt"), os.path.join(path, "empty2.txt")] in duplicates
+
+    shutil.rmtree(path)
+
+
+def test_get_compression():
+    assert get_compression("example.csv.gz") == COMPRESSION.GZIP
+    assert get_compression("example.csv.bz2") == COMPRESSION.BZ2
+    assert get_compression("example.csv.xz") == COMPRESSION.XZ
+    assert get_compression("nonexistent.csv") is None
+    assert get_compression(os.path.join("tests", "data", "example.csv")) is None
+
+    path = os.path.join("tests", "data", "tmp.csv.gz")
+    write_file(path, "a,b\n1,2\n")
+    renamed = os.path.join("tests", "data", "tmp.csv")
+    os.rename(path, renamed)
+    assert get_compression(renamed) == COMPRESSION.GZIP
+    assert get_compression(renamed, detect=False) is None
+    os.remove(renamed)
+
+    path = os.path.join("tests", "data", "tmp.csv.bz2")
+    write_file(path, "a,b\n1,2\n")
+    os.rename(path, renamed)
+    assert get_compression(renamed) == COMPRESSION.BZ2
+    os.remove(renamed)
+
+    # Text that happens to start with "BZh" is not bzip2.
+    with open(renamed, "w") as f:
+        f.write("BZh,count\n1,2\n")
+
+    assert get_compression(renamed) is None
+    assert read_file(renamed) == "BZh,count\n1,2\n"
+    os.remove(renamed)
+
+
 def test_get_files():
 
     path = os.path.join("tests", "config", "example.cfg")
@@ -103,6 +335,115 @@ def test_get_files():
     assert len(files) == 5
 
 
+def test_hash_file():
+    path = os.path.join("tests", "readme.markdown")
+    with open(path, "rb") as f:
+        content = f.read()
+
+    assert hash_file(path) == hashlib.sha256(content).hexdigest()
+    assert hash_file(path, algorithm="md5", chunk_size=7) == hashlib.md5(content).hexdigest()
+
+    with pytest.raises(ValueError):
+        hash_file(path, algorithm="nonexistent")
+
+
+def test_iter_files():
+    path = os.path.join("tests", "tmp-iter")
+    for name in ("a.py", "b.txt", ".hidden.py", os.path.join("sub", "c.py"), os.path.join("sub", "deep", "d.py"),
+                 os.path.join("__pycache__", "e.py"), os.path.join(".git", "f.py")):
+        write_file(os.path.join(path, name), make_directories=True)
+
+    def names(**kwargs):
+        return sorted([os.path.relpath(p, path).replace(os.sep, "/") for p in iter_files(path, **kwargs)])
+
+    assert names() == [
+        "__pycache__/e.py",
+        "a.py",
+        "b.txt",
+        "sub/c.py",
+        "sub/deep/d.py",
+    ]
+    assert names(extensions=".txt") == ["b.txt"]
+    assert names(extensions=[".py", ".txt"], ignore=["__py*"], max_depth=1) == ["a.py", "b.txt", "sub/c.py"]
+    assert names(max_depth=0, hidden=True) == [".hidden.py", "a.py", "b.txt"]
+    assert names(hidden=True, ignore=["__pycache__", "sub"]) == [".git/f.py", ".hidden.py", "a.py", "b.txt"]
+    assert names(pattern="[cd].py") == ["sub/c.py", "sub/deep/d.py"]
+    assert names(regex=r"^sub/") == ["sub/c.py", "sub/deep/d.py"]
+
+    entries = list(iter_files(path, entries=True, max_depth=0, pattern="a.py"))
+    assert entries[0].name == "a.py"
+    assert entries[0].stat().st_size == 0
+
+    with pytest.raises(ValueError):
+        list(iter_files(os.path.join(path, "a.py")))
+
+    shutil.rmtree(path)
+
+
+def test_map_file():
+    path = os.path.join("tests", "data", "tmp-mapped.log")
+    with open(path, "wb") as f:
+        f.write(b"INFO start\r\nERROR one\nINFO middle\nERROR two")
+
+    with map_file(path) as f:
+        assert repr(f) == "<MappedFile %s>" % path
+        assert len(f) == 43
+        assert f[:4] == b"INFO"
+        assert f.count(b"ERROR") == 2
+        assert f.find(b"ERROR") == 12
+        assert f.find(b"ERROR", 0, 12) == -1
+        assert list(f.find_all(b"ERROR")) == [12, 34]
+        assert list(f.find_all(b"")) == []
+        assert f.get_line(0) == b"INFO start"
+        assert f.get_line(14) == b"ERROR one"
+        assert f.get_line(40) == b"ERROR two"
+        assert [m.group(1) for m in f.search(rb"ERROR (\w+)")] == [b"one", b"two"]
+
+        view = f.view(12, 17)
+        assert view.tobytes() == b"ERROR"
+        view.release()
+
+    with map_file(path, writable=True) as f:
+        f.data[0:4] = b"WARN"
+
+    assert read_file(path).startswith("WARN start")
+
+    write_file(path)
+    with map_file(path) as f:
+        assert len(f) == 0
+        assert f.count(b"ERROR") == 0
+        assert f.get_line(0) == b""
+
+    os.remove(path)
+
+    with pytest.raises(ValueError):
+        with map_file(os.path.join("tests", "data", "example.csv.gz")):
+            pass
+
+
+def test_open_file():
+    content = "first_name,last_name\nBob,White\n"
+    for extension in (".bz2", ".gz", ".xz"):
+        path = os.path.join("tests", "data", "tmp.csv" + extension)
+        with open_file(path, "w", buffer_size=1024) as f:
+            f.write(content)
+
+        with open_file(path, buffer_size=1024) as f:
+            assert f.read() == content
+
+        with open_file(path, "rb", compression=False) as f:
+            assert f.read() != content.encode()
+
+        os.remove(path)
+
+    path = os.path.join("tests", "data", "example.csv")
+    with open_file(path, "rb") as f:
+        assert f.read().startswith(b"first_name")
+
+    with pytest.raises(ValueError):
+        open_file(path, compression="zip")
+
+
 def test_parse_jinja_template():
     """Check the output of template file processing."""
 
@@ -118,6 +459,17 @@ def test_parse_jinja_template():
     output = parse_jinja_template(path, context)
     assert "This is the content." in output
 
+    # The environment is reused.
+    hits = _get_jinja_environment.cache_info().hits
+    assert parse_jinja_template(path, context) == output
+    assert _get_jinja_environment.cache_info().hits == hits + 1
+
+    cache_path = os.path.join("tests", "tmp-bytecode")
+    assert parse_jinja_template(path, context, bytecode_cache=cache_path) == output
+    assert len(os.listdir(cache_path)) == 1
+
+    shutil.rmtree(cache_path)
+
 
 def test_read_csv():
     """Check the output of reading a CSV file."""
@@ -134,12 +486,91 @@ def test_read_csv():
     assert len(rows) == count_3
 
 
+def test_read_chunks():
+    path = os.path.join("tests", "data", "example.csv")
+    content = read_file(path)
+
+    chunks = list(read_chunks(path, chunk_size=10))
+    assert "".join(chunks) == content
+    assert len(chunks[0]) == 10
+
+    chunks = list(read_chunks(path, binary=True, chunk_size=1000))
+    assert chunks == [content.encode("utf-8")]
+
+    path = os.path.join("tests", "data", "tmp.txt.gz")
+    write_file(path, content)
+    assert "".join(read_chunks(path, chunk_size=7)) == content
+    os.remove(path)
+
+
 def test_read_file():
     """Check that a file may be read."""
     path = os.path.join("tests", "readme.markdown")
     output = read_file(path)
     assert "Tests are located in this directory." in output
 
+    path = os.path.join("tests", "data", "tmp.txt.gz")
+    write_file(path, "This is a compressed file.")
+    assert read_file(path) == "This is a compressed file."
+    os.remove(path)
+
+
+def test_read_lines():
+    path = os.path.join("tests", "data", "tmp-lines.txt")
+    write_file(path, "one\r\ntwo\n\nthree")
+
+    assert list(read_lines(path)) == ["one", "two", "", "three"]
+    assert list(read_lines(path, buffer_size=2, line_endings=True)) == ["one\n", "two\n", "\n", "three"]
+
+    os.remove(path)
+
+
+def test_tree_stats():
+    path = os.path.join("tests", "tmp-tree")
+    write_file(os.path.join(path, "readme.txt"), "12345", make_directories=True)
+    write_file(os.path.join(path, "a", "one.py"), "1", make_directories=True)
+    write_file(os.path.join(path, "a", "b", "two.py"), "22", make_directories=True)
+    write_file(os.path.join(path, "c", "Makefile"), "333", make_directories=True)
+
+    stats = tree_stats(path, workers=2)
+    assert repr(stats) == "<TreeStats %s files=4 size=11>" % path
+    assert stats.directories == 3
+    assert stats.extensions == {
+        '': {'files': 1, 'size': 3},
+        '.py': {'files': 2, 'size': 3},
+        '.txt': {'files': 1, 'size': 5},
+    }
+    assert stats.subdirectories == {
+        'a': {'files': 2, 'size': 3},
+        'c': {'files': 1, 'size': 3},
+    }
+
+    cache_path = os.path.join("tests", "tmp-tree.json")
+    stats = tree_stats(path, cache=cache_path)
+    assert stats.size == 11
+
+    # Unchanged directories are not scanned again.
+    with open(cache_path) as f:
+        cached = json.load(f)
+
+    cached[os.path.abspath(os.path.join(path, "a", "b"))]['extensions']['.py'] = [1, 100]
+    write_file(cache_path, json.dumps(cached))
+
+    write_file(os.path.join(path, "c", "new.txt"), "4444")
+    stats = tree_stats(path, cache=cache_path)
+    assert stats.files == 5
+    assert stats.size == 113
+    assert stats.subdirectories['c'] == {'files': 2, 'size': 7}
+
+    write_file(cache_path, "invalid")
+    assert tree_stats(path, cache=cache_path).size == 15
+
+    with pytest.raises(ValueError):
+        tree_stats(cache_path)
+
+    os.remove(cache_path)
+    shutil.rmtree(path)
+
 
 def test_write_file():
     """Check that files are written."""
@@ -207,3 +638,51 @@ class TestFile():
     def test_repr(self):
         f = File("path/to/config.ini")
         assert "<File config.ini>" == repr(f)
+
+
+def test_write_files():
+    path = os.path.join("tests", "tmp-write")
+    files = {
+        os.path.join(path, "index.html"): "<h1>Home</h1>",
+        os.path.join(path, "about", "index.html"): "<h1>About</h1>",
+        os.path.join(path, "data.txt.gz"): "compressed",
+    }
+
+    results = write_files(files, workers=2)
+    assert results == {file_path: (WRITE.WRITTEN, None) for file_path in files}
+    assert read_file(os.path.join(path, "about", "index.html")) == "<h1>About</h1>"
+    assert get_compression(os.path.join(path, "data.txt.gz")) == COMPRESSION.GZIP
+    assert read_file(os.path.join(path, "data.txt.gz")) == "compressed"
+    assert sorted(os.listdir(path)) == ["about", "data.txt.gz", "index.html"]
+
+    # New files have the same permissions as any other new file.
+    plain_path = os.path.join(path, "plain.txt")
+    with open(plain_path, "w") as f:
+        f.write("plain")
+
+    expected_mode = os.stat(plain_path).st_mode & 0o777
+    assert os.stat(os.path.join(path, "index.html")).st_mode & 0o777 == expected_mode
+    os.remove(plain_path)
+
+    index_path = os.path.join(path, "index.html")
+    os.chmod(index_path, 0o640)
+
+    files[index_path] = "<h1>New</h1>"
+    results = write_files(files, skip_unchanged=True)
+    assert results[index_path] == (WRITE.WRITTEN, None)
+    assert results[os.path.join(path, "about", "index.html")] == (WRITE.UNCHANGED, None)
+    assert results[os.path.join(path, "data.txt.gz")] == (WRITE.UNCHANGED, None)
+    assert read_file(index_path) == "<h1>New</h1>"
+    assert oct(os.stat(index_path).st_mode & 0o777) == oct(0o640)
+
+    # The content is compared when the size is the same.
+    results = write_files([(index_path, "<h1>Old</h1>")], atomic=False, skip_unchanged=True)
+    assert results[index_path] == (WRITE.WRITTEN, None)
+    assert read_file(index_path) == "<h1>Old</h1>"
+
+    results = write_files({os.path.join(path, "nonexistent", "a.txt"): "a"}, make_directories=False)
+    status, error = results[os.path.join(path, "nonexistent", "a.txt")]
+    assert status == WRITE.FAILED
+    assert isinstance(error, str)
+
+    shutil.rmtree(path)
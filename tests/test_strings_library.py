@@ -1,6 +1,7 @@
 import os
 import shutil
 from commonkit.strings.library import *
+from commonkit.strings.library import _get_jinja_template
 
 # This was once used by the sites module, but was replaced by a template file. We can still use it for testing, though.
 EXAMPLE_TEMPLATE = """# {{ title|default("Example Template") }}
@@ -114,6 +115,11 @@ def test_parse_jinja_string():
     assert "Example Site" in output
     assert "This is an example template." in output
 
+    # The compiled template is reused.
+    hits = _get_jinja_template.cache_info().hits
+    parse_jinja_string(EXAMPLE_TEMPLATE, context)
+    assert _get_jinja_template.cache_info().hits == hits + 1
+
 
 def test_remove_non_ascii():
     string = "å fine méss"
@@ -129,6 +135,16 @@ def test_slug():
     string = "It's a Bad Mess: A Tale of Woe"
     # print(slug(string))
     assert slug(string) == "its-a-bad-mess-a-tale-of-woe"
+    assert slug(string, separator="_") == "its_a_bad_mess_a_tale_of_woe"
+
+    assert slug("Zip/Postal Code") == "zippostal-code"
+    assert slug("Éclair Café") == "eclair-cafe"
+    assert slug(17) == "17"
+
+
+def test_slug_many():
+    assert slug_many(["First Name", "E-Mail Address"], separator="_") == ["first_name", "e-mail_address"]
+    assert slug_many(iter(["Éclair"])) == ["eclair"]
 
 
 def test_strip_html_tags():
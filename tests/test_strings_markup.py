@@ -0,0 +1,39 @@
+import io
+from commonkit.strings.markup import *
+
+HTML = (
+    "<html><head><style>p {color: red}</style><script>if (a < b) { x = '</p>'; }</script></head>"
+    "<body><p>One &amp; two &lt;3</p><script/>Three<br/>caf&eacute;</body></html>"
+)
+
+# Tests
+
+
+def test_iter_html_text():
+    assert "".join(iter_html_text(HTML)) == "One & two <3Threecafé"
+
+    # Tags and entities may be split across chunks.
+    for chunk_size in (1, 3, 7, 64):
+        assert "".join(iter_html_text(io.StringIO(HTML), chunk_size=chunk_size)) == "One & two <3Threecafé"
+
+    assert list(iter_html_text(["<p>a", "b</p><p>c", "</p>"])) == ["a", "bc"]
+    assert "".join(iter_html_text(HTML, skip_tags=["style"])) == "if (a < b) { x = '</p>'; }One & two <3Threecafé"
+
+
+def test_iter_html_text_bytes():
+    html = "<p>Ünïcödé &amp; more</p>" * 3
+    f = io.BytesIO(html.encode("utf-8"))
+
+    # Multi-byte characters may be split across chunks.
+    assert "".join(iter_html_text(f, chunk_size=3)) == "Ünïcödé & more" * 3
+    assert "".join(iter_html_text([html.encode("latin-1")], encoding="latin-1")) == "Ünïcödé & more" * 3
+
+
+def test_strip_html_many():
+    documents = [
+        "<p>One &amp; two.</p>",
+        "<p>Three.</p><script>four()",
+        "<p>Five.</p>",
+        "",
+    ]
+    assert strip_html_many(documents) == ["One & two.", "Three.", "Five.", ""]
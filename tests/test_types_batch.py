@@ -0,0 +1,85 @@
+from decimal import Decimal
+import pytest
+from commonkit.types.batch import *
+from commonkit.types.library import is_bool, is_decimal, is_email, is_float, is_integer
+
+VALUES = [
+    "17",
+    " 17 ",
+    "1_000",
+    "17.5",
+    "1e3",
+    "inf",
+    "abc",
+    "yes",
+    "No",
+    "bob@example.com",
+    "",
+    None,
+    True,
+    False,
+    0,
+    17,
+    17.5,
+    Decimal("17.5"),
+    b"17",
+    [],
+]
+
+# Tests
+
+
+def test_is_bool_many():
+    assert is_bool_many(VALUES) == [is_bool(value) for value in VALUES]
+    assert is_bool_many(VALUES, test_values=(True, False)) == [is_bool(value, test_values=(True, False))
+                                                                for value in VALUES]
+    assert is_bool_many(["yes", "maybe", "no"], indexes=True) == [0, 2]
+
+
+def test_is_decimal_many():
+    assert is_decimal_many(VALUES) == [is_decimal(value) for value in VALUES]
+
+
+def test_is_email_many():
+    assert is_email_many(VALUES) == [is_email(value) for value in VALUES]
+    assert is_email_many(VALUES, strict=True) == [is_email(value, strict=True) for value in VALUES]
+    assert is_email_many(iter(VALUES), indexes=True) == [9]
+
+
+def test_is_float_many():
+    assert is_float_many(VALUES) == [is_float(value) for value in VALUES]
+
+
+def test_is_integer_many():
+    assert is_integer_many(VALUES) == [is_integer(value) for value in VALUES]
+    assert is_integer_many(VALUES, cast=True) == [is_integer(value, cast=True) for value in VALUES]
+    assert is_integer_many(["17", "17.5", "abc", 17], cast=True, indexes=True) == [0, 3]
+    assert is_integer_many(list()) == list()
+
+
+def test_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+
+    integers = numpy.array([0, 1, 2, 17])
+    assert is_integer_many(integers).tolist() == [True] * 4
+    assert is_float_many(integers).tolist() == [False] * 4
+    assert is_bool_many(integers, indexes=True).tolist() == [0, 1]
+    assert is_decimal_many(integers).tolist() == [True] * 4
+    assert is_email_many(integers).tolist() == [False] * 4
+
+    floats = numpy.array([0.0, 1.5])
+    assert is_float_many(floats, indexes=True).tolist() == [0, 1]
+    assert is_integer_many(floats).tolist() == [False, False]
+
+    booleans = numpy.array([True, False])
+    assert is_integer_many(booleans).tolist() == [False, False]
+    assert is_bool_many(booleans).tolist() == [True, True]
+    assert is_decimal_many(booleans).tolist() == [False, False]
+
+    strings = numpy.array(["17", "17.5", "abc", "bob@example.com"])
+    assert is_integer_many(strings, cast=True).tolist() == [True, False, False, False]
+    assert is_float_many(strings).tolist() == [False, True, False, False]
+    assert is_email_many(strings, indexes=True).tolist() == [3]
+
+    objects = numpy.array(VALUES, dtype=object)
+    assert is_integer_many(objects, cast=True).tolist() == [is_integer(value, cast=True) for value in VALUES]
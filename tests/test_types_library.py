@@ -142,6 +142,33 @@ def test_smart_cast():
     value = "17.5"
     assert isinstance(smart_cast(value), float)
 
+    # Less common numbers are identified by int() and float().
+    assert smart_cast(" 17 ") == 17
+    assert smart_cast("1_000") == 1000
+    assert smart_cast("1e3") == 1000.0
+    assert smart_cast("-inf") == float("-inf")
+    assert smart_cast("Infinity") == float("inf")
+    assert smart_cast("\u0661\u0662") == 12
+
+    assert smart_cast("no") is False
+    assert smart_cast("yEs") == "yEs"
+    assert smart_cast("1.5.5") == "1.5.5"
+    assert smart_cast("") == ""
+
+    # Other types are unchanged.
+    assert smart_cast(True) is True
+    assert smart_cast(17.5) == 17.5
+    assert smart_cast(None) is None
+
+
+def test_smart_cast_many():
+    """Check that a number of values may be cast at once."""
+    values = ["123", "yes", "why?", "17.5", None, "123"]
+    expected = [123, True, "why?", 17.5, None, 123]
+    assert smart_cast_many(values) == expected
+    assert smart_cast_many(values, cache_size=2) == expected
+    assert smart_cast_many(iter(values), cache_size=100) == expected
+
 
 def test_to_bool():
     """Check that boolean conversion works as expected."""